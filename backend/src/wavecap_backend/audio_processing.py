@@ -20,8 +20,80 @@ class AudioFrontEndConfig:
     agc_max_gain: float = 12.0
 
 
+_RECURSION_BLOCK_SIZE = 64
+
+
+def _first_order_recursion(
+    drive: np.ndarray, pole: float, initial: float
+) -> np.ndarray:
+    """Solve ``y[n] = pole * y[n - 1] + drive[n]`` without a per-sample loop.
+
+    The signal is split into fixed-size blocks. Each block's zero-state
+    response is a single matrix product against a triangular table of pole
+    powers; the block-to-block carry is itself a first-order recursion with
+    pole ``pole ** block`` and is solved recursively, so the Python-level work
+    is logarithmic in the signal length.
+    """
+
+    length = drive.size
+    if length <= 1:
+        return drive + pole * initial
+    block = _RECURSION_BLOCK_SIZE
+
+    rows = -(-length // block)
+    padded = np.zeros(rows * block, dtype=np.float64)
+    padded[:length] = drive
+    blocks = padded.reshape(rows, block)
+
+    exponents = np.arange(block)
+    lags = exponents[None, :] - exponents[:, None]
+    # Clamp negative lags before exponentiating; they are masked out anyway.
+    response = np.where(lags >= 0, pole ** np.maximum(lags, 0), 0.0)
+    local = blocks @ response
+
+    carry_pole = pole**block
+    carries = _first_order_recursion(local[:, -1], carry_pole, initial)
+    previous = np.empty(rows, dtype=np.float64)
+    previous[0] = initial
+    previous[1:] = carries[:-1]
+    decay = pole ** (exponents + 1)
+    output = local + previous[:, None] * decay[None, :]
+    return output.reshape(-1)[:length]
+
+
+@dataclass
+class _FilterSection:
+    """First-order IIR section ``y[n] = pole*y[n-1] + b0*x[n] + b1*x[n-1]``."""
+
+    pole: float
+    b0: float
+    b1: float = 0.0
+    prev_input: float = 0.0
+    prev_output: float = 0.0
+
+    def reset(self) -> None:
+        self.prev_input = 0.0
+        self.prev_output = 0.0
+
+    def apply(self, samples: np.ndarray) -> np.ndarray:
+        values = samples.astype(np.float64)
+        drive = self.b0 * values
+        if self.b1 != 0.0:
+            drive[0] += self.b1 * self.prev_input
+            drive[1:] += self.b1 * values[:-1]
+        output = _first_order_recursion(drive, self.pole, self.prev_output)
+        self.prev_input = float(values[-1])
+        self.prev_output = float(output[-1])
+        return output.astype(np.float32)
+
+
 class AudioFrontEndProcessor:
-    """Applies lightweight filters that improve speech intelligibility."""
+    """Applies lightweight filters that improve speech intelligibility.
+
+    The high-pass, de-emphasis and low-pass stages run as one cascade of
+    first-order sections. Each section carries its state across calls so
+    consecutive buffers are filtered as a continuous signal.
+    """
 
     def __init__(self, config: AudioFrontEndConfig) -> None:
         self._config = config
@@ -51,10 +123,16 @@ class AudioFrontEndProcessor:
         else:
             self._de_alpha = dt / (float(time_constant) + dt)
 
-        self._hp_prev_input = 0.0
-        self._hp_prev_output = 0.0
-        self._de_prev_output = 0.0
-        self._lp_prev_output = 0.0
+        self._sections: list[_FilterSection] = []
+        if self._hp_alpha is not None:
+            alpha = self._hp_alpha
+            self._sections.append(_FilterSection(pole=alpha, b0=alpha, b1=-alpha))
+        if self._de_alpha is not None:
+            alpha = self._de_alpha
+            self._sections.append(_FilterSection(pole=1.0 - alpha, b0=alpha))
+        if self._lp_alpha is not None:
+            alpha = self._lp_alpha
+            self._sections.append(_FilterSection(pole=1.0 - alpha, b0=alpha))
 
     def reset(self) -> None:
         """Reset filter state to initial values.
@@ -62,68 +140,39 @@ class AudioFrontEndProcessor:
         Call this when reconnecting a stream to avoid filter transients
         from stale state.
         """
-        self._hp_prev_input = 0.0
-        self._hp_prev_output = 0.0
-        self._de_prev_output = 0.0
-        self._lp_prev_output = 0.0
+        for section in self._sections:
+            section.reset()
 
     def process(
         self, samples: np.ndarray, *, target_rms: Optional[float] = None
     ) -> np.ndarray:
         """Filter and normalise audio samples for Whisper."""
 
+        processed = self.filter(samples)
+        if processed.size == 0:
+            return processed
+        return self.apply_agc(processed, target_rms)
+
+    def filter(self, samples: np.ndarray) -> np.ndarray:
+        """Run the stateful filter cascade without gain normalisation.
+
+        Successive calls continue from the previous call's state, so audio can
+        be conditioned incrementally as it arrives.
+        """
+
         processed = np.asarray(samples, dtype=np.float32).reshape(-1)
         if processed.size == 0:
             return processed
 
-        if self._hp_alpha is not None:
-            processed = self._apply_highpass(processed)
-        if self._de_alpha is not None:
-            processed = self._apply_deemphasis(processed)
-        if self._lp_alpha is not None:
-            processed = self._apply_lowpass(processed)
-
-        return self._apply_agc(processed, target_rms)
-
-    def _apply_highpass(self, samples: np.ndarray) -> np.ndarray:
-        alpha = self._hp_alpha
-        assert alpha is not None
-        prev_out = float(self._hp_prev_output)
-        prev_in = float(self._hp_prev_input)
-        output = np.empty_like(samples)
-        for index, value in enumerate(samples):
-            prev_out = alpha * (prev_out + float(value) - prev_in)
-            output[index] = prev_out
-            prev_in = float(value)
-        self._hp_prev_output = float(prev_out)
-        self._hp_prev_input = float(prev_in)
-        return output
-
-    def _apply_deemphasis(self, samples: np.ndarray) -> np.ndarray:
-        alpha = self._de_alpha
-        assert alpha is not None
-        prev_out = float(self._de_prev_output)
-        output = np.empty_like(samples)
-        for index, value in enumerate(samples):
-            prev_out = prev_out + alpha * (float(value) - prev_out)
-            output[index] = prev_out
-        self._de_prev_output = float(prev_out)
-        return output
-
-    def _apply_lowpass(self, samples: np.ndarray) -> np.ndarray:
-        alpha = self._lp_alpha
-        assert alpha is not None
-        prev_out = float(self._lp_prev_output)
-        output = np.empty_like(samples)
-        for index, value in enumerate(samples):
-            prev_out = prev_out + alpha * (float(value) - prev_out)
-            output[index] = prev_out
-        self._lp_prev_output = float(prev_out)
-        return output
-
-    def _apply_agc(
-        self, samples: np.ndarray, target_rms: Optional[float]
+        for section in self._sections:
+            processed = section.apply(processed)
+        return processed
+
+    def apply_agc(
+        self, samples: np.ndarray, target_rms: Optional[float] = None
     ) -> np.ndarray:
+        """Boost quiet audio towards ``target_rms`` (or the configured target)."""
+
         target = (
             float(target_rms)
             if target_rms is not None and target_rms > 0.0
@@ -3,20 +3,47 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import binascii
 import json
 import logging
+import re
+import time
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import AsyncIterator, List, Optional, Sequence
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence
 
-from sqlalchemy import Boolean, Column, DateTime, Float, Index, String, Text, func, or_
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    bindparam,
+    column,
+    event,
+    func,
+    literal,
+    literal_column,
+    or_,
+    table,
+    tuple_,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import Field, SQLModel, delete, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .datetime_utils import ensure_utc, utcnow
 from .models import (
+    DatabaseConfig,
     PagerIncidentDetails,
     Stream,
     StreamSource,
@@ -25,6 +52,13 @@ from .models import (
     TranscriptionResult,
     TranscriptionReviewStatus,
     TranscriptionSegment,
+    TranscriptionView,
+)
+from .transcription_codec import (
+    decode_segments,
+    decode_waveform,
+    encode_segments,
+    encode_waveform,
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -33,6 +67,132 @@ LOGGER = logging.getLogger(__name__)
 DB_RETRY_MAX_ATTEMPTS = 3
 DB_RETRY_BASE_DELAY = 0.1  # seconds
 
+# Rows per INSERT statement, keeping bound parameters well under SQLite's limit.
+BULK_INSERT_ROWS = 200
+
+# Rows re-encoded per transaction when migrating legacy JSON columns.
+LEGACY_MIGRATION_BATCH = 500
+
+# Expired recordings returned per retention query.
+RECORDING_EXPIRY_BATCH = 1000
+
+
+# Full-text index over transcription text, kept in sync with triggers.
+SEARCH_TABLE = "transcriptions_fts"
+_SEARCH_SCHEMA = (
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        text, correctedText,
+        content='transcriptions', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS transcriptions_fts_insert
+        AFTER INSERT ON transcriptions BEGIN
+            INSERT INTO {SEARCH_TABLE}(rowid, text, correctedText)
+            VALUES (new.rowid, new.text, new.correctedText);
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS transcriptions_fts_delete
+        AFTER DELETE ON transcriptions BEGIN
+            INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, text, correctedText)
+            VALUES ('delete', old.rowid, old.text, old.correctedText);
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS transcriptions_fts_update
+        AFTER UPDATE OF text, correctedText ON transcriptions BEGIN
+            INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, text, correctedText)
+            VALUES ('delete', old.rowid, old.text, old.correctedText);
+            INSERT INTO {SEARCH_TABLE}(rowid, text, correctedText)
+            VALUES (new.rowid, new.text, new.correctedText);
+        END""",
+)
+_SEARCH_TERM_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+_search_index = table(SEARCH_TABLE, column("rowid"), column("rank"))
+
+
+def build_search_query(search: str) -> Optional[str]:
+    """Translate user search input into an FTS5 MATCH expression.
+
+    Quoted text matches as an exact phrase. Bare words match any word that
+    starts with them, so ``horse`` finds "horseback". All terms must match.
+    """
+
+    terms: List[str] = []
+    for match in _SEARCH_TERM_PATTERN.finditer(search):
+        phrase, word = match.groups()
+        if phrase is not None:
+            phrase = phrase.strip()
+            if phrase:
+                terms.append('"' + phrase.replace('"', '""') + '"')
+            continue
+        word = word.replace('"', "").rstrip("*")
+        if word:
+            terms.append(f'"{word}"*')
+    return " ".join(terms) or None
+
+
+@dataclass(frozen=True)
+class TranscriptionCursor:
+    """Opaque keyset position in the ``(timestamp, id)`` transcription order.
+
+    ``direction`` is ``"before"`` to continue toward older rows or ``"after"``
+    to continue toward newer ones.
+    """
+
+    timestamp: datetime
+    id: str
+    direction: str = "before"
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            [self.direction, ensure_utc(self.timestamp).isoformat(), self.id],
+            separators=(",", ":"),
+        )
+        encoded = base64.urlsafe_b64encode(payload.encode("utf-8"))
+        return encoded.decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "TranscriptionCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            direction, timestamp, row_id = json.loads(
+                base64.urlsafe_b64decode(padded.encode("ascii"))
+            )
+            parsed = cls(
+                timestamp=ensure_utc(datetime.fromisoformat(timestamp)),
+                id=str(row_id),
+                direction=direction,
+            )
+        except (binascii.Error, TypeError, ValueError, UnicodeError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        if parsed.direction not in {"before", "after"}:
+            raise ValueError("Invalid cursor")
+        return parsed
+
+
+class _ConnectionStats:
+    """Counters for one connection pool, reported by ``StreamDatabase.metrics``."""
+
+    def __init__(self) -> None:
+        self.sessions = 0
+        self.connection_wait_total = 0.0
+        self.connection_wait_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.sessions += 1
+        self.connection_wait_total += seconds
+        self.connection_wait_max = max(self.connection_wait_max, seconds)
+
+    def snapshot(self, engine: AsyncEngine, pool_size: int) -> dict:
+        pool = engine.sync_engine.pool
+        checked_out = getattr(pool, "checkedout", None)
+        return {
+            "poolSize": pool_size,
+            "checkedOut": checked_out() if callable(checked_out) else None,
+            "sessions": self.sessions,
+            "averageConnectionWaitSeconds": (
+                self.connection_wait_total / self.sessions if self.sessions else 0.0
+            ),
+            "maxConnectionWaitSeconds": self.connection_wait_max,
+        }
+
 
 class StreamRecord(SQLModel, table=True):
     __tablename__ = "streams"
@@ -78,11 +238,33 @@ class StreamRecord(SQLModel, table=True):
     )
 
 
+class RecordingRecord(SQLModel, table=True):
+    """Index of recording files, so retention never has to scan the directory."""
+
+    __tablename__ = "recordings"
+    __table_args__ = (
+        Index("ix_recordings_stream_created", "streamId", "createdAt"),
+        Index("ix_recordings_created", "createdAt"),
+        {"extend_existing": True},
+    )
+
+    # File name within the recordings directory.
+    name: str = Field(primary_key=True)
+    streamId: str = Field(sa_column=Column("streamId", String, nullable=False))
+    createdAt: datetime = Field(
+        sa_column=Column("createdAt", DateTime(timezone=True), nullable=False)
+    )
+    sizeBytes: int = Field(
+        default=0, sa_column=Column("sizeBytes", Integer, nullable=False, default=0)
+    )
+
+
 class TranscriptionRecord(SQLModel, table=True):
     __tablename__ = "transcriptions"
     __table_args__ = (
-        Index("ix_transcriptions_stream_timestamp", "streamId", "timestamp"),
-        Index("ix_transcriptions_timestamp", "timestamp"),
+        # Keyset pagination seeks on (timestamp, id), per stream or merged.
+        Index("ix_transcriptions_stream_timestamp_id", "streamId", "timestamp", "id"),
+        Index("ix_transcriptions_timestamp_id", "timestamp", "id"),
         {"extend_existing": True},
     )
 
@@ -98,9 +280,13 @@ class TranscriptionRecord(SQLModel, table=True):
     duration: Optional[float] = Field(
         default=None, sa_column=Column("duration", Float, nullable=True)
     )
+    # Legacy JSON encoding; new rows use segmentsData.
     segments: Optional[str] = Field(
         default=None, sa_column=Column("segments", Text, nullable=True)
     )
+    segmentsData: Optional[bytes] = Field(
+        default=None, sa_column=Column("segmentsData", LargeBinary, nullable=True)
+    )
     recordingUrl: Optional[str] = Field(
         default=None, sa_column=Column("recordingUrl", String, nullable=True)
     )
@@ -111,10 +297,14 @@ class TranscriptionRecord(SQLModel, table=True):
     speechEndOffset: Optional[float] = Field(
         default=None, sa_column=Column("speechEndOffset", Float, nullable=True)
     )
-    # Precomputed amplitude waveform for UI visualization (JSON array of 0.0-1.0 floats)
+    # Precomputed amplitude waveform for UI visualization. The legacy column
+    # holds a JSON array of 0.0-1.0 floats; new rows use waveformData.
     waveform: Optional[str] = Field(
         default=None, sa_column=Column("waveform", Text, nullable=True)
     )
+    waveformData: Optional[bytes] = Field(
+        default=None, sa_column=Column("waveformData", LargeBinary, nullable=True)
+    )
     correctedText: Optional[str] = Field(
         default=None, sa_column=Column("correctedText", Text, nullable=True)
     )
@@ -149,20 +339,124 @@ class TranscriptionRecord(SQLModel, table=True):
     )
 
 
+# Columns read for TranscriptionView.SUMMARY: everything the dashboard renders,
+# leaving out the Whisper segments and pager incident, which are the bulkiest
+# values to decode.
+_SUMMARY_COLUMNS = (
+    TranscriptionRecord.id,
+    TranscriptionRecord.streamId,
+    TranscriptionRecord.text,
+    TranscriptionRecord.timestamp,
+    TranscriptionRecord.confidence,
+    TranscriptionRecord.duration,
+    TranscriptionRecord.recordingUrl,
+    TranscriptionRecord.speechStartOffset,
+    TranscriptionRecord.speechEndOffset,
+    TranscriptionRecord.waveform,
+    TranscriptionRecord.waveformData,
+    TranscriptionRecord.correctedText,
+    TranscriptionRecord.reviewStatus,
+    TranscriptionRecord.reviewedAt,
+    TranscriptionRecord.reviewedBy,
+    TranscriptionRecord.eventType,
+    TranscriptionRecord.eventMetadata,
+)
+
+
 class StreamDatabase:
-    """Persistence layer backed by SQLModel ORM."""
+    """Persistence layer backed by SQLModel ORM.
+
+    Transcriptions and stream activity timestamps are written behind: they
+    are buffered in memory and committed together, one transaction per flush,
+    by a background task. An append is durable once the flush that contains
+    it has committed, which happens within ``writeFlushIntervalSeconds``, as
+    soon as ``writeBatchSize`` rows are waiting, on :meth:`flush`, and on
+    :meth:`close`. Other writes do not flush the buffer; ones that touch
+    buffered rows update or discard them in place. Reads never wait for a
+    flush: recent-transcription and history queries merge buffered rows into
+    their results, while text search and exports flush first. Appends block
+    while ``maxPendingWrites`` rows are waiting, so a stalled database
+    applies backpressure instead of growing the buffer. Rows still buffered
+    when the process dies are lost.
 
-    def __init__(self, db_path: Path):
+    Recording index entries are committed as soon as they are added, so a
+    file on disk is never left out of the index by a crash.
+    """
+
+    def __init__(self, db_path: Path, *, config: Optional[DatabaseConfig] = None):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.config = config or DatabaseConfig()
+        # SQLite allows one writer at a time, so writes queue for a single
+        # connection here instead of contending for the file lock.
         self._engine: AsyncEngine = create_async_engine(
-            f"sqlite+aiosqlite:///{db_path}", connect_args={"check_same_thread": False}
+            f"sqlite+aiosqlite:///{db_path}",
+            connect_args={"check_same_thread": False},
+            pool_size=1,
+            max_overflow=0,
+        )
+        # API reads use their own connections; under WAL they read a snapshot
+        # and never wait on the writer.
+        self._read_engine: AsyncEngine = create_async_engine(
+            f"sqlite+aiosqlite:///{db_path}",
+            connect_args={"check_same_thread": False},
+            pool_size=self.config.readPoolSize,
+            max_overflow=0,
         )
+        event.listen(self._engine.sync_engine, "connect", self._configure_writer)
+        event.listen(self._read_engine.sync_engine, "connect", self._configure_reader)
         self._session_factory = async_sessionmaker(
             self._engine, class_=AsyncSession, expire_on_commit=False
         )
+        self._read_session_factory = async_sessionmaker(
+            self._read_engine, class_=AsyncSession, expire_on_commit=False
+        )
+        self._journal_mode: Optional[str] = None
+        self._search_enabled = False
+        self._write_stats = _ConnectionStats()
+        self._read_stats = _ConnectionStats()
+        self._commits = 0
+        self._commit_seconds = 0.0
+        self._lock_retries = 0
+        self._lock_wait_seconds = 0.0
         self._initialized = False
         self._init_lock: Optional[asyncio.Lock] = None
+        # Write-behind buffers, keyed so repeated writes collapse to the latest.
+        self._pending_transcriptions: Dict[str, Dict[str, Any]] = {}
+        self._pending_activity: Dict[str, datetime] = {}
+        # The batch a flush is committing; still visible to reads until it lands.
+        self._inflight_transcriptions: Dict[str, Dict[str, Any]] = {}
+        self._inflight_activity: Dict[str, datetime] = {}
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._pending_changed: Optional[asyncio.Condition] = None
+        self._writer_task: Optional[asyncio.Task[None]] = None
+        self._closing = False
+        self._migration_task: Optional[asyncio.Task[int]] = None
+        self._legacy_rows_migrated = 0
+        self._recording_index_created = False
+
+    def _apply_pragmas(self, dbapi_connection: Any, *, read_only: bool) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            if not read_only:
+                cursor.execute("PRAGMA journal_mode=WAL")
+                row = cursor.fetchone()
+                self._journal_mode = str(row[0]).lower() if row else None
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={int(self.config.busyTimeoutMs)}")
+            cursor.execute(f"PRAGMA cache_size=-{int(self.config.cacheSizeKib)}")
+            cursor.execute(f"PRAGMA mmap_size={int(self.config.mmapSizeBytes)}")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            if read_only:
+                cursor.execute("PRAGMA query_only=ON")
+        finally:
+            cursor.close()
+
+    def _configure_writer(self, dbapi_connection: Any, _record: Any) -> None:
+        self._apply_pragmas(dbapi_connection, read_only=False)
+
+    def _configure_reader(self, dbapi_connection: Any, _record: Any) -> None:
+        self._apply_pragmas(dbapi_connection, read_only=True)
 
     async def initialize(self) -> None:
         """Create tables and ensure schema migrations are applied."""
@@ -175,6 +469,11 @@ class StreamDatabase:
             if self._initialized:
                 return
             async with self._engine.begin() as connection:
+                existing = await connection.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master"
+                    " WHERE type = 'table' AND name = 'recordings'"
+                )
+                self._recording_index_created = existing.first() is None
                 await connection.run_sync(SQLModel.metadata.create_all)
                 # Ensure optional columns exist for older installations.
                 for statement in (
@@ -190,9 +489,14 @@ class StreamDatabase:
                     "ALTER TABLE transcriptions ADD COLUMN speechStartOffset REAL",
                     "ALTER TABLE transcriptions ADD COLUMN speechEndOffset REAL",
                     "ALTER TABLE transcriptions ADD COLUMN waveform TEXT",
+                    "ALTER TABLE transcriptions ADD COLUMN waveformData BLOB",
+                    "ALTER TABLE transcriptions ADD COLUMN segmentsData BLOB",
                     "CREATE INDEX IF NOT EXISTS ix_streams_last_activity ON streams (lastActivityAt)",
-                    "CREATE INDEX IF NOT EXISTS ix_transcriptions_stream_timestamp ON transcriptions (streamId, timestamp)",
-                    "CREATE INDEX IF NOT EXISTS ix_transcriptions_timestamp ON transcriptions (timestamp)",
+                    "CREATE INDEX IF NOT EXISTS ix_transcriptions_stream_timestamp_id ON transcriptions (streamId, timestamp, id)",
+                    "CREATE INDEX IF NOT EXISTS ix_transcriptions_timestamp_id ON transcriptions (timestamp, id)",
+                    # Superseded by the (timestamp, id) indexes above.
+                    "DROP INDEX IF EXISTS ix_transcriptions_stream_timestamp",
+                    "DROP INDEX IF EXISTS ix_transcriptions_timestamp",
                 ):
                     try:
                         await connection.exec_driver_sql(statement)
@@ -203,13 +507,54 @@ class StreamDatabase:
                             and "already exists" not in message
                         ):
                             raise
+                self._search_enabled = await self._ensure_search_index(connection)
+                legacy = await connection.exec_driver_sql(
+                    "SELECT 1 FROM transcriptions"
+                    " WHERE waveform IS NOT NULL OR segments IS NOT NULL LIMIT 1"
+                )
+                has_legacy_rows = legacy.first() is not None
             self._initialized = True
+            if has_legacy_rows:
+                self._migration_task = asyncio.create_task(
+                    self.migrate_legacy_encodings(), name="stream-database-migration"
+                )
+
+    async def _ensure_search_index(self, connection: Any) -> bool:
+        """Create the FTS5 index and its triggers, backfilling existing rows."""
+
+        existing = await connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (SEARCH_TABLE,),
+        )
+        created = existing.first() is None
+        try:
+            for statement in _SEARCH_SCHEMA:
+                await connection.exec_driver_sql(statement)
+        except Exception as exc:  # pragma: no cover - SQLite built without FTS5
+            LOGGER.warning(
+                "Full-text search unavailable, falling back to LIKE: %s", exc
+            )
+            return False
+        if created:
+            LOGGER.info("Building transcription search index")
+            await connection.exec_driver_sql(
+                f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"
+            )
+        return True
 
     @asynccontextmanager
-    async def _session(self, *, commit: bool = True) -> AsyncIterator[AsyncSession]:
+    async def _session(
+        self, *, commit: bool = True, flush_pending: bool = False
+    ) -> AsyncIterator[AsyncSession]:
         await self.initialize()
+        if flush_pending:
+            # The caller reads or rewrites rows that may still be buffered.
+            await self.flush()
         async with self._session_factory() as session:
             try:
+                started = time.monotonic()
+                await session.connection()
+                self._write_stats.record_wait(time.monotonic() - started)
                 yield session
                 if commit:
                     await self._commit_with_retry(session)
@@ -223,18 +568,36 @@ class StreamDatabase:
                     )
                 raise
 
+    @asynccontextmanager
+    async def _read_session(self) -> AsyncIterator[AsyncSession]:
+        """Open a session on the read-only pool."""
+
+        await self.initialize()
+        async with self._read_session_factory() as session:
+            started = time.monotonic()
+            await session.connection()
+            self._read_stats.record_wait(time.monotonic() - started)
+            yield session
+
     async def _commit_with_retry(self, session: AsyncSession) -> None:
         """Commit with retry on database lock contention."""
         for attempt in range(DB_RETRY_MAX_ATTEMPTS):
+            started = time.monotonic()
             try:
                 await session.commit()
+                self._commits += 1
+                self._commit_seconds += time.monotonic() - started
                 return
             except Exception as exc:
                 error_message = str(exc).lower()
                 is_locked = "database is locked" in error_message
                 is_last_attempt = attempt >= DB_RETRY_MAX_ATTEMPTS - 1
+                if is_locked:
+                    self._lock_retries += 1
+                    self._lock_wait_seconds += time.monotonic() - started
                 if is_locked and not is_last_attempt:
                     delay = DB_RETRY_BASE_DELAY * (2**attempt)
+                    self._lock_wait_seconds += delay
                     LOGGER.warning(
                         "Database locked, retry %d/%d in %.2fs",
                         attempt + 1,
@@ -246,17 +609,406 @@ class StreamDatabase:
                     raise
 
     async def close(self) -> None:
-        await self._engine.dispose()
+        self._closing = True
+        migration = self._migration_task
+        if migration is not None:
+            self._migration_task = None
+            migration.cancel()
+            try:
+                await migration
+            except asyncio.CancelledError:
+                pass
+            except Exception:  # pragma: no cover - logged by the task itself
+                pass
+        task = self._writer_task
+        if task is not None:
+            self._writer_task = None
+            condition = self._pending_condition()
+            async with condition:
+                condition.notify_all()
+            try:
+                await task
+            except asyncio.CancelledError:  # pragma: no cover - shutdown race
+                pass
+        try:
+            await self.flush()
+        finally:
+            await self._read_engine.dispose()
+            await self._engine.dispose()
+
+    def metrics(self) -> dict:
+        """Return connection pool and lock contention statistics."""
+
+        return {
+            "journalMode": self._journal_mode,
+            "pendingWrites": self._pending_count(),
+            "commits": self._commits,
+            "averageCommitSeconds": (
+                self._commit_seconds / self._commits if self._commits else 0.0
+            ),
+            "legacyRowsMigrated": self._legacy_rows_migrated,
+            "lockRetries": self._lock_retries,
+            "lockWaitSeconds": self._lock_wait_seconds,
+            "writer": self._write_stats.snapshot(self._engine, 1),
+            "reader": self._read_stats.snapshot(
+                self._read_engine, self.config.readPoolSize
+            ),
+        }
+
+    # Write-behind buffer -------------------------------------------------
+
+    def _pending_condition(self) -> asyncio.Condition:
+        if self._pending_changed is None:
+            self._pending_changed = asyncio.Condition()
+        return self._pending_changed
+
+    def _pending_count(self) -> int:
+        return len(self._pending_transcriptions) + len(self._pending_activity)
+
+    def _buffered_transcriptions(self) -> Dict[str, Dict[str, Any]]:
+        """Uncommitted rows, with queued writes replacing the in-flight batch."""
+
+        if not self._inflight_transcriptions:
+            return self._pending_transcriptions
+        return {**self._inflight_transcriptions, **self._pending_transcriptions}
+
+    def _buffered_activity(self, stream_id: str) -> Optional[datetime]:
+        candidates = [
+            timestamp
+            for timestamp in (
+                self._inflight_activity.get(stream_id),
+                self._pending_activity.get(stream_id),
+            )
+            if timestamp is not None
+        ]
+        return max(candidates) if candidates else None
+
+    async def _enqueue_write(
+        self,
+        *,
+        transcription: Optional[Dict[str, Any]] = None,
+        activity: Optional[tuple[str, datetime]] = None,
+    ) -> None:
+        condition = self._pending_condition()
+        async with condition:
+            if transcription is not None:
+                await condition.wait_for(
+                    lambda: self._closing
+                    or transcription["id"] in self._pending_transcriptions
+                    or len(self._pending_transcriptions)
+                    < self.config.maxPendingWrites
+                )
+                self._pending_transcriptions[transcription["id"]] = transcription
+            if activity is not None:
+                stream_id, timestamp = activity
+                previous = self._pending_activity.get(stream_id)
+                if previous is None or timestamp > previous:
+                    self._pending_activity[stream_id] = timestamp
+            if len(self._pending_transcriptions) >= self.config.writeBatchSize:
+                condition.notify_all()
+        if self._closing or self.config.writeFlushIntervalSeconds <= 0:
+            await self.flush()
+        elif self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(
+                self._run_writer(), name="stream-database-writer"
+            )
+
+    async def _run_writer(self) -> None:
+        condition = self._pending_condition()
+        interval = self.config.writeFlushIntervalSeconds
+        while not self._closing:
+            async with condition:
+                try:
+                    await asyncio.wait_for(
+                        condition.wait_for(
+                            lambda: self._closing
+                            or len(self._pending_transcriptions)
+                            >= self.config.writeBatchSize
+                        ),
+                        timeout=interval,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            if self._closing:
+                return
+            try:
+                await self.flush()
+            except Exception:
+                LOGGER.exception(
+                    "Failed to flush %d buffered database writes; will retry",
+                    self._pending_count(),
+                )
+                await asyncio.sleep(interval)
+
+    async def flush(self) -> None:
+        """Commit every buffered write in a single transaction.
+
+        Until the commit lands the batch stays readable as in-flight rows. If
+        the commit fails the rows go back into the buffer, behind nothing
+        newer for the same key, and the error is raised to the caller.
+        """
+
+        if not self._pending_count():
+            return
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            transcriptions = self._pending_transcriptions
+            activity = self._pending_activity
+            if not transcriptions and not activity:
+                return
+            self._pending_transcriptions = {}
+            self._pending_activity = {}
+            self._inflight_transcriptions = transcriptions
+            self._inflight_activity = activity
+            try:
+                async with self._session() as session:
+                    rows = list(transcriptions.values())
+                    for start in range(0, len(rows), BULK_INSERT_ROWS):
+                        await session.exec(
+                            self._upsert(
+                                TranscriptionRecord.__table__,
+                                "id",
+                                rows[start : start + BULK_INSERT_ROWS],
+                            )
+                        )
+                    for stream_id, timestamp in activity.items():
+                        await session.exec(
+                            update(StreamRecord)
+                            .where(StreamRecord.id == stream_id)
+                            .values(lastActivityAt=timestamp)
+                        )
+            except Exception:
+                transcriptions.update(self._pending_transcriptions)
+                self._pending_transcriptions = transcriptions
+                for stream_id, timestamp in self._pending_activity.items():
+                    previous = activity.get(stream_id)
+                    if previous is None or timestamp > previous:
+                        activity[stream_id] = timestamp
+                self._pending_activity = activity
+                raise
+            finally:
+                self._inflight_transcriptions = {}
+                self._inflight_activity = {}
+                condition = self._pending_condition()
+                async with condition:
+                    condition.notify_all()
+
+    @staticmethod
+    def _upsert(table: Any, key: str, rows: List[Dict[str, Any]]) -> Any:
+        statement = sqlite_insert(table).values(rows)
+        return statement.on_conflict_do_update(
+            index_elements=[key],
+            set_={name: statement.excluded[name] for name in rows[0] if name != key},
+        )
+
+    # Legacy encodings ----------------------------------------------------
+
+    async def migrate_legacy_encodings(
+        self, batch_size: int = LEGACY_MIGRATION_BATCH
+    ) -> int:
+        """Re-encode rows still holding JSON waveforms or segments.
+
+        Runs in the background after :meth:`initialize` finds such rows, one
+        short transaction per batch so appends are never held up for long.
+        Returns the number of rows converted.
+        """
+
+        table = TranscriptionRecord.__table__
+        statement = (
+            table.update()
+            .where(table.c.id == bindparam("row_id"))
+            .values(
+                waveform=None,
+                segments=None,
+                waveformData=bindparam("waveform_data"),
+                segmentsData=bindparam("segments_data"),
+            )
+        )
+        migrated = 0
+        while True:
+            async with self._session() as session:
+                result = await session.exec(
+                    select(
+                        TranscriptionRecord.id,
+                        TranscriptionRecord.waveform,
+                        TranscriptionRecord.segments,
+                        TranscriptionRecord.waveformData,
+                        TranscriptionRecord.segmentsData,
+                    )
+                    .where(
+                        or_(
+                            TranscriptionRecord.waveform.is_not(None),
+                            TranscriptionRecord.segments.is_not(None),
+                        )
+                    )
+                    .limit(batch_size)
+                )
+                rows = result.all()
+                if not rows:
+                    break
+                params = [self._legacy_migration_params(*row) for row in rows]
+                await session.exec(statement, params=params)
+            migrated += len(rows)
+            self._legacy_rows_migrated += len(rows)
+            await asyncio.sleep(0)
+        if migrated:
+            LOGGER.info("Re-encoded %d transcriptions in binary format", migrated)
+        return migrated
+
+    @staticmethod
+    def _legacy_migration_params(
+        row_id: str,
+        waveform: Optional[str],
+        segments: Optional[str],
+        waveform_data: Optional[bytes],
+        segments_data: Optional[bytes],
+    ) -> Dict[str, Any]:
+        try:
+            if waveform_data is None and waveform:
+                waveform_data = encode_waveform(json.loads(waveform))
+            if segments_data is None and segments:
+                segments_data = encode_segments(json.loads(segments))
+        except (TypeError, ValueError):
+            LOGGER.warning(
+                "Dropping unreadable waveform or segments for transcription %s",
+                row_id,
+            )
+        return {
+            "row_id": row_id,
+            "waveform_data": waveform_data,
+            "segments_data": segments_data,
+        }
+
+    # Recording index ----------------------------------------------------
+
+    @property
+    def needs_recording_import(self) -> bool:
+        """True when the recording index was created empty on this start."""
+
+        return self._recording_index_created
+
+    async def add_recording(
+        self, name: str, stream_id: str, created_at: datetime, size_bytes: int
+    ) -> None:
+        """Index a newly written recording file, committing immediately."""
+
+        row = {
+            "name": name,
+            "streamId": stream_id,
+            "createdAt": ensure_utc(created_at),
+            "sizeBytes": int(size_bytes),
+        }
+        async with self._session() as session:
+            await session.exec(self._upsert(RecordingRecord.__table__, "name", [row]))
+
+    async def import_recordings(
+        self, entries: Sequence[tuple[str, str, datetime, int]]
+    ) -> None:
+        """Index existing ``(name, stream_id, created_at, size)`` files.
+
+        Entries already in the index are left as they are.
+        """
+
+        rows = [
+            {
+                "name": name,
+                "streamId": stream_id,
+                "createdAt": ensure_utc(created_at),
+                "sizeBytes": int(size_bytes),
+            }
+            for name, stream_id, created_at, size_bytes in entries
+        ]
+        async with self._session() as session:
+            for start in range(0, len(rows), BULK_INSERT_ROWS):
+                await session.exec(
+                    sqlite_insert(RecordingRecord.__table__)
+                    .values(rows[start : start + BULK_INSERT_ROWS])
+                    .on_conflict_do_nothing(index_elements=["name"])
+                )
+        self._recording_index_created = False
+
+    async def expired_recordings(
+        self,
+        cutoffs: Mapping[str, Optional[datetime]],
+        default_cutoff: Optional[datetime],
+        limit: int = RECORDING_EXPIRY_BATCH,
+    ) -> List[tuple[str, int]]:
+        """Return ``(name, size)`` for recordings created before their cutoff.
+
+        ``cutoffs`` maps stream IDs to their cutoff, or ``None`` to keep that
+        stream's recordings. Streams not listed use ``default_cutoff``. Each
+        lookup is a range scan on ``createdAt``, so the cost follows the
+        number of expired files rather than the size of the archive.
+        """
+
+        expired: List[tuple[str, int]] = []
+        async with self._read_session() as session:
+            for stream_id, cutoff in cutoffs.items():
+                if cutoff is None or len(expired) >= limit:
+                    continue
+                result = await session.exec(
+                    select(RecordingRecord.name, RecordingRecord.sizeBytes)
+                    .where(
+                        RecordingRecord.streamId == stream_id,
+                        RecordingRecord.createdAt < ensure_utc(cutoff),
+                    )
+                    .order_by(RecordingRecord.createdAt)
+                    .limit(limit - len(expired))
+                )
+                expired.extend(tuple(row) for row in result.all())
+            if default_cutoff is not None and len(expired) < limit:
+                result = await session.exec(
+                    select(RecordingRecord.name, RecordingRecord.sizeBytes)
+                    .where(
+                        RecordingRecord.createdAt < ensure_utc(default_cutoff),
+                        RecordingRecord.streamId.not_in(list(cutoffs)),
+                    )
+                    .order_by(RecordingRecord.createdAt)
+                    .limit(limit - len(expired))
+                )
+                expired.extend(tuple(row) for row in result.all())
+        return expired
+
+    async def stream_recordings(self, stream_id: str) -> List[str]:
+        """Return the file names of every indexed recording for *stream_id*."""
+
+        async with self._read_session() as session:
+            result = await session.exec(
+                select(RecordingRecord.name).where(
+                    RecordingRecord.streamId == stream_id
+                )
+            )
+            return list(result.all())
+
+    async def remove_recordings(self, names: Sequence[str]) -> None:
+        """Drop index entries for recordings that have been deleted."""
+
+        if not names:
+            return
+        names = list(names)
+        async with self._session() as session:
+            for start in range(0, len(names), BULK_INSERT_ROWS):
+                await session.exec(
+                    delete(RecordingRecord).where(
+                        RecordingRecord.name.in_(names[start : start + BULK_INSERT_ROWS])
+                    )
+                )
 
     # Stream operations -------------------------------------------------
 
     async def load_streams(self) -> List[Stream]:
-        async with self._session(commit=False) as session:
+        async with self._read_session() as session:
             result = await session.exec(
                 select(StreamRecord).order_by(StreamRecord.createdAt.asc())
             )
             records = result.all()
-            return [self._record_to_stream(record) for record in records]
+        streams = [self._record_to_stream(record) for record in records]
+        for stream in streams:
+            pending = self._buffered_activity(stream.id)
+            if pending is not None:
+                stream.lastActivityAt = pending
+        return streams
 
     async def save_stream(self, stream: Stream) -> None:
         """Persist stream runtime state to database.
@@ -286,14 +1038,30 @@ class StreamDatabase:
             session.add(record)
 
     async def update_stream_activity(self, stream_id: str, timestamp: datetime) -> None:
-        async with self._session() as session:
-            await session.exec(
-                update(StreamRecord)
-                .where(StreamRecord.id == stream_id)
-                .values(lastActivityAt=ensure_utc(timestamp))
-            )
+        """Buffer a last-activity update; only the newest per stream is written."""
+
+        await self._enqueue_write(activity=(stream_id, ensure_utc(timestamp)))
+
+    def _discard_pending(self, stream_id: Optional[str] = None) -> None:
+        """Drop buffered rows for *stream_id* (or every stream) before a delete."""
+
+        buffers = (self._pending_transcriptions, self._inflight_transcriptions)
+        if stream_id is None:
+            for buffer in buffers:
+                buffer.clear()
+            self._pending_activity.clear()
+            self._inflight_activity.clear()
+            return
+        for buffer in buffers:
+            for key in [
+                key for key, row in buffer.items() if row["streamId"] == stream_id
+            ]:
+                del buffer[key]
+        self._pending_activity.pop(stream_id, None)
+        self._inflight_activity.pop(stream_id, None)
 
     async def delete_stream(self, stream_id: str) -> None:
+        self._discard_pending(stream_id)
         async with self._session() as session:
             await session.exec(
                 delete(TranscriptionRecord).where(
@@ -307,73 +1075,73 @@ class StreamDatabase:
     async def clear_all(self) -> None:
         """Remove all persisted streams and transcriptions."""
 
+        self._discard_pending()
         async with self._session() as session:
             await session.exec(delete(TranscriptionRecord))
+            await session.exec(delete(RecordingRecord))
             await session.exec(delete(StreamRecord))
 
     # Transcription operations ------------------------------------------
 
     async def append_transcription(self, transcription: TranscriptionResult) -> None:
-        segments_json: Optional[str]
-        if transcription.segments:
-            if isinstance(transcription.segments[0], dict):
-                segments_json = json.dumps(transcription.segments)
-            else:
-                segments_json = json.dumps(
-                    [segment.model_dump() for segment in transcription.segments]
-                )
-        else:
-            segments_json = None
-        async with self._session() as session:
-            record = await session.get(TranscriptionRecord, transcription.id)
-            if record is None:
-                record = TranscriptionRecord(
-                    id=transcription.id, streamId=transcription.streamId
-                )
-            record.streamId = transcription.streamId
-            record.text = transcription.text
-            record.timestamp = transcription.timestamp
-            record.confidence = transcription.confidence
-            record.duration = transcription.duration
-            record.segments = segments_json
-            record.recordingUrl = transcription.recordingUrl
-            record.speechStartOffset = transcription.speechStartOffset
-            record.speechEndOffset = transcription.speechEndOffset
-            # Store waveform as JSON array
-            if transcription.waveform:
-                record.waveform = json.dumps(transcription.waveform)
-            else:
-                record.waveform = None
-            record.correctedText = transcription.correctedText
-            record.reviewStatus = transcription.reviewStatus
-            record.reviewedAt = transcription.reviewedAt
-            record.reviewedBy = transcription.reviewedBy
-            record.eventType = TranscriptionEventType(transcription.eventType)
-            if transcription.pagerIncident:
-                if hasattr(transcription.pagerIncident, "model_dump"):
-                    incident_json = json.dumps(
-                        transcription.pagerIncident.model_dump(
-                            by_alias=True, exclude_none=True
-                        )
+        """Buffer *transcription* for the next write-behind flush."""
+
+        await self._enqueue_write(
+            transcription=self._transcription_row(transcription)
+        )
+
+    def _transcription_row(
+        self, transcription: TranscriptionResult
+    ) -> Dict[str, Any]:
+        if transcription.pagerIncident:
+            if hasattr(transcription.pagerIncident, "model_dump"):
+                incident_json = json.dumps(
+                    transcription.pagerIncident.model_dump(
+                        by_alias=True, exclude_none=True
                     )
-                else:
-                    incident_json = json.dumps(transcription.pagerIncident)
+                )
             else:
-                incident_json = None
-            record.pagerIncident = incident_json
+                incident_json = json.dumps(transcription.pagerIncident)
+        else:
+            incident_json = None
+        return {
+            "id": transcription.id,
+            "streamId": transcription.streamId,
+            "text": transcription.text,
+            "timestamp": transcription.timestamp,
+            "confidence": transcription.confidence,
+            "duration": transcription.duration,
+            "segments": None,
+            "segmentsData": encode_segments(transcription.segments),
+            "recordingUrl": transcription.recordingUrl,
+            "speechStartOffset": transcription.speechStartOffset,
+            "speechEndOffset": transcription.speechEndOffset,
+            "waveform": None,
+            "waveformData": encode_waveform(transcription.waveform),
+            "correctedText": transcription.correctedText,
+            "reviewStatus": TranscriptionReviewStatus(transcription.reviewStatus).value,
+            "reviewedAt": transcription.reviewedAt,
+            "reviewedBy": transcription.reviewedBy,
+            "eventType": TranscriptionEventType(transcription.eventType).value,
+            "pagerIncident": incident_json,
             # Store eventMetadata as JSON for tracing/debugging
-            if transcription.eventMetadata:
-                record.eventMetadata = json.dumps(transcription.eventMetadata)
-            else:
-                record.eventMetadata = None
-            session.add(record)
+            "eventMetadata": (
+                json.dumps(transcription.eventMetadata)
+                if transcription.eventMetadata
+                else None
+            ),
+        }
 
     async def load_recent_transcriptions(
-        self, stream_id: str, limit: int = 100
+        self,
+        stream_id: str,
+        limit: int = 100,
+        *,
+        view: TranscriptionView = TranscriptionView.FULL,
     ) -> List[TranscriptionResult]:
-        async with self._session(commit=False) as session:
+        async with self._read_session() as session:
             result = await session.exec(
-                select(TranscriptionRecord)
+                self._select_transcriptions(view)
                 .where(TranscriptionRecord.streamId == stream_id)
                 .order_by(
                     TranscriptionRecord.timestamp.desc(),
@@ -381,15 +1149,18 @@ class StreamDatabase:
                 )
                 .limit(limit)
             )
-            records = result.all()
-            return [self._record_to_transcription(record) for record in records]
+            transcriptions = self._rows_to_transcriptions(result.all(), view)
+        merged = self._merge_pending(
+            transcriptions, self._pending_matching({stream_id}), view, descending=True
+        )
+        return merged[: max(0, limit)]
 
     async def load_last_system_event(
         self, stream_id: str
     ) -> Optional[TranscriptionResult]:
-        async with self._session(commit=False) as session:
+        async with self._read_session() as session:
             result = await session.exec(
-                select(TranscriptionRecord)
+                self._select_transcriptions(TranscriptionView.SUMMARY)
                 .where(TranscriptionRecord.streamId == stream_id)
                 .where(
                     TranscriptionRecord.eventType
@@ -399,32 +1170,124 @@ class StreamDatabase:
                 .limit(1)
             )
             record = result.first()
-            if record is None:
-                return None
-            return self._record_to_transcription(record)
+        stored = (
+            [self._record_to_transcription(record, full=False)]
+            if record is not None
+            else []
+        )
+        pending = [
+            row
+            for row in self._pending_matching({stream_id})
+            if row["eventType"] != TranscriptionEventType.TRANSCRIPTION.value
+        ]
+        merged = self._merge_pending(
+            stored, pending, TranscriptionView.SUMMARY, descending=True
+        )
+        return merged[0] if merged else None
+
+    def _pending_matching(
+        self,
+        stream_ids: Optional[Sequence[str] | set[str]],
+        *,
+        before: Optional[datetime] = None,
+        after: Optional[datetime] = None,
+        cursor: Optional[TranscriptionCursor] = None,
+    ) -> List[Dict[str, Any]]:
+        """Buffered transcription rows that a query with these filters would match."""
+
+        buffered = self._buffered_transcriptions()
+        if not buffered:
+            return []
+        wanted = set(stream_ids) if stream_ids is not None else None
+        position = (
+            (ensure_utc(cursor.timestamp), cursor.id) if cursor is not None else None
+        )
+        rows = []
+        for row in buffered.values():
+            if wanted is not None and row["streamId"] not in wanted:
+                continue
+            timestamp = ensure_utc(row["timestamp"])
+            if before is not None and not timestamp < ensure_utc(before):
+                continue
+            if after is not None and not timestamp > ensure_utc(after):
+                continue
+            if position is not None:
+                key = (timestamp, row["id"])
+                if cursor.direction == "before" and not key < position:
+                    continue
+                if cursor.direction != "before" and not key > position:
+                    continue
+            rows.append(row)
+        return rows
+
+    def _merge_pending(
+        self,
+        transcriptions: List[TranscriptionResult],
+        pending_rows: List[Dict[str, Any]],
+        view: TranscriptionView,
+        *,
+        descending: bool,
+    ) -> List[TranscriptionResult]:
+        """Combine stored results with buffered rows, which replace same-id rows."""
+
+        if not pending_rows:
+            return transcriptions
+        full = view != TranscriptionView.SUMMARY
+        pending = {
+            row["id"]: self._record_to_transcription(SimpleNamespace(**row), full=full)
+            for row in pending_rows
+        }
+        merged = [item for item in transcriptions if item.id not in pending]
+        merged.extend(pending.values())
+        merged.sort(key=lambda item: (item.timestamp, item.id), reverse=descending)
+        return merged
+
+    @staticmethod
+    def _select_transcriptions(view: TranscriptionView) -> Any:
+        if view == TranscriptionView.SUMMARY:
+            return select(*_SUMMARY_COLUMNS)
+        return select(TranscriptionRecord)
+
+    def _rows_to_transcriptions(
+        self, rows: Sequence[Any], view: TranscriptionView
+    ) -> List[TranscriptionResult]:
+        if view == TranscriptionView.SUMMARY:
+            return [self._record_to_transcription(row, full=False) for row in rows]
+        return [self._record_to_transcription(record) for record in rows]
 
     def _record_to_transcription(
-        self, record: TranscriptionRecord
+        self, record: Any, *, full: bool = True
     ) -> TranscriptionResult:
-        segments_data = json.loads(record.segments) if record.segments else None
-        segments: Optional[List[TranscriptionSegment]]
-        if segments_data:
-            segments = [
-                TranscriptionSegment.model_validate(segment)
-                for segment in segments_data
-            ]
-        else:
-            segments = None
-        pager_incident_data = (
-            json.loads(record.pagerIncident) if record.pagerIncident else None
-        )
-        pager_incident: Optional[PagerIncidentDetails]
-        if pager_incident_data:
-            pager_incident = PagerIncidentDetails.model_validate(pager_incident_data)
-        else:
-            pager_incident = None
-        waveform_data: Optional[List[float]] = (
-            json.loads(record.waveform) if record.waveform else None
+        """Build a result from a full record or a ``_SUMMARY_COLUMNS`` row.
+
+        Summary rows carry no segments or pager incident, so those are only
+        decoded for full records.
+        """
+
+        segments: Optional[List[TranscriptionSegment]] = None
+        waveform_data: Optional[List[float]] = None
+        pager_incident: Optional[PagerIncidentDetails] = None
+        if full:
+            if record.segmentsData is not None:
+                segments = decode_segments(record.segmentsData)
+            elif record.segments:
+                segments = [
+                    TranscriptionSegment.model_validate(segment)
+                    for segment in json.loads(record.segments)
+                ] or None
+            pager_incident_data = (
+                json.loads(record.pagerIncident) if record.pagerIncident else None
+            )
+            if pager_incident_data:
+                pager_incident = PagerIncidentDetails.model_validate(
+                    pager_incident_data
+                )
+        if record.waveformData is not None:
+            waveform_data = decode_waveform(record.waveformData)
+        elif record.waveform:
+            waveform_data = json.loads(record.waveform)
+        event_metadata = (
+            json.loads(record.eventMetadata) if record.eventMetadata else None
         )
         return TranscriptionResult(
             id=record.id,
@@ -444,37 +1307,98 @@ class StreamDatabase:
             reviewedBy=record.reviewedBy,
             eventType=TranscriptionEventType(record.eventType),
             pagerIncident=pager_incident,
+            eventMetadata=event_metadata,
         )
 
     async def query_transcriptions(
         self,
-        stream_id: str,
+        stream_id: Optional[str],
         limit: int = 100,
         before: Optional[datetime] = None,
         after: Optional[datetime] = None,
         search: Optional[str] = None,
         order: str = "desc",
+        *,
+        stream_ids: Optional[Sequence[str]] = None,
+        cursor: Optional[TranscriptionCursor] = None,
+        view: TranscriptionView = TranscriptionView.FULL,
     ) -> tuple[List[TranscriptionResult], bool]:
-        statement = select(TranscriptionRecord).where(
-            TranscriptionRecord.streamId == stream_id
-        )
+        """Return a page of transcriptions and whether more rows remain.
+
+        ``stream_id`` may be ``None`` to read every stream, or the streams in
+        ``stream_ids`` as one merged timeline. ``order`` is ``"desc"`` or
+        ``"asc"`` by ``(timestamp, id)``, or ``"relevance"`` to rank search
+        matches best first (newest first among equal ranks).
+
+        ``cursor`` seeks past a row in its own direction, and the returned
+        flag then reports whether more rows lie beyond the page in that
+        direction. Without a cursor it reports rows beyond the page in
+        ``order``.
+
+        ``view`` selects which columns are read; ``TranscriptionView.SUMMARY``
+        leaves out segments and pager incidents.
+        """
+
+        await self.initialize()
+        if search:
+            # The search index only covers committed rows.
+            await self.flush()
+        statement = self._select_transcriptions(view)
+        if stream_id is not None:
+            statement = statement.where(TranscriptionRecord.streamId == stream_id)
+        elif stream_ids is not None:
+            statement = statement.where(
+                TranscriptionRecord.streamId.in_(list(stream_ids))
+            )
         if before is not None:
             statement = statement.where(TranscriptionRecord.timestamp < before)
         if after is not None:
             statement = statement.where(TranscriptionRecord.timestamp > after)
 
-        if search:
-            like_term = f"%{search.lower()}%"
+        normalized_order = order.lower()
+        if cursor is not None:
+            if normalized_order == "relevance":
+                raise ValueError("Cursors require time ordering")
+            key = tuple_(TranscriptionRecord.timestamp, TranscriptionRecord.id)
+            position = tuple_(
+                literal(cursor.timestamp, TranscriptionRecord.timestamp.type),
+                literal(cursor.id, TranscriptionRecord.id.type),
+            )
             statement = statement.where(
-                or_(
-                    func.lower(TranscriptionRecord.text).like(like_term),
-                    func.lower(TranscriptionRecord.correctedText).like(like_term),
-                )
+                key < position if cursor.direction == "before" else key > position
             )
+            scan_order = "desc" if cursor.direction == "before" else "asc"
+        else:
+            scan_order = normalized_order
+
+        ranked = False
+        if search:
+            match_query = build_search_query(search) if self._search_enabled else None
+            if match_query is not None:
+                statement = statement.join(
+                    _search_index,
+                    _search_index.c.rowid == literal_column("transcriptions.rowid"),
+                ).where(literal_column(SEARCH_TABLE).op("MATCH")(match_query))
+                ranked = scan_order == "relevance"
+            else:
+                like_term = f"%{search.lower()}%"
+                statement = statement.where(
+                    or_(
+                        func.lower(TranscriptionRecord.text).like(like_term),
+                        func.lower(TranscriptionRecord.correctedText).like(
+                            like_term
+                        ),
+                    )
+                )
 
         fetch_limit = max(0, limit)
-        normalized_order = order.lower()
-        if normalized_order == "asc":
+        if ranked:
+            order_clause = (
+                _search_index.c.rank.asc(),
+                TranscriptionRecord.timestamp.desc(),
+                TranscriptionRecord.id.desc(),
+            )
+        elif scan_order == "asc":
             order_clause = (
                 TranscriptionRecord.timestamp.asc(),
                 TranscriptionRecord.id.asc(),
@@ -489,22 +1413,28 @@ class StreamDatabase:
         else:
             statement = statement.order_by(*order_clause).limit(fetch_limit + 1)
 
-        async with self._session(commit=False) as session:
+        async with self._read_session() as session:
             result = await session.exec(statement)
             records = result.all()
 
-        has_more_before = False
-        if fetch_limit == 0:
-            has_more_before = len(records) > 0
-            trimmed_records: List[TranscriptionRecord] = []
-        else:
-            has_more_before = len(records) > fetch_limit
-            trimmed_records = records[:fetch_limit]
-
-        transcriptions = [
-            self._record_to_transcription(record) for record in trimmed_records
-        ]
-        return transcriptions, has_more_before
+        transcriptions = self._rows_to_transcriptions(records, view)
+        if not search:
+            transcriptions = self._merge_pending(
+                transcriptions,
+                self._pending_matching(
+                    [stream_id] if stream_id is not None else stream_ids,
+                    before=before,
+                    after=after,
+                    cursor=cursor,
+                ),
+                view,
+                descending=scan_order != "asc",
+            )
+        has_more = len(transcriptions) > fetch_limit
+        transcriptions = transcriptions[:fetch_limit]
+        if scan_order != normalized_order and normalized_order in {"asc", "desc"}:
+            transcriptions.reverse()
+        return transcriptions, has_more
 
     async def update_review(
         self,
@@ -514,7 +1444,9 @@ class StreamDatabase:
         reviewer: Optional[str],
     ) -> TranscriptionResult:
         now = utcnow()
-        async with self._session() as session:
+        async with self._session(
+            flush_pending=transcription_id in self._buffered_transcriptions()
+        ) as session:
             record = await session.get(TranscriptionRecord, transcription_id)
             if record is None:
                 raise KeyError(f"Transcription {transcription_id} not found")
@@ -525,6 +1457,52 @@ class StreamDatabase:
             session.add(record)
             return self._record_to_transcription(record)
 
+    async def rename_recordings(self, renames: Mapping[str, str]) -> int:
+        """Point recording URLs at new file names, e.g. after transcoding.
+
+        *renames* maps old file names to new ones; returns the number of
+        transcriptions updated. Recording index entries are renamed too.
+        """
+
+        if not renames:
+            return 0
+        table = TranscriptionRecord.__table__
+        recordings = RecordingRecord.__table__
+        async with self._session(flush_pending=True) as session:
+            await session.exec(
+                recordings.update()
+                .where(recordings.c.name == bindparam("old_name"))
+                .values(name=bindparam("new_name")),
+                params=[
+                    {"old_name": old, "new_name": new}
+                    for old, new in renames.items()
+                ],
+            )
+            result = await session.exec(
+                select(TranscriptionRecord.id, TranscriptionRecord.recordingUrl).where(
+                    TranscriptionRecord.recordingUrl.is_not(None)
+                )
+            )
+            params = []
+            for row_id, url in result.all():
+                prefix, separator, name = url.rpartition("/")
+                new_name = renames.get(name)
+                if new_name is not None:
+                    params.append(
+                        {
+                            "row_id": row_id,
+                            "recording_url": f"{prefix}{separator}{new_name}",
+                        }
+                    )
+            if params:
+                await session.exec(
+                    table.update()
+                    .where(table.c.id == bindparam("row_id"))
+                    .values(recordingUrl=bindparam("recording_url")),
+                    params=params,
+                )
+        return len(params)
+
     async def export_transcriptions(
         self,
         statuses: Optional[Sequence[TranscriptionReviewStatus]] = None,
@@ -536,7 +1514,9 @@ class StreamDatabase:
             statement = statement.where(
                 TranscriptionRecord.reviewStatus.in_(list(statuses))
             )
-        async with self._session(commit=False) as session:
+        # Exports are complete snapshots, so commit anything still buffered.
+        await self.flush()
+        async with self._read_session() as session:
             result = await session.exec(statement)
             records = result.all()
             return [self._record_to_transcription(record) for record in records]
@@ -552,7 +1532,8 @@ class StreamDatabase:
             .order_by(TranscriptionRecord.timestamp.asc())
         )
 
-        async with self._session(commit=False) as session:
+        await self.flush()
+        async with self._read_session() as session:
             result = await session.exec(statement)
             records = result.all()
             return [self._record_to_transcription(record) for record in records]
@@ -584,4 +1565,4 @@ class StreamDatabase:
         )
 
 
-__all__ = ["StreamDatabase"]
+__all__ = ["StreamDatabase", "TranscriptionCursor", "build_search_query"]
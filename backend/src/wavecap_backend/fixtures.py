@@ -44,7 +44,7 @@ async def load_screenshot_fixtures(database: StreamDatabase) -> None:
     await database.clear_all()
 
     now = utcnow().replace(microsecond=0)
-    recordings: set[Path] = set()
+    recordings: Dict[Path, TranscriptionResult] = {}
 
     streams = [
         Stream(
@@ -232,11 +232,17 @@ async def load_screenshot_fixtures(database: StreamDatabase) -> None:
             relative = Path(result.recordingUrl)
             if relative.parts and relative.parts[0] == "recordings":
                 relative = Path(*relative.parts[1:])
-            recordings.add(relative)
+            recordings[relative] = result
         await database.append_transcription(result)
 
     if recordings:
-        _write_placeholder_recordings(recordings)
+        _write_placeholder_recordings(set(recordings))
+        await database.import_recordings(
+            [
+                (relative.as_posix(), result.streamId, result.timestamp, 0)
+                for relative, result in recordings.items()
+            ]
+        )
 
 
 async def load_fixture_set(name: str, database: StreamDatabase) -> None:
@@ -0,0 +1,134 @@
+"""Shared PCM ring buffer for live audio listeners."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+__all__ = ["LiveAudioReader", "LiveAudioRing"]
+
+LIVE_AUDIO_BUFFER_SECONDS = 4.0
+# Share of the buffer a lagging listener is rewound to after skipping ahead.
+_CATCH_UP_FRACTION = 0.25
+
+
+class LiveAudioRing:
+    """Fixed-size ring of 16-bit PCM shared by every listener of a stream.
+
+    The ingest path copies each block into the ring once and wakes waiting
+    readers; it never touches individual listeners. Each reader keeps its own
+    byte cursor, and one that falls a whole buffer behind skips ahead to
+    recent audio instead of replaying stale data.
+    """
+
+    def __init__(
+        self, sample_rate: int, seconds: float = LIVE_AUDIO_BUFFER_SECONDS
+    ) -> None:
+        capacity = int(sample_rate * seconds) * 2
+        self._capacity = max(capacity, 2)
+        self._buffer = np.zeros(self._capacity, dtype=np.uint8)
+        self._written = 0
+        self._generation = 0
+        self._readable = asyncio.Event()
+        self.listener_count = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def written(self) -> int:
+        return self._written
+
+    def write(self, samples: np.ndarray) -> None:
+        """Append *samples* (int16 PCM) and wake readers."""
+
+        if self.listener_count == 0:
+            return
+        data = np.ascontiguousarray(samples).view(np.uint8).reshape(-1)
+        if data.size == 0:
+            return
+        if data.size > self._capacity:
+            # Only the newest audio can ever be read back.
+            self._written += data.size - self._capacity
+            data = data[-self._capacity :]
+        start = self._written % self._capacity
+        first = min(data.size, self._capacity - start)
+        self._buffer[start : start + first] = data[:first]
+        if first < data.size:
+            self._buffer[: data.size - first] = data[first:]
+        self._written += data.size
+        self._wake()
+
+    def close(self) -> None:
+        """End every open reader; readers opened afterwards start fresh."""
+
+        self._generation += 1
+        self._wake()
+
+    def open_reader(self) -> "LiveAudioReader":
+        self.listener_count += 1
+        return LiveAudioReader(self)
+
+    def _wake(self) -> None:
+        readable = self._readable
+        self._readable = asyncio.Event()
+        readable.set()
+
+    def _copy(self, start: int, end: int) -> bytes:
+        begin = start % self._capacity
+        length = end - start
+        first = min(length, self._capacity - begin)
+        if first == length:
+            return self._buffer[begin : begin + length].tobytes()
+        return (
+            self._buffer[begin:].tobytes() + self._buffer[: length - first].tobytes()
+        )
+
+
+class LiveAudioReader:
+    """One listener's position in a :class:`LiveAudioRing`."""
+
+    def __init__(self, ring: LiveAudioRing) -> None:
+        self._ring = ring
+        self._generation = ring._generation
+        self._cursor = ring.written
+        self._closed = False
+        self.skipped_bytes = 0
+
+    async def read(self) -> Optional[bytes]:
+        """Return the next block of PCM, or ``None`` once the ring closes."""
+
+        ring = self._ring
+        while not self._closed:
+            if ring._generation != self._generation:
+                return None
+            written = ring.written
+            if written > self._cursor:
+                if written - self._cursor > ring.capacity:
+                    # Too far behind: drop to recent audio, keeping whole samples.
+                    target = written - int(ring.capacity * _CATCH_UP_FRACTION)
+                    target -= (target - self._cursor) % 2
+                    self.skipped_bytes += target - self._cursor
+                    self._cursor = target
+                chunk = ring._copy(self._cursor, written)
+                self._cursor = written
+                return chunk
+            await ring._readable.wait()
+        return None
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._ring.listener_count -= 1
+        if self.skipped_bytes:
+            LOGGER.debug(
+                "Live audio listener skipped %d bytes while lagging",
+                self.skipped_bytes,
+            )
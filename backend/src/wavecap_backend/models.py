@@ -5,7 +5,7 @@ from __future__ import annotations
 import math
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import (
     AliasChoices,
@@ -61,6 +61,21 @@ class TranscriptionReviewStatus(str, Enum):
     VERIFIED = "verified"
 
 
+class RecordingFormat(str, Enum):
+    """Container and codec used for stored recordings."""
+
+    WAV = "wav"  # 16-bit PCM
+    FLAC = "flac"  # lossless, typically about half the size of WAV
+    OPUS = "opus"  # lossy speech-quality Ogg Opus, the smallest option
+
+
+class TranscriptionView(str, Enum):
+    """How much of each transcription a history query returns."""
+
+    SUMMARY = "summary"  # everything but Whisper segments and pager incidents
+    FULL = "full"
+
+
 class TranscriptionEventType(str, Enum):
     """Classifies transcription entries for downstream consumers."""
 
@@ -71,6 +86,7 @@ class TranscriptionEventType(str, Enum):
     TRANSCRIPTION_STOPPED = "transcription_stopped"
     UPSTREAM_DISCONNECTED = "upstream_disconnected"
     UPSTREAM_RECONNECTED = "upstream_reconnected"
+    TRANSCRIPTION_OVERLOAD = "transcription_overload"
 
 
 class TranscriptionSegment(APIModel):
@@ -237,8 +253,8 @@ class TranscriptionResult(APIModel):
             name = str(value).rsplit("/", 1)[-1]
             if not name:
                 return None
-            file_path = state_paths.RECORDINGS_DIR / name
-            return value if file_path.exists() else None
+            # A recording transcoded to another format still resolves.
+            return value if state_paths.resolve_recording_file(name) else None
         except Exception:
             # Be conservative on unexpected values
             return None
@@ -289,6 +305,9 @@ class Stream(APIModel):
     recordingRetentionSeconds: Optional[float] = Field(
         default=None, alias="recordingRetentionSeconds"
     )
+    recordingFormat: RecordingFormat = Field(
+        default=RecordingFormat.WAV, alias="recordingFormat"
+    )
     lastActivityAt: Optional[datetime] = Field(default=None, alias="lastActivityAt")
     # Optional base location used by the UI to disambiguate partial addresses
     baseLocation: Optional["BaseLocationConfig"] = Field(
@@ -375,6 +394,53 @@ class LoggingConfig(APIModel):
     frontend: LogTargetConfig = LogTargetConfig(fileName="frontend.log")
 
 
+class DatabaseConfig(APIModel):
+    """Controls SQLite tuning and how transcription writes are grouped."""
+
+    # Pending writes are committed together at least this often. Set to 0 to
+    # commit every append before it returns.
+    writeFlushIntervalSeconds: float = Field(
+        default=0.5, alias="writeFlushIntervalSeconds"
+    )
+    # A flush starts early once this many transcriptions are waiting.
+    writeBatchSize: int = Field(default=64, alias="writeBatchSize")
+    # Appends wait for a flush once this many transcriptions are buffered.
+    maxPendingWrites: int = Field(default=1024, alias="maxPendingWrites")
+    # Read-only connections kept open for API queries, separate from the
+    # single writer connection.
+    readPoolSize: int = Field(default=4, alias="readPoolSize")
+    # SQLite page cache per connection, in KiB.
+    cacheSizeKib: int = Field(default=16384, alias="cacheSizeKib")
+    # Bytes of the database file memory-mapped per connection; 0 disables.
+    mmapSizeBytes: int = Field(default=268435456, alias="mmapSizeBytes")
+    # How long a connection waits on a SQLite lock before reporting it busy.
+    busyTimeoutMs: int = Field(default=5000, alias="busyTimeoutMs")
+
+    @field_validator("writeFlushIntervalSeconds")
+    @classmethod
+    def _validate_flush_interval(cls, value: float) -> float:
+        parsed = float(value)
+        if parsed < 0:
+            raise ValueError("writeFlushIntervalSeconds must be non-negative")
+        return parsed
+
+    @field_validator("writeBatchSize", "maxPendingWrites", "readPoolSize")
+    @classmethod
+    def _validate_positive(cls, value: int) -> int:
+        parsed = int(value)
+        if parsed < 1:
+            raise ValueError("database write limits and pool size must be at least 1")
+        return parsed
+
+    @field_validator("cacheSizeKib", "mmapSizeBytes", "busyTimeoutMs")
+    @classmethod
+    def _validate_non_negative(cls, value: int) -> int:
+        parsed = int(value)
+        if parsed < 0:
+            raise ValueError("database tuning values must be non-negative")
+        return parsed
+
+
 class ServerConfig(APIModel):
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=8000)
@@ -398,6 +464,91 @@ class ServerConfig(APIModel):
         return port
 
 
+class OverloadAction(str, Enum):
+    """Degradation steps applied while a stream's transcription backlog grows."""
+
+    REDUCE_BEAM = "reduceBeam"
+    FALLBACK_MODEL = "fallbackModel"
+    SKIP_LLM = "skipLlm"
+    SHED_LOW_PRIORITY = "shedLowPriority"
+
+
+class OverloadConfig(APIModel):
+    """Controls how a stream degrades when transcription falls behind."""
+
+    enabled: bool = False
+    # Applied cumulatively, one per level, in the order listed.
+    actions: List[OverloadAction] = Field(
+        default_factory=lambda: [
+            OverloadAction.REDUCE_BEAM,
+            OverloadAction.FALLBACK_MODEL,
+            OverloadAction.SKIP_LLM,
+            OverloadAction.SHED_LOW_PRIORITY,
+        ]
+    )
+    # Level N is entered once this many times N chunks are waiting.
+    escalateQueueDepth: int = Field(default=4, alias="escalateQueueDepth")
+    # Processing time divided by audio duration above which the stream counts
+    # as falling behind real time, even with a short queue.
+    realTimeFactorLimit: float = Field(default=1.0, alias="realTimeFactorLimit")
+    # Minimum time between two level changes.
+    minDwellSeconds: float = Field(default=10.0, alias="minDwellSeconds")
+    reducedBeamSize: int = Field(default=1, alias="reducedBeamSize")
+
+    @field_validator("escalateQueueDepth", "reducedBeamSize")
+    @classmethod
+    def _validate_positive_int(cls, value: int) -> int:
+        parsed = int(value)
+        if parsed < 1:
+            raise ValueError("overload thresholds must be at least 1")
+        return parsed
+
+    @field_validator("realTimeFactorLimit", "minDwellSeconds")
+    @classmethod
+    def _validate_non_negative(cls, value: float) -> float:
+        parsed = float(value)
+        if parsed < 0:
+            raise ValueError("overload timings must be non-negative")
+        return parsed
+
+
+class SpeechGateConfig(APIModel):
+    """Rules that skip Whisper for audio that is obviously not speech."""
+
+    # Skip chunks below the low-energy thresholds derived from
+    # silenceThreshold; their transcripts would be discarded anyway.
+    lowEnergy: bool = Field(default=True, alias="lowEnergy")
+    # Skip chunks whose share of samples above silenceThreshold is lower.
+    minActiveRatio: Optional[float] = Field(default=None, alias="minActiveRatio")
+    # Skip chunks with less new audio than this (excluding carried context).
+    minDurationSeconds: float = Field(default=0.0, alias="minDurationSeconds")
+    # Trunked calls: skip encrypted calls, calls shorter than minCallSeconds,
+    # and calls on the listed talkgroup IDs.
+    skipEncryptedCalls: bool = Field(default=True, alias="skipEncryptedCalls")
+    minCallSeconds: float = Field(default=0.5, alias="minCallSeconds")
+    excludedTalkgroups: List[str] = Field(
+        default_factory=list, alias="excludedTalkgroups"
+    )
+
+    @field_validator("minActiveRatio")
+    @classmethod
+    def _validate_min_active_ratio(cls, value: Optional[float]) -> Optional[float]:
+        if value is None:
+            return None
+        ratio = float(value)
+        if not 0.0 <= ratio <= 1.0:
+            raise ValueError("speechGate.minActiveRatio must be between 0 and 1")
+        return ratio
+
+    @field_validator("minDurationSeconds", "minCallSeconds")
+    @classmethod
+    def _validate_non_negative(cls, value: float) -> float:
+        seconds = float(value)
+        if seconds < 0:
+            raise ValueError("speechGate durations must be non-negative")
+        return seconds
+
+
 class WhisperConfig(APIModel):
     model: str = "base"
     backend: str = Field(default="auto", alias="backend")  # "auto", "faster-whisper", "mlx"
@@ -414,6 +565,23 @@ class WhisperConfig(APIModel):
         default=0.15, alias="activeSamplesInLookbackPct"
     )
     maxConcurrentProcesses: int = Field(default=2, alias="maxConcurrentProcesses")
+    # Chunks from all streams that arrive within ``batchWindowSeconds`` of each
+    # other are decoded together, up to ``batchMaxSize`` per model call.
+    batchMaxSize: int = Field(default=1, alias="batchMaxSize")
+    batchWindowSeconds: float = Field(default=0.05, alias="batchWindowSeconds")
+    # Pinned streams and these trunked talkgroup IDs are dequeued
+    # ``priorityWeight`` times as often as other streams under contention.
+    priorityWeight: float = Field(default=4.0, alias="priorityWeight")
+    priorityTalkgroups: List[str] = Field(
+        default_factory=list, alias="priorityTalkgroups"
+    )
+    # Trunked calls queued or being transcribed per stream before new calls
+    # on ordinary talkgroups are dropped.
+    trunkedMaxPendingCalls: int = Field(default=32, alias="trunkedMaxPendingCalls")
+    overload: OverloadConfig = OverloadConfig()
+    speechGate: SpeechGateConfig = Field(
+        default=SpeechGateConfig(), alias="speechGate"
+    )
     beamSize: int = Field(default=5, alias="beamSize")
     decodeTemperature: float = Field(default=0.0, alias="decodeTemperature")
     temperatureIncrementOnFallback: float = Field(
@@ -491,6 +659,45 @@ class WhisperConfig(APIModel):
             )
         return parsed
 
+    @field_validator("batchMaxSize")
+    @classmethod
+    def _validate_batch_max_size(cls, value: int) -> int:
+        parsed = int(value)
+        if parsed < 1:
+            raise ValueError("batchMaxSize must be at least 1")
+        return parsed
+
+    @field_validator("batchWindowSeconds")
+    @classmethod
+    def _validate_batch_window_seconds(cls, value: float) -> float:
+        seconds = float(value)
+        if seconds < 0:
+            raise ValueError("batchWindowSeconds must be non-negative")
+        return seconds
+
+    @field_validator("trunkedMaxPendingCalls")
+    @classmethod
+    def _validate_trunked_max_pending(cls, value: int) -> int:
+        parsed = int(value)
+        if parsed < 1:
+            raise ValueError("trunkedMaxPendingCalls must be at least 1")
+        return parsed
+
+    @field_validator("priorityWeight")
+    @classmethod
+    def _validate_priority_weight(cls, value: float) -> float:
+        weight = float(value)
+        if weight < 1:
+            raise ValueError("priorityWeight must be at least 1")
+        return weight
+
+    @field_validator("priorityTalkgroups", mode="before")
+    @classmethod
+    def _normalize_priority_talkgroups(cls, value: Any) -> List[str]:
+        if value is None:
+            return []
+        return [str(item).strip() for item in value if str(item).strip()]
+
     @field_validator("noAudioReconnectSeconds")
     @classmethod
     def _validate_no_audio_reconnect_seconds(
@@ -593,6 +800,9 @@ class StreamConfig(APIModel):
     recordingRetentionSeconds: Optional[float] = Field(
         default=None, alias="recordingRetentionSeconds"
     )
+    recordingFormat: RecordingFormat = Field(
+        default=RecordingFormat.WAV, alias="recordingFormat"
+    )
     # Remote upstream bundle definition. Only used when source == "remote".
     remoteUpstreams: Optional[List["RemoteUpstreamConfig"]] = Field(
         default=None, alias="remoteUpstreams"
@@ -713,6 +923,7 @@ class AccessDescriptor(APIModel):
 class AppConfig(APIModel):
     server: ServerConfig
     logging: LoggingConfig = LoggingConfig()
+    database: DatabaseConfig = DatabaseConfig()
     whisper: WhisperConfig = WhisperConfig()
     llm: Optional[LLMConfig] = Field(default=None, alias="llm")
     alerts: AlertsConfig = AlertsConfig()
@@ -747,6 +958,10 @@ class RemoteUpstreamConfig(APIModel):
     format: Optional[str] = Field(default="pcm16")
     # Higher priority wins when multiple upstreams are healthy.
     priority: int = 0
+    # Pull mode: when true, an upstream below the highest-priority pull stays
+    # idle (no ffmpeg decoder) until the active source stalls. Set false to
+    # keep it decoding as a hot standby.
+    standby: bool = True
     # Trunked mode: system ID for the trunking system (used in logging/display)
     systemId: Optional[str] = Field(default=None, alias="systemId")
     # Trunked mode: optional list of talk group IDs to transcribe (empty = all)
@@ -786,6 +1001,20 @@ class RemoteUpstreamState(APIModel):
     rssi: Optional[float] = None
     # For pull sources, a sanitized URL label; for push sources, a sender label
     label: Optional[str] = None
+    # Pull sources held idle as a warm standby are not decoding.
+    standby: bool = False
+    # Times this upstream was started because the active source stalled.
+    failovers: int = 0
+    # Time from the active source's last audio to this upstream's first audio
+    # after the most recent failover.
+    lastFailoverMs: Optional[float] = Field(default=None, alias="lastFailoverMs")
+    # Total time spent idle in standby, i.e. decoder time saved.
+    standbySeconds: float = Field(default=0.0, alias="standbySeconds")
+    # Trunked sources: calls queued by the client but not yet read, and how
+    # long the most recent and slowest calls waited in that queue.
+    pendingCalls: int = Field(default=0, alias="pendingCalls")
+    queueLagMs: Optional[float] = Field(default=None, alias="queueLagMs")
+    maxQueueLagMs: Optional[float] = Field(default=None, alias="maxQueueLagMs")
 
 
 class RemoteIngestServerConfig(APIModel):
@@ -863,6 +1092,10 @@ class TranscriptionQueryResponse(APIModel):
     transcriptions: List[TranscriptionResult]
     hasMoreBefore: bool = Field(default=False, alias="hasMoreBefore")
     hasMoreAfter: bool = Field(default=False, alias="hasMoreAfter")
+    # Opaque keyset cursors: next continues in the requested order, prev
+    # pages back the other way.
+    nextCursor: Optional[str] = Field(default=None, alias="nextCursor")
+    prevCursor: Optional[str] = Field(default=None, alias="prevCursor")
 
 
 class ExportTranscriptionsRequest(APIModel):
@@ -0,0 +1,168 @@
+"""Adaptive degradation for streams whose transcription falls behind."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Collection, Optional, Tuple
+
+from .models import OverloadAction, OverloadConfig
+
+__all__ = ["BACKEND_ACTIONS", "OverloadController", "OverloadTransition"]
+
+# Weight given to the newest sample in the real-time factor moving average.
+REAL_TIME_FACTOR_SMOOTHING = 0.3
+
+# Actions that only take effect if the transcription backend honours them.
+BACKEND_ACTIONS = frozenset(
+    {OverloadAction.REDUCE_BEAM, OverloadAction.FALLBACK_MODEL}
+)
+
+_ACTION_LABELS = {
+    OverloadAction.REDUCE_BEAM: "reduced beam size",
+    OverloadAction.FALLBACK_MODEL: "fallback model",
+    OverloadAction.SKIP_LLM: "LLM correction skipped",
+    OverloadAction.SHED_LOW_PRIORITY: "low-priority audio dropped",
+}
+
+
+@dataclass(frozen=True)
+class OverloadTransition:
+    """A change in degradation level, reported as a stream system event."""
+
+    previous_level: int
+    level: int
+    queue_depth: int
+    real_time_factor: Optional[float]
+    actions: Tuple[OverloadAction, ...]
+    dropped_chunks: int = 0
+
+    @property
+    def escalated(self) -> bool:
+        return self.level > self.previous_level
+
+    def describe(self) -> str:
+        if self.level == 0:
+            message = "Transcription load recovered; full quality restored"
+            if self.dropped_chunks:
+                message += f" ({self.dropped_chunks} low-priority chunks dropped)"
+            return message
+        verb = "increased" if self.escalated else "reduced"
+        active = ", ".join(_ACTION_LABELS[action] for action in self.actions)
+        return f"Transcription overload {verb} to level {self.level}: {active}"
+
+    def detail(self) -> str:
+        parts = [f"{self.queue_depth} chunks queued"]
+        if self.real_time_factor is not None:
+            parts.append(f"real-time factor {self.real_time_factor:.2f}")
+        return ", ".join(parts)
+
+
+class OverloadController:
+    """Steps a stream through degradation levels as its backlog grows.
+
+    Level ``N`` enables the first ``N`` configured actions. The target level
+    is the number of ``escalateQueueDepth`` multiples waiting in the queue, and
+    at least one while the smoothed real-time factor exceeds
+    ``realTimeFactorLimit`` with work still queued. The controller moves one
+    level at a time, no more often than every ``minDwellSeconds``, and only
+    steps down once the queue has drained below half the current level's
+    threshold, so it does not flap around a boundary.
+
+    ``backend_actions`` lists the ``BACKEND_ACTIONS`` the transcriber can
+    honour (``None`` means all of them); the others are skipped rather than
+    reported as active.
+    """
+
+    def __init__(
+        self,
+        config: OverloadConfig,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        backend_actions: Optional[Collection[OverloadAction]] = None,
+    ) -> None:
+        self._actions: Tuple[OverloadAction, ...] = tuple(
+            action
+            for action in dict.fromkeys(config.actions)
+            if backend_actions is None
+            or action not in BACKEND_ACTIONS
+            or action in backend_actions
+        )
+        self._escalate_depth = max(int(config.escalateQueueDepth), 1)
+        self._rtf_limit = float(config.realTimeFactorLimit)
+        self._min_dwell = float(config.minDwellSeconds)
+        self.reduced_beam_size = max(int(config.reducedBeamSize), 1)
+        self._clock = clock
+        self._level = 0
+        self._last_transition: Optional[float] = None
+        self._real_time_factor: Optional[float] = None
+        self._dropped_chunks = 0
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    @property
+    def real_time_factor(self) -> Optional[float]:
+        return self._real_time_factor
+
+    def is_active(self, action: OverloadAction) -> bool:
+        return action in self._actions[: self._level]
+
+    def record_processing(self, audio_seconds: float, processing_seconds: float) -> None:
+        """Fold one chunk's processing time into the real-time factor."""
+
+        if audio_seconds <= 0:
+            return
+        sample = max(processing_seconds, 0.0) / audio_seconds
+        if self._real_time_factor is None:
+            self._real_time_factor = sample
+        else:
+            self._real_time_factor += REAL_TIME_FACTOR_SMOOTHING * (
+                sample - self._real_time_factor
+            )
+
+    def record_dropped_chunk(self) -> None:
+        self._dropped_chunks += 1
+
+    def evaluate(self, queue_depth: int) -> Optional[OverloadTransition]:
+        """Move at most one level toward the load implied by *queue_depth*."""
+
+        if not self._actions:
+            return None
+        now = self._clock()
+        if (
+            self._last_transition is not None
+            and now - self._last_transition < self._min_dwell
+        ):
+            return None
+        behind = (
+            self._real_time_factor is not None
+            and self._real_time_factor > self._rtf_limit
+        )
+        target = min(queue_depth // self._escalate_depth, len(self._actions))
+        if behind and queue_depth > 0:
+            target = max(target, 1)
+        previous = self._level
+        if target > previous:
+            self._level = previous + 1
+        elif (
+            previous > 0
+            and not behind
+            and queue_depth <= (self._escalate_depth * previous) // 2
+        ):
+            self._level = previous - 1
+        else:
+            return None
+        self._last_transition = now
+        dropped = 0
+        if self._level == 0:
+            dropped, self._dropped_chunks = self._dropped_chunks, 0
+        return OverloadTransition(
+            previous_level=previous,
+            level=self._level,
+            queue_depth=queue_depth,
+            real_time_factor=self._real_time_factor,
+            actions=self._actions[: self._level],
+            dropped_chunks=dropped,
+        )
@@ -0,0 +1,151 @@
+"""Writing and transcoding stored recordings.
+
+Recordings are encoded on a small dedicated thread pool so that FLAC and Opus
+compression never competes with transcription for the default executor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+from .models import RecordingFormat
+from .state_paths import RECORDING_SUFFIXES
+
+LOGGER = logging.getLogger(__name__)
+
+__all__ = [
+    "RECORDING_IO_WORKERS",
+    "recording_format_for",
+    "recording_media_type",
+    "recording_suffix",
+    "transcode_recording",
+    "write_recording",
+]
+
+RECORDING_IO_WORKERS = 2
+
+# libsndfile's Opus encoder only accepts these input sample rates.
+OPUS_SAMPLE_RATES = frozenset({8000, 12000, 16000, 24000, 48000})
+
+_SUFFIXES: Dict[RecordingFormat, str] = dict(
+    zip(
+        (RecordingFormat.WAV, RecordingFormat.FLAC, RecordingFormat.OPUS),
+        RECORDING_SUFFIXES,
+    )
+)
+_SOUNDFILE_FORMATS: Dict[RecordingFormat, Tuple[str, str]] = {
+    RecordingFormat.WAV: ("WAV", "PCM_16"),
+    RecordingFormat.FLAC: ("FLAC", "PCM_16"),
+    RecordingFormat.OPUS: ("OGG", "OPUS"),
+}
+_MEDIA_TYPES = {
+    ".wav": "audio/wav",
+    ".flac": "audio/flac",
+    ".opus": "audio/ogg; codecs=opus",
+}
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _io_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=RECORDING_IO_WORKERS, thread_name_prefix="recording-io"
+            )
+        return _pool
+
+
+def recording_suffix(recording_format: RecordingFormat) -> str:
+    return _SUFFIXES[RecordingFormat(recording_format)]
+
+
+def recording_format_for(path: Path) -> Optional[RecordingFormat]:
+    suffix = path.suffix.lower()
+    for recording_format, candidate in _SUFFIXES.items():
+        if candidate == suffix:
+            return recording_format
+    return None
+
+
+def recording_media_type(path: Path) -> str:
+    return _MEDIA_TYPES.get(path.suffix.lower(), "application/octet-stream")
+
+
+def _effective_format(
+    recording_format: RecordingFormat, sample_rate: int
+) -> RecordingFormat:
+    if recording_format == RecordingFormat.OPUS and sample_rate not in OPUS_SAMPLE_RATES:
+        LOGGER.warning(
+            "Opus cannot encode %d Hz audio; storing the recording as FLAC",
+            sample_rate,
+        )
+        return RecordingFormat.FLAC
+    return recording_format
+
+
+def _write_blocking(
+    path: Path, samples: np.ndarray, sample_rate: int, recording_format: RecordingFormat
+) -> None:
+    container, subtype = _SOUNDFILE_FORMATS[recording_format]
+    # Encode to a temporary name so a half-written file is never served.
+    partial = path.with_name(f".{path.name}.partial")
+    try:
+        sf.write(partial, samples, sample_rate, format=container, subtype=subtype)
+        os.replace(partial, path)
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+async def write_recording(
+    path: Path,
+    samples: np.ndarray,
+    sample_rate: int,
+    recording_format: RecordingFormat = RecordingFormat.WAV,
+) -> Path:
+    """Encode *samples* next to *path* in *recording_format* and return the file.
+
+    The suffix of *path* is replaced to match the format actually written.
+    """
+
+    effective = _effective_format(RecordingFormat(recording_format), sample_rate)
+    target = path.with_suffix(recording_suffix(effective))
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        _io_pool(), _write_blocking, target, samples, sample_rate, effective
+    )
+    return target
+
+
+def transcode_recording(path: Path, recording_format: RecordingFormat) -> Path:
+    """Re-encode the recording at *path*, replacing it, and return the new file.
+
+    Blocking; run it on a worker thread. The original is only removed once
+    the new file is complete. Files already in the target format are left
+    alone.
+    """
+
+    info = sf.info(str(path))
+    effective = _effective_format(RecordingFormat(recording_format), info.samplerate)
+    target = path.with_suffix(recording_suffix(effective))
+    if target == path:
+        return path
+    # PCM sources are read as integers so FLAC output stays bit-exact.
+    dtype = "int16" if effective == RecordingFormat.FLAC else "float32"
+    samples, sample_rate = sf.read(str(path), dtype=dtype, always_2d=False)
+    _write_blocking(target, samples, sample_rate, effective)
+    source_stat = path.stat()
+    os.utime(target, (source_stat.st_atime, source_stat.st_mtime))
+    path.unlink()
+    return target
@@ -4,7 +4,7 @@ This module provides minimal primitives for integrating WaveCap with external
 radio/audio services (e.g., WaveCap‑SDR) and accepting server‑side push audio.
 
 Design goals:
-- Support multiple upstreams per stream with simple priority selection.
+- Support multiple upstreams per stream with priority selection and failover.
 - Treat pull sources as ffmpeg-driven HTTP readers that resample to mono s16le
   at the target sample rate to match Whisper expectations.
 - Allow push sources to enqueue raw PCM frames directly via an async API used by
@@ -16,8 +16,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from .models import RemoteUpstreamConfig, RemoteUpstreamState
 
@@ -26,6 +27,15 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+# How long the active upstream may go without data before a lower-priority
+# upstream that is still producing takes over.
+UPSTREAM_FAILOVER_SECONDS = 2.0
+# A standby upstream promoted during a failover is stopped again once a
+# higher-priority source has been producing for this long.
+STANDBY_RESTORE_SECONDS = 10.0
+PULL_BUFFER_CHUNKS = 32
+PUSH_BUFFER_CHUNKS = 64
+
 
 def _sanitize_label(url: Optional[str]) -> Optional[str]:
     if not url:
@@ -50,7 +60,8 @@ class _PullProcess:
     read_size_bytes: int
     ffmpeg_rw_timeout_us: int = int(15.0 * 1e6)
     process: Optional[asyncio.subprocess.Process] = None
-    queue: asyncio.Queue[bytes] = field(default_factory=lambda: asyncio.Queue(maxsize=32))
+    # Receives each PCM chunk read from ffmpeg.
+    sink: Callable[[bytes], None] = lambda _chunk: None
     task: Optional[asyncio.Task[None]] = None
     connected: bool = False
     last_bytes_mono: float = 0.0
@@ -132,19 +143,7 @@ class _PullProcess:
                     if not chunk:
                         break
                     self.last_bytes_mono = time.monotonic()
-                    # Non-blocking queue with drop-oldest on overflow
-                    try:
-                        self.queue.put_nowait(chunk)
-                    except asyncio.QueueFull:
-                        try:
-                            _ = self.queue.get_nowait()
-                            self.queue.task_done()
-                        except asyncio.QueueEmpty:
-                            pass
-                        try:
-                            self.queue.put_nowait(chunk)
-                        except asyncio.QueueFull:
-                            pass
+                    self.sink(chunk)
             finally:
                 self.connected = False
                 if self.process and self.process.returncode is None:
@@ -157,17 +156,47 @@ class _PullProcess:
                 self.process = None
 
 
+@dataclass
+class _UpstreamBuffer:
+    """Chunks waiting to be read from one pull or push upstream."""
+
+    source_id: str
+    chunks: Deque[bytes]
+    last_data_mono: float = float("-inf")
+
+
+def _resolve_waiter(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 class MultiUpstreamSelector:
     """Coordinates multiple upstreams and exposes a single read interface.
 
     Selection strategy:
     - Prefer the highest-priority upstream that is currently producing data.
-    - If the active upstream goes quiet, automatically fall back to the next
-      available source.
+    - If the active upstream goes quiet for ``UPSTREAM_FAILOVER_SECONDS``,
+      automatically fall back to the next available source. Audio buffered
+      from sources that are not active is discarded so a failover never
+      replays stale audio.
+
+    Upstreams append to per-source buffers (dropping the oldest chunk when
+    full) and wake a single waiter, so ``read`` creates no tasks; a read that
+    finds data ready allocates nothing.
+
+    Warm standby:
+    - Only the highest-priority pull upstream (plus any with ``standby``
+      disabled) runs an ffmpeg decoder. Other pull upstreams stay idle until
+      no source has produced audio for ``UPSTREAM_FAILOVER_SECONDS``; then the
+      next one is started. Once a higher-priority source has been producing
+      again for ``STANDBY_RESTORE_SECONDS`` the promoted upstream returns to
+      standby.
 
     Trunked mode:
     - Trunked upstreams connect via WebSocket to WaveCap-SDR and receive
       complete calls with metadata. Use read_trunked() to get these.
+    - Clients wake ``read_trunked`` as calls arrive, and clients with queued
+      calls are served round-robin, so a quiet site never delays a busy one.
     """
 
     def __init__(
@@ -179,11 +208,23 @@ class MultiUpstreamSelector:
         self._target_sample_rate = max(int(target_sample_rate), 1)
         self._read_size_bytes = max(int(read_size_bytes), 4096)
         self._pulls: Dict[str, _PullProcess] = {}
-        self._push_queues: Dict[str, asyncio.Queue[bytes]] = {}
+        # Pull and push sources, highest priority first.
+        self._sources: List[_UpstreamBuffer] = []
+        self._buffers: Dict[str, _UpstreamBuffer] = {}
+        self._waiter: Optional[asyncio.Future[None]] = None
+        self._running: Set[str] = set()
+        self._started_mono: Dict[str, float] = {}
+        self._standby_since: Dict[str, float] = {}
+        self._standby_seconds: Dict[str, float] = {}
+        # Promoted upstream -> when the previously active source last had audio.
+        self._failover_from: Dict[str, float] = {}
+        self._restored_since: Dict[str, float] = {}
         self._trunked_clients: Dict[str, "TrunkedRadioClient"] = {}
         self._trunked_configs: Dict[str, RemoteUpstreamConfig] = {}
+        self._trunked_waiter: Optional[asyncio.Future[None]] = None
+        # Index into the trunked clients of the next one to serve first.
+        self._trunked_cursor = 0
         self._states: Dict[str, RemoteUpstreamState] = {}
-        self._lock = asyncio.Lock()
         # Build state and processes
         for cfg in sorted(upstreams, key=lambda u: int(getattr(u, "priority", 0)), reverse=True):
             mode = (cfg.mode or "pull").lower()
@@ -197,16 +238,61 @@ class MultiUpstreamSelector:
                 label=_sanitize_label(cfg.url),
             )
             self._states[cfg.id] = state
-            if mode == "pull":
-                self._pulls[cfg.id] = _PullProcess(cfg=cfg, sample_rate=self._target_sample_rate, read_size_bytes=self._read_size_bytes)
-            elif mode == "trunked":
+            if mode == "trunked":
                 self._trunked_configs[cfg.id] = cfg
-            else:
-                self._push_queues[cfg.id] = asyncio.Queue(maxsize=64)
+                continue
+            capacity = PULL_BUFFER_CHUNKS if mode == "pull" else PUSH_BUFFER_CHUNKS
+            buffer = _UpstreamBuffer(cfg.id, deque(maxlen=capacity))
+            self._sources.append(buffer)
+            self._buffers[cfg.id] = buffer
+            if mode == "pull":
+                self._pulls[cfg.id] = _PullProcess(
+                    cfg=cfg,
+                    sample_rate=self._target_sample_rate,
+                    read_size_bytes=self._read_size_bytes,
+                    sink=lambda chunk, sid=cfg.id: self._deliver(sid, chunk),
+                )
+
+    def _initial_pulls(self) -> List[str]:
+        ordered = list(self._pulls)
+        return [
+            sid
+            for index, sid in enumerate(ordered)
+            if index == 0 or not self._pulls[sid].cfg.standby
+        ]
+
+    async def _start_pull(self, source_id: str, now: float) -> None:
+        proc = self._pulls[source_id]
+        if proc.task is not None and not proc.task.done():
+            # Still shutting down from an earlier demotion.
+            await proc.stop()
+        await proc.start()
+        self._running.add(source_id)
+        self._started_mono[source_id] = now
+        since = self._standby_since.pop(source_id, None)
+        if since is not None:
+            self._standby_seconds[source_id] = (
+                self._standby_seconds.get(source_id, 0.0) + now - since
+            )
+        self._states[source_id].standby = False
+
+    def _enter_standby(self, source_id: str, now: float) -> None:
+        self._running.discard(source_id)
+        self._standby_since[source_id] = now
+        self._failover_from.pop(source_id, None)
+        self._restored_since.pop(source_id, None)
+        state = self._states[source_id]
+        state.standby = True
+        state.connected = False
 
     async def start(self) -> None:
-        for proc in self._pulls.values():
-            await proc.start()
+        now = time.monotonic()
+        initial = set(self._initial_pulls())
+        for sid in self._pulls:
+            if sid in initial:
+                await self._start_pull(sid, now)
+            else:
+                self._enter_standby(sid, now)
         # Start trunked clients (lazy import to avoid circular deps)
         if self._trunked_configs:
             from .trunked_radio import TrunkedRadioClient
@@ -214,25 +300,30 @@ class MultiUpstreamSelector:
             for cfg_id, cfg in self._trunked_configs.items():
                 if cfg_id not in self._trunked_clients:
                     client = TrunkedRadioClient(
-                        cfg=cfg, target_sample_rate=self._target_sample_rate
+                        cfg=cfg,
+                        target_sample_rate=self._target_sample_rate,
+                        on_call=self._wake_trunked_reader,
                     )
                     self._trunked_clients[cfg_id] = client
                 await self._trunked_clients[cfg_id].start()
 
     async def stop(self) -> None:
-        for proc in self._pulls.values():
+        now = time.monotonic()
+        for sid, proc in self._pulls.items():
             await proc.stop()
+            since = self._standby_since.pop(sid, None)
+            if since is not None:
+                self._standby_seconds[sid] = (
+                    self._standby_seconds.get(sid, 0.0) + now - since
+                )
+        self._running.clear()
         # Stop trunked clients
         for client in self._trunked_clients.values():
             await client.stop()
-        # Drain push queues and reset states
-        for q in self._push_queues.values():
-            while not q.empty():
-                try:
-                    _ = q.get_nowait()
-                    q.task_done()
-                except asyncio.QueueEmpty:
-                    break
+        # Drop buffered audio and reset states
+        for buffer in self._sources:
+            buffer.chunks.clear()
+            buffer.last_data_mono = float("-inf")
         for state in self._states.values():
             state.connected = False
             state.active = False
@@ -242,6 +333,27 @@ class MultiUpstreamSelector:
         """Whether this selector has any trunked mode upstreams."""
         return bool(self._trunked_configs)
 
+    def _wake_trunked_reader(self) -> None:
+        waiter = self._trunked_waiter
+        if waiter is not None:
+            _resolve_waiter(waiter)
+
+    def _next_trunked_call(self) -> Optional[Tuple[str, "TrunkedCallChunk"]]:
+        clients = list(self._trunked_clients.items())
+        for offset in range(len(clients)):
+            index = (self._trunked_cursor + offset) % len(clients)
+            sid, client = clients[index]
+            chunk = client.read_nowait()
+            if chunk is None:
+                continue
+            self._trunked_cursor = index + 1
+            lag_ms = round((time.monotonic() - chunk.received_mono) * 1000.0, 1)
+            state = self._states[sid]
+            state.queueLagMs = lag_ms
+            state.maxQueueLagMs = max(state.maxQueueLagMs or 0.0, lag_ms)
+            return sid, chunk
+        return None
+
     async def read_trunked(
         self, timeout: float = 0.5
     ) -> Optional[Tuple[str, "TrunkedCallChunk"]]:
@@ -260,71 +372,159 @@ class MultiUpstreamSelector:
             if state is not None:
                 state.connected = client.connected
 
-        # Try to read from any trunked client with pending data
-        for sid, client in self._trunked_clients.items():
-            chunk = await client.read(timeout=timeout / max(len(self._trunked_clients), 1))
-            if chunk is not None:
-                # Mark active
-                for s_id, st in self._states.items():
-                    st.active = (s_id == sid)
-                return sid, chunk
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            picked = self._next_trunked_call()
+            if picked is not None:
+                winner_sid = picked[0]
+                for sid, st in self._states.items():
+                    st.active = sid == winner_sid
+                return picked
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            waiter = loop.create_future()
+            self._trunked_waiter = waiter
+            handle = loop.call_later(remaining, _resolve_waiter, waiter)
+            try:
+                await waiter
+            finally:
+                handle.cancel()
+                self._trunked_waiter = None
 
-        return None
+    def trunked_dropped_calls(self) -> Dict[str, int]:
+        """Calls dropped by trunked clients on queue overflow, per talk group."""
+        totals: Dict[str, int] = {}
+        for client in self._trunked_clients.values():
+            for talkgroup, count in client.dropped_calls().items():
+                totals[talkgroup] = totals.get(talkgroup, 0) + count
+        return totals
 
     def states(self) -> List[RemoteUpstreamState]:
         # Return a copy so callers can't mutate internal state
-        return [s.model_copy() for s in self._states.values()]
+        now = time.monotonic()
+        states = []
+        for sid, state in self._states.items():
+            saved = self._standby_seconds.get(sid, 0.0)
+            since = self._standby_since.get(sid)
+            if since is not None:
+                saved += now - since
+            update: Dict[str, object] = {"standbySeconds": round(saved, 1)}
+            client = self._trunked_clients.get(sid)
+            if client is not None:
+                update["pendingCalls"] = client.pending_count()
+            states.append(state.model_copy(update=update))
+        return states
+
+    def _deliver(self, source_id: str, data: bytes) -> None:
+        buffer = self._buffers[source_id]
+        buffer.chunks.append(data)
+        now = time.monotonic()
+        buffer.last_data_mono = now
+        stalled_at = self._failover_from.pop(source_id, None)
+        if stalled_at is not None:
+            self._states[source_id].lastFailoverMs = round(
+                (now - stalled_at) * 1000.0, 1
+            )
+        waiter = self._waiter
+        if waiter is not None:
+            _resolve_waiter(waiter)
 
     async def push_bytes(self, source_id: str, data: bytes) -> None:
-        q = self._push_queues.get(source_id)
-        if q is None:
+        if source_id in self._pulls or source_id not in self._buffers:
             raise ValueError("Unknown push source id")
-        try:
-            await q.put(data)
-        except asyncio.CancelledError:  # pragma: no cover - defensive
-            pass
+        self._deliver(source_id, data)
+
+    def _is_live(self, buffer: _UpstreamBuffer, now: float) -> bool:
+        return now - buffer.last_data_mono < UPSTREAM_FAILOVER_SECONDS
+
+    async def _supervise(self, now: float) -> None:
+        """Promote a standby pull when every source has stalled, and demote
+        promoted ones once a higher-priority source has recovered."""
+
+        healthy = any(self._is_live(buffer, now) for buffer in self._sources) or any(
+            now - self._started_mono[sid] < UPSTREAM_FAILOVER_SECONDS
+            for sid in self._running
+        )
+        if not healthy:
+            idle = [sid for sid in self._pulls if sid not in self._running]
+            if not idle:
+                return
+            sid = idle[0]
+            last_audio = max(buffer.last_data_mono for buffer in self._sources)
+            await self._start_pull(sid, now)
+            self._failover_from[sid] = (
+                last_audio if last_audio != float("-inf") else now
+            )
+            self._states[sid].failovers += 1
+            LOGGER.info("All upstreams stalled; starting standby upstream %s", sid)
+            return
+
+        initial = set(self._initial_pulls())
+        for index, buffer in enumerate(self._sources):
+            sid = buffer.source_id
+            if sid not in self._running or sid in initial:
+                continue
+            higher_live = any(
+                self._is_live(other, now) for other in self._sources[:index]
+            )
+            if not higher_live:
+                self._restored_since.pop(sid, None)
+                continue
+            restored = self._restored_since.setdefault(sid, now)
+            if now - restored >= STANDBY_RESTORE_SECONDS:
+                LOGGER.info(
+                    "Higher-priority upstream recovered; returning %s to standby",
+                    sid,
+                )
+                self._pulls[sid].stop_event.set()
+                self._enter_standby(sid, now)
+
+    def _select(self, now: float) -> Optional[Tuple[str, bytes]]:
+        active: Optional[_UpstreamBuffer] = None
+        for buffer in self._sources:
+            if now - buffer.last_data_mono < UPSTREAM_FAILOVER_SECONDS:
+                active = buffer
+                break
+        if active is None:
+            return None
+        for buffer in self._sources:
+            if buffer is not active and buffer.chunks:
+                buffer.chunks.clear()
+        if not active.chunks:
+            return None
+        return active.source_id, active.chunks.popleft()
 
     async def read(self, timeout: float = 0.5) -> Optional[Tuple[str, bytes]]:
         """Return the next available (source_id, bytes) tuple, or None on timeout."""
         # Refresh connection flags
-        now = time.monotonic()
         for sid, proc in self._pulls.items():
             state = self._states.get(sid)
-            if state is None:
-                continue
-            state.connected = bool(proc.connected)
-            if proc.connected and proc.last_bytes_mono > 0.0:
-                # Consider source connected if we saw bytes recently
-                state.lastBytesAt = None  # Backend stores precise timestamps elsewhere
-        # Build awaitables in priority order
-        queues: List[Tuple[str, asyncio.Queue[bytes]]] = []
-        # Pull queues first in priority order
-        for sid, proc in self._pulls.items():
-            queues.append((sid, proc.queue))
-        # Then push queues
-        for sid, q in self._push_queues.items():
-            queues.append((sid, q))
-        if not queues:
+            if state is not None:
+                state.connected = bool(proc.connected)
+        if self._running:
+            await self._supervise(time.monotonic())
+        if not self._sources:
             await asyncio.sleep(timeout)
             return None
-        # Wait on all queues concurrently with a timeout
-        tasks = [asyncio.create_task(q.get()) for _, q in queues]
-        try:
-            done, pending = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
-            if not done:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            picked = self._select(time.monotonic())
+            if picked is not None:
+                winner_sid = picked[0]
+                for sid, st in self._states.items():
+                    st.active = sid == winner_sid
+                return picked
+            remaining = deadline - loop.time()
+            if remaining <= 0:
                 return None
-            # Choose the completed task whose source has the highest priority order
-            winner_index = tasks.index(next(iter(done)))
-            winner_sid = queues[winner_index][0]
-            data = tasks[winner_index].result()
-            # Mark active
-            for sid, st in self._states.items():
-                st.active = (sid == winner_sid)
-            # Mark task done for the matched queue
-            queues[winner_index][1].task_done()
-            return winner_sid, data
-        finally:
-            for idx, t in enumerate(tasks):
-                if not t.done():
-                    t.cancel()
-
+            waiter = loop.create_future()
+            self._waiter = waiter
+            handle = loop.call_later(remaining, _resolve_waiter, waiter)
+            try:
+                await waiter
+            finally:
+                handle.cancel()
+                self._waiter = None
@@ -14,7 +14,7 @@ from contextlib import asynccontextmanager, suppress
 import time
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, Sequence
+from typing import Any, List, Optional, Sequence
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from fastapi import (
@@ -27,7 +27,6 @@ from fastapi import (
     WebSocket,
     WebSocketDisconnect,
 )
-from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
@@ -42,7 +41,7 @@ from .audio_regression import (
 from .auth import AuthManager, AuthenticationError
 from .config import ensure_logging_directories, load_config
 from .datetime_utils import isoformat_utc, optional_isoformat, parse_iso8601, utcnow
-from .database import StreamDatabase
+from .database import StreamDatabase, TranscriptionCursor
 from .logging_utils import configure_logging, record_frontend_event
 from .models import (
     AccessDescriptor,
@@ -59,13 +58,30 @@ from .models import (
     TranscriptionQueryResponse,
     TranscriptionResult,
     TranscriptionReviewStatus,
+    TranscriptionView,
     UpdateAlertsRequest,
     UpdateStreamRequest,
 )
 from .pager_formats import parse_pager_webhook_payload
-from .state_paths import LOG_DIR, PROJECT_ROOT, RECORDINGS_DIR, STATE_DIR, resolve_state_path
+from .recording_storage import recording_media_type
+from .state_paths import (
+    LOG_DIR,
+    PROJECT_ROOT,
+    RECORDINGS_DIR,
+    STATE_DIR,
+    resolve_recording_file,
+    resolve_state_path,
+)
 from .request_utils import describe_remote_client
-from .stream_manager import StreamManager
+from .stream_manager import (
+    EVENT_SUBPROTOCOL_JSON,
+    EVENT_SUBPROTOCOL_MSGPACK,
+    EventSubscription,
+    StreamEvent,
+    StreamManager,
+    encode_message_binary,
+    msgpack_available,
+)
 from .whisper_transcriber import (
     AbstractTranscriber,
     PassthroughTranscriber,
@@ -240,7 +256,9 @@ class AppState:
         self.config = config
         self.singleton_lock = singleton_lock
         self.auth_manager = AuthManager(config.access)
-        self.database = StreamDatabase(resolve_state_path("runtime.sqlite"))
+        self.database = StreamDatabase(
+            resolve_state_path("runtime.sqlite"), config=config.database
+        )
         self.transcriber = _create_transcriber(config)
         self.stream_manager = StreamManager(config, self.database, self.transcriber)
         self.fixture_set = fixture_set.strip() if fixture_set else ""
@@ -269,12 +287,22 @@ def get_frontend_dir() -> Path:
     return dist_dir
 
 
+def _optional_string_list(value: Any, field: str) -> Optional[List[str]]:
+    if value is None:
+        return None
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"{field} must be a list of strings")
+    return value
+
+
 async def stream_events(
     websocket: WebSocket,
     manager: StreamManager,
     auth: AuthManager,
     token: Optional[str],
     initial_role: AccessRole,
+    resume_from: Optional[int] = None,
+    resume_epoch: Optional[str] = None,
 ) -> None:
     client_label = describe_remote_client(websocket.headers, websocket.client)
     current_role = initial_role
@@ -284,7 +312,7 @@ async def stream_events(
         current_role.value,
     )
     # Declare queue before try to allow cleanup in finally even if registration fails
-    queue: Optional[asyncio.Queue] = None
+    queue: Optional[EventSubscription] = None
     # Shared connection health state
     connection_healthy = True
     last_pong_time = time.time()
@@ -306,13 +334,48 @@ async def stream_events(
                 await websocket.close(code=4401, reason=exc.message)
             return False
 
+    offered_subprotocols = websocket.scope.get("subprotocols") or []
+    subprotocol: Optional[str] = None
+    if EVENT_SUBPROTOCOL_MSGPACK in offered_subprotocols and msgpack_available():
+        subprotocol = EVENT_SUBPROTOCOL_MSGPACK
+    elif EVENT_SUBPROTOCOL_JSON in offered_subprotocols:
+        subprotocol = EVENT_SUBPROTOCOL_JSON
+    binary_frames = subprotocol == EVENT_SUBPROTOCOL_MSGPACK
+
+    async def send_message(message: dict[str, Any]) -> None:
+        if binary_frames:
+            await websocket.send_bytes(encode_message_binary(message))
+        else:
+            await websocket.send_text(json.dumps(message))
+
+    async def send_event(event: StreamEvent) -> None:
+        LOGGER.debug("Sending event %s to %s", event.type, client_label)
+        # Frames are cached on the event and shared by all connections.
+        if binary_frames:
+            await websocket.send_bytes(event.binary_frame())
+        else:
+            await websocket.send_text(event.text_frame())
+
+    async def send_snapshot() -> None:
+        snapshot = queue.select(manager.streams_snapshot_event())
+        if snapshot is not None:
+            await send_event(snapshot)
+
     async def send_events() -> None:
         try:
+            await send_message(
+                {
+                    "type": "session",
+                    "epoch": manager.broadcaster.epoch,
+                    "resumed": queue.resumed,
+                }
+            )
+            # A resumed connection gets the missed events from its queue;
+            # otherwise start from a full snapshot and follow with patches.
+            if not queue.resumed:
+                await send_snapshot()
             while True:
-                event = await queue.get()
-                payload = jsonable_encoder({"type": event.type, "data": event.payload})
-                LOGGER.debug("Sending event %s to %s", event.type, client_label)
-                await websocket.send_text(json.dumps(payload))
+                await send_event(await queue.get())
         except WebSocketDisconnect:
             pass
 
@@ -358,7 +421,7 @@ async def stream_events(
                     # We send application-level ping for client-side health tracking
                     # which the frontend responds to with pong.
                     payload = {"type": "ping", "timestamp": int(time.time() * 1000)}
-                    await websocket.send_text(json.dumps(payload))
+                    await send_message(payload)
                     consecutive_send_failures = 0  # Reset on success
                 except WebSocketDisconnect:
                     LOGGER.info(
@@ -402,7 +465,7 @@ async def stream_events(
         payload: dict[str, Any] = {"type": "error", "message": message}
         if request_id:
             payload["requestId"] = request_id
-        await websocket.send_text(json.dumps(payload))
+        await send_message(payload)
 
     async def handle_command(message: dict[str, Any]) -> None:
         action = message.get("type")
@@ -446,6 +509,17 @@ async def stream_events(
                 if not isinstance(stream_id, str) or not stream_id:
                     raise ValueError("streamId is required")
                 await manager.reset_stream(stream_id)
+            elif action == "resync_streams":
+                await send_snapshot()
+            elif action == "subscribe":
+                stream_ids = _optional_string_list(
+                    message.get("streamIds"), "streamIds"
+                )
+                event_types = _optional_string_list(
+                    message.get("eventTypes"), "eventTypes"
+                )
+                queue.set_topics(stream_ids, event_types)
+                await send_snapshot()
             elif action == "update_stream":
                 stream_id = message.get("streamId")
                 if not isinstance(stream_id, str) or not stream_id:
@@ -476,7 +550,7 @@ async def stream_events(
                 client_label,
                 request_id,
             )
-            await websocket.send_text(json.dumps(ack_payload))
+            await send_message(ack_payload)
 
     async def receive_commands() -> None:
         nonlocal last_pong_time
@@ -513,9 +587,13 @@ async def stream_events(
 
     try:
         # Register queue inside try to ensure cleanup on any exception
-        queue = await manager.broadcaster.register()
-        await websocket.accept()
-        LOGGER.debug("WebSocket connection accepted for %s", client_label)
+        queue = await manager.broadcaster.register(resume_from, resume_epoch)
+        await websocket.accept(subprotocol=subprotocol)
+        LOGGER.debug(
+            "WebSocket connection accepted for %s (resumed=%s)",
+            client_label,
+            queue.resumed,
+        )
 
         sender = asyncio.create_task(send_events())
         receiver = asyncio.create_task(receive_commands())
@@ -554,6 +632,15 @@ async def stream_events(
 FIXTURE_ENV_VAR = "WAVECAP_FIXTURES"
 
 
+def _parse_cursor(cursor: Optional[str]) -> Optional[TranscriptionCursor]:
+    if not cursor:
+        return None
+    try:
+        return TranscriptionCursor.decode(cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
 def _read_log_tail(path: Path, max_lines: int) -> list[str]:
     """Read the last N lines from a log file efficiently."""
     import collections
@@ -895,19 +982,95 @@ def create_app() -> FastAPI:
         after: Optional[str] = None,
         search: Optional[str] = None,
         order: str = "desc",
+        cursor: Optional[str] = None,
+        view: TranscriptionView = TranscriptionView.FULL,
     ) -> TranscriptionQueryResponse:
         before_dt = parse_iso8601(before) if before else None
         after_dt = parse_iso8601(after) if after else None
         normalized_order = order.lower()
+        if normalized_order not in {"asc", "desc", "relevance"}:
+            raise HTTPException(status_code=400, detail="Invalid order parameter")
+        try:
+            return await state.stream_manager.query_transcriptions(
+                stream_id,
+                limit=limit,
+                before=before_dt,
+                after=after_dt,
+                search=search.strip() if search else None,
+                order=normalized_order,
+                cursor=_parse_cursor(cursor),
+                view=view,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    @app.get(
+        "/api/combined-stream-views/{view_id}/transcriptions",
+        response_model=TranscriptionQueryResponse,
+    )
+    async def get_combined_transcriptions(
+        view_id: str,
+        state: AppState = Depends(get_state),
+        limit: int = 100,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        search: Optional[str] = None,
+        order: str = "desc",
+        cursor: Optional[str] = None,
+        view: TranscriptionView = TranscriptionView.FULL,
+    ) -> TranscriptionQueryResponse:
+        """Page the merged timeline of every stream in a combined view."""
+
+        combined_view = next(
+            (item for item in state.config.combinedStreamViews if item.id == view_id),
+            None,
+        )
+        if combined_view is None:
+            raise HTTPException(status_code=404, detail="Combined view not found")
+        normalized_order = order.lower()
         if normalized_order not in {"asc", "desc"}:
             raise HTTPException(status_code=400, detail="Invalid order parameter")
         return await state.stream_manager.query_transcriptions(
-            stream_id,
+            None,
             limit=limit,
-            before=before_dt,
-            after=after_dt,
+            before=parse_iso8601(before) if before else None,
+            after=parse_iso8601(after) if after else None,
             search=search.strip() if search else None,
             order=normalized_order,
+            stream_ids=combined_view.streamIds,
+            cursor=_parse_cursor(cursor),
+            view=view,
+        )
+
+    @app.get(
+        "/api/transcriptions/search",
+        response_model=TranscriptionQueryResponse,
+    )
+    async def search_transcriptions(
+        q: str,
+        state: AppState = Depends(get_state),
+        limit: int = 100,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        order: str = "relevance",
+        view: TranscriptionView = TranscriptionView.FULL,
+    ) -> TranscriptionQueryResponse:
+        """Full-text search across every stream."""
+
+        query = q.strip()
+        if not query:
+            raise HTTPException(status_code=400, detail="Search query is required")
+        normalized_order = order.lower()
+        if normalized_order not in {"asc", "desc", "relevance"}:
+            raise HTTPException(status_code=400, detail="Invalid order parameter")
+        return await state.stream_manager.query_transcriptions(
+            None,
+            limit=limit,
+            before=parse_iso8601(before) if before else None,
+            after=parse_iso8601(after) if after else None,
+            search=query,
+            order=normalized_order,
+            view=view,
         )
 
     @app.patch(
@@ -953,10 +1116,11 @@ def create_app() -> FastAPI:
                     "Skipping transcription %s because no recording is associated", result.id
                 )
                 continue
-            source = RECORDINGS_DIR / Path(result.recordingUrl).name
-            if not source.exists():
+            name = Path(result.recordingUrl).name
+            source = resolve_recording_file(name, RECORDINGS_DIR)
+            if source is None:
                 LOGGER.warning(
-                    "Audio file missing for transcription %s: %s", result.id, source
+                    "Audio file missing for transcription %s: %s", result.id, name
                 )
                 continue
             timestamp = isoformat_utc(result.timestamp)
@@ -1058,10 +1222,13 @@ def create_app() -> FastAPI:
             archive.writestr("transcriptions.jsonl", "\n".join(lines))
             for result in results:
                 if result.recordingUrl:
-                    filename = Path(result.recordingUrl).name
-                    file_path = RECORDINGS_DIR / filename
-                    if file_path.exists():
-                        archive.write(file_path, arcname=f"recordings/{filename}")
+                    file_path = resolve_recording_file(
+                        Path(result.recordingUrl).name, RECORDINGS_DIR
+                    )
+                    if file_path is not None:
+                        archive.write(
+                            file_path, arcname=f"recordings/{file_path.name}"
+                        )
         buffer.seek(0)
         filename = f"reviewed-transcriptions-{utcnow().strftime('%Y%m%d-%H%M%S')}.zip"
         headers = {"Content-Disposition": f"attachment; filename={filename}"}
@@ -1172,8 +1339,18 @@ def create_app() -> FastAPI:
         except AuthenticationError as exc:
             await websocket.close(code=4401, reason=exc.message)
             return
+        try:
+            since = int(websocket.query_params["since"])
+        except (KeyError, ValueError):
+            since = None
         await stream_events(
-            websocket, state.stream_manager, state.auth_manager, token, role
+            websocket,
+            state.stream_manager,
+            state.auth_manager,
+            token,
+            role,
+            resume_from=since,
+            resume_epoch=websocket.query_params.get("epoch"),
         )
 
     @app.post("/api/pager-feeds/{stream_id}")
@@ -1208,6 +1385,14 @@ def create_app() -> FastAPI:
     async def health() -> dict:
         return {"status": "ok"}
 
+    @app.get("/api/transcription/metrics")
+    async def transcription_metrics(state: AppState = Depends(get_state)) -> dict:
+        return state.stream_manager.get_transcription_metrics()
+
+    @app.get("/api/database/metrics")
+    async def database_metrics(state: AppState = Depends(get_state)) -> dict:
+        return state.database.metrics()
+
     @app.post("/api/ingest/{stream_id}/audio")
     async def ingest_remote_audio(
         stream_id: str,
@@ -1252,10 +1437,17 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=500, detail="Ingest failed") from exc
         return Response(status_code=202)
 
-    if RECORDINGS_DIR.exists():
-        app.mount(
-            "/recordings", StaticFiles(directory=RECORDINGS_DIR), name="recordings"
-        )
+    @app.api_route(
+        "/recordings/{name}", methods=["GET", "HEAD"], include_in_schema=False
+    )
+    async def get_recording(name: str) -> FileResponse:
+        """Serve a stored recording, with range support for seeking."""
+
+        # Older URLs keep working after a recording is transcoded.
+        path = resolve_recording_file(name, RECORDINGS_DIR)
+        if path is None:
+            raise HTTPException(status_code=404, detail="Recording not found")
+        return FileResponse(path, media_type=recording_media_type(path))
 
     frontend_dir = get_frontend_dir()
 
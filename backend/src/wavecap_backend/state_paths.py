@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 
 def _looks_like_checkout_root(path: Path) -> bool:
@@ -63,10 +64,46 @@ RECORDINGS_DIR = STATE_DIR / "recordings"
 LOG_DIR = STATE_DIR / "logs"
 
 
+# File suffixes of stored recordings, one per supported format.
+RECORDING_SUFFIXES = (".wav", ".flac", ".opus")
+
+
 def resolve_state_path(*parts: str) -> Path:
     """Return the path within the state directory for the given parts."""
 
     return STATE_DIR.joinpath(*parts)
 
 
-__all__ = ["STATE_DIR", "RECORDINGS_DIR", "LOG_DIR", "resolve_state_path"]
+def resolve_recording_file(name: str, directory: Optional[Path] = None) -> Optional[Path]:
+    """Return the stored file for recording *name*, whatever its format.
+
+    Recordings may be transcoded after their URL was handed out, so a name
+    that no longer exists falls back to the same stem with another recording
+    suffix. Returns ``None`` for missing files and for names that are not
+    plain file names.
+    """
+
+    root = RECORDINGS_DIR if directory is None else directory
+    if not name or Path(name).name != name:
+        return None
+    candidate = root / name
+    if candidate.is_file():
+        return candidate
+    stem, suffix = candidate.stem, candidate.suffix.lower()
+    if suffix not in RECORDING_SUFFIXES:
+        return None
+    for alternative in RECORDING_SUFFIXES:
+        sibling = root / f"{stem}{alternative}"
+        if alternative != suffix and sibling.is_file():
+            return sibling
+    return None
+
+
+__all__ = [
+    "STATE_DIR",
+    "RECORDINGS_DIR",
+    "RECORDING_SUFFIXES",
+    "LOG_DIR",
+    "resolve_recording_file",
+    "resolve_state_path",
+]
@@ -5,18 +5,33 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import uuid
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import AsyncIterator, Callable, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
+from fastapi.encoders import jsonable_encoder
 from pydantic_core import to_jsonable_python
 
 from .alerts import TranscriptionAlertEvaluator
 from .datetime_utils import utcnow
-from .database import StreamDatabase
+from .database import StreamDatabase, TranscriptionCursor
 from .models import (
     AlertsConfig,
     AppConfig,
@@ -31,11 +46,14 @@ from .models import (
     TranscriptionQueryResponse,
     TranscriptionResult,
     TranscriptionReviewStatus,
+    TranscriptionView,
     UpdateStreamRequest,
 )
-from .state_paths import RECORDINGS_DIR
+from .state_paths import RECORDING_SUFFIXES, RECORDINGS_DIR
 from .stream_worker import StreamWorker
+from .overload_controller import OverloadTransition
 from .transcription_executor import TranscriptionExecutor
+from .transcription_scheduler import TranscriptionScheduler
 from .whisper_transcriber import AbstractTranscriber
 from .llm_corrector import AbstractLLMCorrector, create_corrector
 from .stream_defaults import (
@@ -44,8 +62,17 @@ from .stream_defaults import (
     resolve_recording_retention_seconds,
 )
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
 LOGGER = logging.getLogger(__name__)
 
+# WebSocket subprotocols for event frames. Clients that offer none get JSON.
+EVENT_SUBPROTOCOL_JSON = "wavecap.json"
+EVENT_SUBPROTOCOL_MSGPACK = "wavecap.msgpack"
+
 RECORDING_STARTED_MESSAGE = "Recording and transcription started"
 RECORDING_STOPPED_MESSAGE = "Recording and transcription stopped"
 UPSTREAM_DISCONNECTED_MESSAGE = "Lost connection to upstream stream"
@@ -186,57 +213,275 @@ def _format_retry_phrase(delay_seconds: float) -> str:
     unit = "minutes"
     return f"retrying in {rounded:.1f} {unit}"
 
+def msgpack_available() -> bool:
+    return msgpack is not None
+
+
+def encode_message_text(message: Any) -> str:
+    return json.dumps(jsonable_encoder(message))
+
+
+def encode_message_binary(message: Any) -> bytes:
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(jsonable_encoder(message), use_bin_type=True)
+
+
 class StreamEvent:
-    def __init__(self, event_type: str, payload: dict):
+    """A WebSocket event shared by every subscriber.
+
+    Wire frames are built on first use and cached, so an event is serialised
+    once per encoding no matter how many connections receive it. The payload
+    must not be modified after the event is published.
+    """
+
+    __slots__ = (
+        "type",
+        "payload",
+        "revision",
+        "stream_id",
+        "seq",
+        "_text",
+        "_binary",
+    )
+
+    def __init__(
+        self,
+        event_type: str,
+        payload: Any,
+        *,
+        revision: Optional[int] = None,
+        stream_id: Optional[str] = None,
+        seq: Optional[int] = None,
+    ):
         self.type = event_type
         self.payload = payload
+        self.revision = revision
+        self.stream_id = stream_id
+        # Assigned by StreamEventBroadcaster.publish; lets clients resume.
+        self.seq = seq
+        self._text: Optional[str] = None
+        self._binary: Optional[bytes] = None
+
+    def _message(self) -> Dict[str, Any]:
+        message: Dict[str, Any] = {"type": self.type, "data": self.payload}
+        if self.revision is not None:
+            message["revision"] = self.revision
+        if self.seq is not None:
+            message["seq"] = self.seq
+        return message
+
+    def text_frame(self) -> str:
+        if self._text is None:
+            self._text = encode_message_text(self._message())
+        return self._text
+
+    def binary_frame(self) -> bytes:
+        if self._binary is None:
+            self._binary = encode_message_binary(self._message())
+        return self._binary
+
+
+# State events describe the current state of streams rather than something
+# that happened, so a subscriber only ever needs the newest one.
+STATE_EVENT_TYPES = frozenset({"streams_update", "streams_patch"})
+
+
+def _coalesce_state_events(older: StreamEvent, newer: StreamEvent) -> StreamEvent:
+    """Fold *newer* into a still-queued *older* event of the same type.
+
+    The result takes the older event's place in the queue and so keeps its
+    sequence number: a client that resumes after receiving it must still be
+    replayed the events queued behind it.
+    """
+
+    if newer.type != "streams_patch":
+        return StreamEvent(
+            newer.type, newer.payload, revision=newer.revision, seq=older.seq
+        )
+    merged: Dict[str, dict] = {entry["id"]: entry for entry in older.payload}
+    for entry in newer.payload:
+        previous = merged.get(entry["id"])
+        merged[entry["id"]] = {**previous, **entry} if previous else entry
+    return StreamEvent(
+        newer.type, list(merged.values()), revision=newer.revision, seq=older.seq
+    )
+
+
+class EventSubscription:
+    """Event queue for one WebSocket connection.
+
+    A subscription can be narrowed to some stream IDs and event types. Stream
+    IDs only narrow per-stream events: stream state stays complete so a
+    client's stream list keeps updating, and transcriptions that raised an
+    alert are delivered for every stream. When the connection falls behind,
+    queued state events are merged with newer ones instead of piling up, and
+    overflow drops the oldest other event.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max(1, max_size)
+        self._events: Deque[StreamEvent] = deque()
+        self._pending_state: Dict[str, StreamEvent] = {}
+        self._ready = asyncio.Event()
+        # True when the connection picked up where a previous one left off.
+        self.resumed = False
+        self.stream_ids: Optional[FrozenSet[str]] = None
+        self.event_types: Optional[FrozenSet[str]] = None
 
+    @property
+    def topics(self) -> Tuple[Optional[FrozenSet[str]], Optional[FrozenSet[str]]]:
+        return self.stream_ids, self.event_types
 
-class StreamEventBroadcaster:
-    """Simple pub/sub helper for websocket updates."""
+    def set_topics(
+        self,
+        stream_ids: Optional[Iterable[str]] = None,
+        event_types: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Limit delivery to *stream_ids* and *event_types*; ``None`` means all."""
 
-    def __init__(self, max_queue_size: int = 256) -> None:
-        self._subscribers: List[asyncio.Queue[StreamEvent]] = []
-        self._lock = asyncio.Lock()
-        self._max_queue_size = max_queue_size
+        self.stream_ids = None if stream_ids is None else frozenset(stream_ids)
+        self.event_types = None if event_types is None else frozenset(event_types)
 
-    async def publish(self, event: StreamEvent) -> None:
-        async with self._lock:
-            subscribers = list(self._subscribers)
+    def select(self, event: StreamEvent) -> Optional[StreamEvent]:
+        """Return *event* narrowed to this subscription, or ``None`` to skip it."""
 
-        for queue in subscribers:
-            self._enqueue_event(queue, event)
+        if self.event_types is not None and event.type not in self.event_types:
+            return None
+        stream_ids = self.stream_ids
+        if stream_ids is None:
+            return event
+        if event.stream_id is None or event.stream_id in stream_ids:
+            return event
+        if event.type == "transcription" and event.payload.get("alerts"):
+            return event
+        return None
+
+    def put(self, event: StreamEvent) -> None:
+        if event.type in STATE_EVENT_TYPES:
+            pending = self._pending_state.get(event.type)
+            if pending is not None:
+                merged = _coalesce_state_events(pending, event)
+                self._events[self._events.index(pending)] = merged
+                self._pending_state[event.type] = merged
+                return
+        if len(self._events) >= self._max_size:
+            self._drop_oldest()
+        self._events.append(event)
+        if event.type in STATE_EVENT_TYPES:
+            self._pending_state[event.type] = event
+        self._ready.set()
+
+    def _drop_oldest(self) -> None:
+        victim = next(
+            (event for event in self._events if event.type not in STATE_EVENT_TYPES),
+            self._events[0],
+        )
+        self._events.remove(victim)
+        if self._pending_state.get(victim.type) is victim:
+            del self._pending_state[victim.type]
+        LOGGER.warning("Dropping oldest websocket event for slow subscriber")
 
-    def _enqueue_event(
-        self, queue: asyncio.Queue[StreamEvent], event: StreamEvent
-    ) -> None:
-        try:
-            queue.put_nowait(event)
-            return
-        except asyncio.QueueFull:
-            try:
-                queue.get_nowait()
-            except asyncio.QueueEmpty:
-                LOGGER.debug("WebSocket queue overflow resolved without drop")
-            else:
-                LOGGER.warning("Dropping oldest websocket event for slow subscriber")
-        try:
-            queue.put_nowait(event)
-        except asyncio.QueueFull:
-            LOGGER.warning(
-                "Failed to enqueue websocket event after dropping oldest entry"
-            )
+    def get_nowait(self) -> StreamEvent:
+        if not self._events:
+            raise asyncio.QueueEmpty
+        event = self._events.popleft()
+        if self._pending_state.get(event.type) is event:
+            del self._pending_state[event.type]
+        return event
 
-    async def register(self) -> asyncio.Queue[StreamEvent]:
-        queue: asyncio.Queue[StreamEvent] = asyncio.Queue(self._max_queue_size)
-        async with self._lock:
-            self._subscribers.append(queue)
-        return queue
+    async def get(self) -> StreamEvent:
+        while not self._events:
+            self._ready.clear()
+            await self._ready.wait()
+        return self.get_nowait()
 
-    async def unregister(self, queue: asyncio.Queue[StreamEvent]) -> None:
-        async with self._lock:
-            if queue in self._subscribers:
-                self._subscribers.remove(queue)
+    def empty(self) -> bool:
+        return not self._events
+
+    def qsize(self) -> int:
+        return len(self._events)
+
+
+class StreamEventBroadcaster:
+    """Simple pub/sub helper for websocket updates.
+
+    Every published event gets the next sequence number and is kept in a
+    bounded replay buffer, so a client that reconnects with the last number
+    it saw receives only the events it missed. The subscriber list is
+    replaced rather than mutated, so publishing reads it without a lock.
+    """
+
+    def __init__(self, max_queue_size: int = 256, replay_size: int = 1024) -> None:
+        self._subscribers: Tuple[EventSubscription, ...] = ()
+        self._max_queue_size = max_queue_size
+        self._history: Deque[StreamEvent] = deque(maxlen=max(0, replay_size))
+        self._last_seq = 0
+        # Sequence numbers restart with the process; the epoch tells clients
+        # that numbers from before a restart cannot be resumed.
+        self.epoch = uuid.uuid4().hex[:12]
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    async def publish(self, event: StreamEvent) -> None:
+        self._last_seq += 1
+        event.seq = self._last_seq
+        self._history.append(event)
+        subscribers = self._subscribers
+        if not subscribers:
+            return
+        # Subscribers with the same topics share one narrowed event, and each
+        # distinct event is serialised once before it is fanned out.
+        selected: Dict[Tuple[Any, Any], Optional[StreamEvent]] = {}
+        for subscription in subscribers:
+            topics = subscription.topics
+            if topics not in selected:
+                narrowed = subscription.select(event)
+                if narrowed is not None:
+                    narrowed.text_frame()
+                selected[topics] = narrowed
+            narrowed = selected[topics]
+            if narrowed is not None:
+                subscription.put(narrowed)
+
+    def _missed_events(self, since: int) -> Optional[List[StreamEvent]]:
+        """Return events after *since*, or ``None`` if some were evicted."""
+
+        if since > self._last_seq:
+            return None
+        if since == self._last_seq:
+            return []
+        if not self._history or self._history[0].seq > since + 1:
+            return None
+        return [event for event in self._history if event.seq > since]
+
+    async def register(
+        self, since: Optional[int] = None, epoch: Optional[str] = None
+    ) -> EventSubscription:
+        """Add a subscriber, replaying missed events when it is resuming.
+
+        *since* and *epoch* are the last sequence number and epoch a client
+        saw. When every later event is still buffered (and fits in the
+        subscriber's queue) those events are queued and the subscription is
+        marked ``resumed``; otherwise the client needs a fresh snapshot.
+        """
+
+        subscription = EventSubscription(self._max_queue_size)
+        if since is not None and epoch == self.epoch:
+            missed = self._missed_events(since)
+            if missed is not None and len(missed) <= self._max_queue_size:
+                for event in missed:
+                    subscription.put(event)
+                subscription.resumed = True
+        self._subscribers = self._subscribers + (subscription,)
+        return subscription
+
+    async def unregister(self, subscription: EventSubscription) -> None:
+        self._subscribers = tuple(
+            item for item in self._subscribers if item is not subscription
+        )
 
     @property
     def subscriber_count(self) -> int:
@@ -270,12 +515,27 @@ class StreamManager:
             worker_count=concurrency, queue_size=queue_size
         )
         self._owns_executor = transcription_executor is None
+        self._scheduler = TranscriptionScheduler(
+            executor=self._executor,
+            transcriber=transcriber,
+            max_batch_size=config.whisper.batchMaxSize,
+            max_wait_seconds=config.whisper.batchWindowSeconds,
+            priority_weight=config.whisper.priorityWeight,
+            # Bound each stream's backlog like the executor bounds its queue.
+            max_pending_per_stream=queue_size,
+        )
         self._llm_corrector: AbstractLLMCorrector = create_corrector(config.llm)
         self._start_triggers: Dict[str, SystemEventTrigger] = {}
         self._stop_triggers: Dict[str, SystemEventTrigger] = {}
         self._last_event_timestamps: Dict[str, datetime] = {}
         self._event_locks: Dict[str, asyncio.Lock] = {}
-        self._last_streams_signature: Optional[str] = None
+        # Last broadcast summary of each stream, used to diff streams_patch
+        # events and to serve snapshots without re-dumping every stream.
+        self._stream_summaries: Dict[str, Dict[str, Any]] = {}
+        self._stream_versions: Dict[str, int] = {}
+        self._streams_revision = 0
+        self._streams_snapshot: Optional[StreamEvent] = None
+        self._streams_broadcast_lock = asyncio.Lock()
         self._retention_task: Optional[asyncio.Task[None]] = None
         self._retention_stop: Optional[asyncio.Event] = None
         # Auto-restart tracking for streams that fail with errors
@@ -308,9 +568,18 @@ class StreamManager:
         await self.database.update_stream_activity(stream_id, timestamp)
 
     async def _load_recent_transcriptions(
-        self, stream_id: str, limit: int
+        self, stream: Stream, limit: int
     ) -> List[TranscriptionResult]:
-        return await self.database.load_recent_transcriptions(stream_id, limit)
+        # Pager threads group messages by incident, so only they need the
+        # full rows; every other stream renders from the summary view.
+        view = (
+            TranscriptionView.FULL
+            if stream.source == StreamSource.PAGER
+            else TranscriptionView.SUMMARY
+        )
+        return await self.database.load_recent_transcriptions(
+            stream.id, limit, view=view
+        )
 
     def _create_worker(self, stream: Stream) -> StreamWorker:
         factory = self._worker_factory or StreamWorker
@@ -342,12 +611,14 @@ class StreamManager:
             stream=stream,
             transcriber=self.transcriber,
             transcription_executor=self._executor,
+            transcription_scheduler=self._scheduler,
             database=self.database,
             alert_evaluator=self.alert_evaluator,
             on_transcription=self._handle_transcription,
             on_status_change=self._handle_status_change,
             on_upstream_disconnect=self._handle_upstream_disconnect,
             on_upstream_reconnect=self._handle_upstream_reconnect,
+            on_overload_change=self._handle_overload_change,
             config=self.config.whisper,
             initial_prompt=prompt_override,
             remote_upstreams=remote_upstreams,
@@ -412,7 +683,7 @@ class StreamManager:
         if worker_to_stop:
             await worker_to_stop.stop()
         if should_broadcast or worker_to_start or worker_to_stop:
-            await self._broadcast_streams()
+            await self._broadcast_streams(stream_ids=[stream_id])
 
     def _build_stream_from_config(
         self, stream_config: StreamConfig, existing: Optional[Stream]
@@ -478,6 +749,7 @@ class StreamManager:
                 webhookToken=None,
                 ignoreFirstSeconds=ignore_seconds,
                 recordingRetentionSeconds=retention_seconds,
+                recordingFormat=stream_config.recordingFormat,
                 baseLocation=stream_config.baseLocation,
             )
         updates = {
@@ -492,6 +764,7 @@ class StreamManager:
             "enabled": bool(stream_config.enabled),
             "baseLocation": stream_config.baseLocation,
             "recordingRetentionSeconds": retention_seconds,
+            "recordingFormat": stream_config.recordingFormat,
         }
         return existing.model_copy(update=updates)
 
@@ -515,6 +788,7 @@ class StreamManager:
             webhookToken=None,
             ignoreFirstSeconds=ignore_seconds,
             recordingRetentionSeconds=retention_seconds,
+            recordingFormat=stream_config.recordingFormat,
             baseLocation=stream_config.baseLocation,
         )
         updates = {
@@ -528,12 +802,17 @@ class StreamManager:
             "enabled": bool(stream_config.enabled),
             "baseLocation": stream_config.baseLocation,
             "recordingRetentionSeconds": retention_seconds,
+            "recordingFormat": stream_config.recordingFormat,
             # upstreams metadata populated at runtime
         }
         return base.model_copy(update=updates)
 
     async def initialize(self) -> None:
         await self._executor.start()
+        await self._scheduler.start()
+        await self.database.initialize()
+        if self.database.needs_recording_import:
+            await self._import_recordings()
         persisted_streams = {
             stream.id: stream for stream in await self.database.load_streams()
         }
@@ -546,7 +825,7 @@ class StreamManager:
                     stream_id,
                 )
                 await self._delete_stream(stream_id)
-                self._delete_recordings(stream_id)
+                await self._delete_recordings(stream_id)
                 persisted_streams.pop(stream_id, None)
 
         streams: List[Stream] = []
@@ -560,7 +839,7 @@ class StreamManager:
                     stream_config.source,
                 )
                 await self._delete_stream(existing.id)
-                self._delete_recordings(existing.id)
+                await self._delete_recordings(existing.id)
                 existing = None
             if stream_config.source == StreamSource.PAGER:
                 stream = self._build_stream_from_config(stream_config, existing)
@@ -581,7 +860,7 @@ class StreamManager:
                     streams_to_activate.append(stream)
                 elif stream.status != StreamStatus.STOPPED:
                     stream.status = StreamStatus.STOPPED
-            transcriptions = await self._load_recent_transcriptions(stream.id, limit=100)
+            transcriptions = await self._load_recent_transcriptions(stream, limit=100)
             stream.transcriptions = transcriptions
             if transcriptions:
                 latest_timestamp = transcriptions[0].timestamp
@@ -617,6 +896,28 @@ class StreamManager:
         await self._prune_expired_recordings()
         self._start_retention_task()
 
+    def get_transcription_metrics(self) -> Dict[str, Any]:
+        """Return batching and queue delay statistics for Whisper inference."""
+
+        metrics = self._scheduler.metrics()
+        trunked: Dict[str, Any] = {}
+        speech_gate: Dict[str, Any] = {}
+        for stream_id, worker in self.workers.items():
+            gate_stats = worker.get_speech_gate_metrics()
+            if gate_stats is not None:
+                speech_gate[stream_id] = gate_stats
+            stream = self.streams.get(stream_id)
+            if stream is None or stream.source != StreamSource.REMOTE:
+                continue
+            stats = worker.get_trunked_metrics()
+            if stats is not None:
+                trunked[stream_id] = stats
+        if trunked:
+            metrics["trunked"] = trunked
+        if speech_gate:
+            metrics["speechGate"] = speech_gate
+        return metrics
+
     def get_streams(self) -> List[Stream]:
         results: List[Stream] = []
         for s in self.streams.values():
@@ -681,7 +982,7 @@ class StreamManager:
             updated_stream = stream
 
         if should_broadcast:
-            await self._broadcast_streams()
+            await self._broadcast_streams(stream_ids=[stream_id])
 
         return updated_stream
 
@@ -754,8 +1055,10 @@ class StreamManager:
             await self._save_stream(stream)
         if worker:
             await worker.stop()
-        self._delete_recordings(stream_id)
-        await self._broadcast_streams(include_transcriptions=True)
+        await self._delete_recordings(stream_id)
+        await self._broadcast_streams(
+            include_transcriptions=True, stream_ids=[stream_id]
+        )
 
     async def update_alerts(self, config: AlertsConfig) -> None:
         self.config.alerts = config
@@ -763,12 +1066,16 @@ class StreamManager:
 
     async def query_transcriptions(
         self,
-        stream_id: str,
+        stream_id: Optional[str],
         limit: int = 100,
         before: Optional[datetime] = None,
         after: Optional[datetime] = None,
         search: Optional[str] = None,
         order: str = "desc",
+        *,
+        stream_ids: Optional[Sequence[str]] = None,
+        cursor: Optional[TranscriptionCursor] = None,
+        view: TranscriptionView = TranscriptionView.FULL,
     ) -> TranscriptionQueryResponse:
         transcriptions, has_more = await self.database.query_transcriptions(
             stream_id,
@@ -777,12 +1084,40 @@ class StreamManager:
             after,
             search,
             order,
+            stream_ids=stream_ids,
+            cursor=cursor,
+            view=view,
         )
         order_normalized = order.lower()
+        if cursor is not None:
+            scanning_back = cursor.direction == "before"
+            # The cursor row itself lies on the other side of this page.
+            has_more_before = has_more if scanning_back else True
+            has_more_after = True if scanning_back else has_more
+        else:
+            has_more_before = has_more if order_normalized != "asc" else False
+            has_more_after = has_more if order_normalized == "asc" else False
+        older_cursor: Optional[str] = None
+        newer_cursor: Optional[str] = None
+        if transcriptions and order_normalized != "relevance":
+            oldest, newest = transcriptions[0], transcriptions[-1]
+            if order_normalized != "asc":
+                oldest, newest = newest, oldest
+            if has_more_before:
+                older_cursor = TranscriptionCursor(
+                    oldest.timestamp, oldest.id, "before"
+                ).encode()
+            if has_more_after:
+                newer_cursor = TranscriptionCursor(
+                    newest.timestamp, newest.id, "after"
+                ).encode()
+        ascending = order_normalized == "asc"
         return TranscriptionQueryResponse(
             transcriptions=transcriptions,
-            hasMoreAfter=has_more if order_normalized == "asc" else False,
-            hasMoreBefore=has_more if order_normalized != "asc" else False,
+            hasMoreAfter=has_more_after,
+            hasMoreBefore=has_more_before,
+            nextCursor=newer_cursor if ascending else older_cursor,
+            prevCursor=older_cursor if ascending else newer_cursor,
         )
 
     def iter_live_audio(self, stream_id: str) -> AsyncIterator[bytes]:
@@ -805,7 +1140,11 @@ class StreamManager:
             reviewer,
         )
         await self.broadcaster.publish(
-            StreamEvent("transcription", result.model_dump(by_alias=True))
+            StreamEvent(
+                "transcription",
+                result.model_dump(by_alias=True),
+                stream_id=result.streamId,
+            )
         )
         return result
 
@@ -825,14 +1164,55 @@ class StreamManager:
             raise ValueError("Stream does not accept pager messages")
         return await self.database.export_pager_messages(stream_id)
 
-    def _delete_recordings(self, stream_id: str) -> None:
-        if not RECORDINGS_DIR.exists():
-            return
-        for file in RECORDINGS_DIR.glob(f"stream-{stream_id}-*.wav"):
+    async def _delete_recordings(self, stream_id: str) -> None:
+        names = await self.database.stream_recordings(stream_id)
+        removed = await asyncio.to_thread(self._unlink_recordings, names)
+        await self.database.remove_recordings(removed)
+
+    @staticmethod
+    def _unlink_recordings(names: Sequence[str]) -> List[str]:
+        """Delete recording files, returning the names that are now gone."""
+
+        removed: List[str] = []
+        for name in names:
+            path = RECORDINGS_DIR / name
             try:
-                file.unlink()
+                path.unlink(missing_ok=True)
             except OSError:
-                LOGGER.warning("Failed to remove recording %s", file)
+                LOGGER.warning("Failed to remove recording %s", path)
+                continue
+            removed.append(name)
+        return removed
+
+    async def _import_recordings(self) -> None:
+        """Index recordings written before the recording index existed."""
+
+        entries = await asyncio.to_thread(self._scan_recordings)
+        await self.database.import_recordings(entries)
+        if entries:
+            LOGGER.info("Indexed %d existing recording(s)", len(entries))
+
+    @classmethod
+    def _scan_recordings(cls) -> List[Tuple[str, str, datetime, int]]:
+        if not RECORDINGS_DIR.exists():
+            return []
+        entries: List[Tuple[str, str, datetime, int]] = []
+        with os.scandir(RECORDINGS_DIR) as iterator:
+            for entry in iterator:
+                stream_id = cls._extract_stream_id_from_recording(Path(entry.name))
+                if not stream_id:
+                    continue
+                try:
+                    stat_result = entry.stat()
+                except OSError:
+                    continue
+                created_at = datetime.fromtimestamp(
+                    stat_result.st_mtime, tz=timezone.utc
+                )
+                entries.append(
+                    (entry.name, stream_id, created_at, stat_result.st_size)
+                )
+        return entries
 
     def _start_retention_task(self) -> None:
         if self._retention_task and not self._retention_task.done():
@@ -870,11 +1250,11 @@ class StreamManager:
             pass
 
     async def _prune_expired_recordings(self) -> None:
-        """Remove on-disk recordings once they exceed their retention window."""
+        """Remove on-disk recordings once they exceed their retention window.
 
-        directory = RECORDINGS_DIR
-        if not directory.exists():
-            return
+        Expired files are looked up in the recording index a batch at a time,
+        so a sweep only touches recordings that are actually due for removal.
+        """
 
         async with self._lock:
             retention_overrides = {
@@ -882,44 +1262,44 @@ class StreamManager:
                 for stream_id, stream in self.streams.items()
             }
 
-        now_ts = utcnow().timestamp()
-        for file_path in directory.glob("stream-*.wav"):
-            stream_id = self._extract_stream_id_from_recording(file_path)
-            if not stream_id:
-                continue
-            if stream_id in retention_overrides:
-                retention = retention_overrides[stream_id]
-            else:
-                retention = float(DEFAULT_RECORDING_RETENTION_SECONDS)
-            if retention is None:
-                continue
-            try:
-                stat_result = file_path.stat()
-            except OSError:
-                continue
-            age_seconds = now_ts - stat_result.st_mtime
-            if age_seconds < retention:
-                continue
-            try:
-                file_path.unlink()
-            except OSError:
-                LOGGER.warning("Failed to remove expired recording %s", file_path)
-            else:
-                LOGGER.debug(
-                    "Removed expired recording %s (age %.0fs >= %.0fs retention)",
-                    file_path,
-                    age_seconds,
-                    retention,
-                )
+        now = utcnow()
+        cutoffs = {
+            stream_id: None if retention is None else now - timedelta(seconds=retention)
+            for stream_id, retention in retention_overrides.items()
+        }
+        default_cutoff = now - timedelta(seconds=DEFAULT_RECORDING_RETENTION_SECONDS)
+
+        removed_count = 0
+        removed_bytes = 0
+        while True:
+            expired = await self.database.expired_recordings(cutoffs, default_cutoff)
+            if not expired:
+                break
+            sizes = dict(expired)
+            removed = await asyncio.to_thread(self._unlink_recordings, list(sizes))
+            await self.database.remove_recordings(removed)
+            removed_count += len(removed)
+            removed_bytes += sum(sizes[name] for name in removed)
+            if len(removed) < len(expired):
+                # Files that could not be deleted stay indexed; retry them on
+                # the next sweep instead of spinning on them now.
+                break
+        if removed_count:
+            LOGGER.info(
+                "Removed %d expired recording(s), freeing %.1f MiB",
+                removed_count,
+                removed_bytes / (1024 * 1024),
+            )
 
     @staticmethod
     def _extract_stream_id_from_recording(file_path: Path) -> Optional[str]:
         """Return the stream id encoded in a recording filename."""
 
-        name = file_path.name if isinstance(file_path, Path) else str(file_path)
-        if not name.startswith("stream-") or not name.endswith(".wav"):
+        path = file_path if isinstance(file_path, Path) else Path(str(file_path))
+        name = path.name
+        if not name.startswith("stream-") or path.suffix not in RECORDING_SUFFIXES:
             return None
-        stem = name[:-4]
+        stem = path.stem
         remainder = stem[len("stream-") :]
         stream_id, sep, timestamp = remainder.rpartition("-")
         if not sep or not stream_id or not timestamp.isdigit():
@@ -953,7 +1333,11 @@ class StreamManager:
         ):
             self._last_event_timestamps[stream.id] = transcription.timestamp
         await self.broadcaster.publish(
-            StreamEvent("transcription", transcription.model_dump(by_alias=True))
+            StreamEvent(
+                "transcription",
+                transcription.model_dump(by_alias=True),
+                stream_id=transcription.streamId,
+            )
         )
 
     async def _record_system_event(
@@ -1131,7 +1515,7 @@ class StreamManager:
                     event_lock = asyncio.Lock()
                     self._event_locks[stream.id] = event_lock
                 await event_lock.acquire()
-        await self._broadcast_streams()
+        await self._broadcast_streams(stream_ids=[stream.id])
         if event_details and event_lock:
             event_type, message, trigger_reason = event_details
             try:
@@ -1323,68 +1707,128 @@ class StreamManager:
             source="upstream_reconnect",
         )
 
-    async def _broadcast_streams(self, include_transcriptions: bool = False) -> None:
-        summary_payload: List[dict] = []
-        detailed_payload: List[dict] = []
-        for stream in self.streams.values():
-            summary = stream.model_dump(by_alias=True, exclude={"transcriptions"})
-            if stream.source == StreamSource.REMOTE:
-                worker = self.workers.get(stream.id)
-                if worker is not None:
-                    try:
-                        states = worker.get_remote_upstream_states()
-                    except Exception:
-                        LOGGER.warning(
-                            "Failed to get remote upstream states for stream %s during broadcast",
-                            stream.id,
-                            exc_info=True,
-                        )
-                        states = []
-                    if states:
-                        summary["upstreams"] = [s.model_dump(by_alias=True) for s in states]
-            summary_payload.append(summary)
-            if include_transcriptions:
-                stream_data = stream.model_dump(by_alias=True)
-                if stream.source == StreamSource.REMOTE:
-                    worker = self.workers.get(stream.id)
-                    if worker is not None:
-                        try:
-                            states = worker.get_remote_upstream_states()
-                        except Exception:
-                            LOGGER.warning(
-                                "Failed to get remote upstream states for stream %s during detailed broadcast",
-                                stream.id,
-                                exc_info=True,
-                            )
-                            states = []
-                        if states:
-                            stream_data["upstreams"] = [s.model_dump(by_alias=True) for s in states]
-                if stream.transcriptions:
-                    stream_data["transcriptions"] = [
+    async def _handle_overload_change(
+        self, stream: Stream, transition: OverloadTransition
+    ) -> None:
+        async with self._lock:
+            current = self.streams.get(stream.id)
+        if not current:
+            return
+        trigger = SystemEventTrigger.system_activity(transition.detail())
+        await self._record_system_event(
+            current,
+            TranscriptionEventType.TRANSCRIPTION_OVERLOAD,
+            transition.describe(),
+            trigger,
+            source="overload_controller",
+        )
+
+    def _remote_upstream_payload(self, stream: Stream) -> Optional[List[dict]]:
+        if stream.source != StreamSource.REMOTE:
+            return None
+        worker = self.workers.get(stream.id)
+        if worker is None:
+            return None
+        try:
+            states = worker.get_remote_upstream_states()
+        except Exception:
+            LOGGER.warning(
+                "Failed to get remote upstream states for stream %s during broadcast",
+                stream.id,
+                exc_info=True,
+            )
+            return None
+        if not states:
+            return None
+        return [state.model_dump(by_alias=True) for state in states]
+
+    def _stream_summary(self, stream: Stream) -> Dict[str, Any]:
+        summary = stream.model_dump(by_alias=True, exclude={"transcriptions"})
+        upstreams = self._remote_upstream_payload(stream)
+        if upstreams:
+            summary["upstreams"] = upstreams
+        return to_jsonable_python(summary)
+
+    async def _broadcast_streams(
+        self,
+        include_transcriptions: bool = False,
+        *,
+        stream_ids: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Publish a ``streams_patch`` with the fields that changed.
+
+        Only the streams in *stream_ids* (all streams when omitted) are
+        re-examined, and each patch entry carries just the fields that differ
+        from the previous broadcast plus the stream's new ``version``. With
+        *include_transcriptions* the recent transcriptions of those streams
+        are included even if nothing else changed.
+        """
+
+        async with self._streams_broadcast_lock:
+            if stream_ids is None:
+                selected = list(self.streams.values())
+                for stale_id in set(self._stream_summaries) - set(self.streams):
+                    self._stream_summaries.pop(stale_id, None)
+                    self._stream_versions.pop(stale_id, None)
+            else:
+                selected = [
+                    self.streams[stream_id]
+                    for stream_id in stream_ids
+                    if stream_id in self.streams
+                ]
+
+            patches: List[dict] = []
+            for stream in selected:
+                summary = self._stream_summary(stream)
+                previous = self._stream_summaries.get(stream.id, {})
+                changes = {
+                    key: value
+                    for key, value in summary.items()
+                    if key not in previous or previous[key] != value
+                }
+                changes.update(
+                    (key, None) for key in previous.keys() - summary.keys()
+                )
+                if include_transcriptions:
+                    changes["transcriptions"] = [
                         transcription.model_dump(by_alias=True, exclude={"segments"})
                         for transcription in stream.transcriptions
                     ]
-                else:
-                    stream_data["transcriptions"] = []
-                detailed_payload.append(stream_data)
-
-        json_ready_summary = to_jsonable_python(summary_payload)
-        signature = json.dumps(
-            json_ready_summary,
-            sort_keys=True,
-            ensure_ascii=False,
-            separators=(",", ":"),
-        )
+                if not changes:
+                    continue
+                version = self._stream_versions.get(stream.id, 0) + 1
+                self._stream_versions[stream.id] = version
+                self._stream_summaries[stream.id] = summary
+                patches.append({"id": stream.id, "version": version, **changes})
 
-        if include_transcriptions:
-            payload = detailed_payload
-        else:
-            if signature == self._last_streams_signature:
+            if not patches:
                 return
-            payload = summary_payload
+            self._streams_revision += 1
+            self._streams_snapshot = None
+            await self.broadcaster.publish(
+                StreamEvent("streams_patch", patches, revision=self._streams_revision)
+            )
 
-        self._last_streams_signature = signature
-        await self.broadcaster.publish(StreamEvent("streams_update", payload))
+    def streams_snapshot_event(self) -> StreamEvent:
+        """Return a ``streams_update`` event holding every stream's summary.
+
+        Sent to a client when it connects or asks to resync; its revision
+        tells the client which ``streams_patch`` events to apply next. The
+        event is shared until the next patch so it is only encoded once.
+        """
+
+        snapshot = self._streams_snapshot
+        if snapshot is None or snapshot.revision != self._streams_revision:
+            snapshot = StreamEvent(
+                "streams_update",
+                [
+                    {**summary, "version": self._stream_versions[stream_id]}
+                    for stream_id, summary in self._stream_summaries.items()
+                ],
+                revision=self._streams_revision,
+            )
+            self._streams_snapshot = snapshot
+        return snapshot
 
     async def shutdown(self) -> None:
         # Prevent new auto-restart tasks from being scheduled
@@ -1442,6 +1886,7 @@ class StreamManager:
                     stream.id,
                 )
         # Do not persist transient statuses during shutdown.
+        await self._scheduler.close()
         if self._owns_executor:
             # Avoid blocking on long-running inference during service shutdown.
             await self._executor.close(wait=False)
@@ -10,15 +10,15 @@ import re
 import struct
 import time
 import uuid
-from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from functools import lru_cache
 from typing import (
+    Any,
     AsyncIterator,
     Awaitable,
     Callable,
-    Deque,
+    Dict,
     Iterable,
     List,
     Pattern,
@@ -28,7 +28,6 @@ from typing import (
 )
 
 import numpy as np
-import soundfile as sf
 
 from .alerts import TranscriptionAlertEvaluator
 from .database import StreamDatabase
@@ -43,16 +42,21 @@ from .models import (
     TrunkedRadioMetadata,
     WhisperConfig,
 )
-from .models import StreamSource
+from .models import OverloadAction, StreamSource
 # Remote upstream support
 from .models import RemoteUpstreamConfig
 from .remote_streams import MultiUpstreamSelector
+from .overload_controller import OverloadController, OverloadTransition
+from .recording_storage import write_recording
 from .state_paths import RECORDINGS_DIR
 from .stream_defaults import resolve_ignore_first_seconds
 from .transcription_postprocessor import PhraseCanonicalizer
 from .transcription_executor import TranscriptionExecutor
+from .transcription_scheduler import TranscriptionScheduler
+from .trunked_dispatcher import TrunkedCallDispatcher
 from .whisper_transcriber import AbstractTranscriber, TranscriptionResultBundle
 from .llm_corrector import AbstractLLMCorrector, NoOpCorrector
+from .live_audio import LiveAudioRing
 
 BLANK_AUDIO_TOKEN = "[BLANK_AUDIO]"
 UNABLE_TO_TRANSCRIBE_TOKEN = "[unable to transcribe]"
@@ -75,10 +79,27 @@ class PreparedChunk:
 
     samples: np.ndarray
     prefix_samples: int
+    # Front-end filtered copy of ``samples`` when the accumulator was fed
+    # audio that had already been conditioned at ingest time.
+    conditioned: Optional[np.ndarray] = None
 
 
 class ChunkAccumulator:
-    """Incrementally groups PCM samples into transcription-sized chunks."""
+    """Incrementally groups PCM samples into transcription-sized chunks.
+
+    Samples live in a preallocated ring buffer addressed by absolute stream
+    position. The buffered timeline is the carried context prefix followed by
+    body audio that has not been emitted yet. A running count of samples above
+    the silence threshold over the trailing lookback window is updated by
+    adding the new samples and subtracting the ones that expired, so the cost
+    of each read does not depend on the lookback length.
+
+    When ``track_conditioned`` is enabled, callers pass a filtered copy of
+    every read alongside the raw samples. The filtered audio is buffered in a
+    second ring row and emitted on :attr:`PreparedChunk.conditioned`, so the
+    context prefix never has to be re-filtered. Silence detection always looks
+    at the raw samples.
+    """
 
     def __init__(
         self,
@@ -91,6 +112,7 @@ class ChunkAccumulator:
         silence_lookback_seconds: float,
         silence_hold_seconds: float,
         active_ratio_threshold: float,
+        track_conditioned: bool = False,
     ) -> None:
         self.sample_rate = max(sample_rate, 1)
         self._max_chunk_samples = max(
@@ -112,24 +134,51 @@ class ChunkAccumulator:
         )
         self._active_ratio_threshold = min(max(active_ratio_threshold, 0.0), 1.0)
 
-        self._buffer_segments: Deque[np.ndarray] = deque()
-        self._buffer_total_samples = 0
-        self._previous_tail = np.empty(0, dtype=np.float32)
+        self._track_conditioned = track_conditioned
+        # Row 0 holds raw samples; row 1 (when tracked) the conditioned copy.
+        capacity = (
+            max(
+                self._max_chunk_samples + self._context_samples,
+                self._silence_lookback_samples,
+            )
+            + self.sample_rate
+        )
+        self._ring = np.zeros((2 if track_conditioned else 1, capacity), dtype=np.float32)
+        # Absolute stream positions: samples written so far, start of the
+        # buffered timeline, and how many timeline samples are carried prefix.
+        self._written = 0
+        self._timeline_start = 0
+        self._prefix_samples = 0
+        self._window_active_samples = 0
         self._silence_duration_samples = 0
         self._last_window_silent = False
 
-    def add_samples(self, samples: np.ndarray) -> List[PreparedChunk]:
+    @property
+    def _buffer_total_samples(self) -> int:
+        return self._written - self._timeline_start - self._prefix_samples
+
+    def add_samples(
+        self, samples: np.ndarray, conditioned: Optional[np.ndarray] = None
+    ) -> List[PreparedChunk]:
         if samples.size == 0:
             return []
         float_samples = np.asarray(samples, dtype=np.float32).reshape(-1)
         if float_samples.size == 0:
             return []
-        self._buffer_segments.append(float_samples)
-        self._buffer_total_samples += float_samples.size
-        self._update_silence_state(float_samples)
+        conditioned_samples: Optional[np.ndarray] = None
+        if self._track_conditioned:
+            conditioned_samples = (
+                float_samples
+                if conditioned is None
+                else np.asarray(conditioned, dtype=np.float32).reshape(-1)
+            )
+            if conditioned_samples.size != float_samples.size:
+                raise ValueError("Conditioned audio must match the raw sample count")
+        self._append(float_samples, conditioned_samples)
+        self._update_silence_state(float_samples.size)
         ready: List[PreparedChunk] = []
         while True:
-            total_samples = self._previous_tail.size + self._buffer_total_samples
+            total_samples = self._written - self._timeline_start
             if total_samples == 0:
                 break
             if total_samples >= self._max_chunk_samples:
@@ -146,7 +195,7 @@ class ChunkAccumulator:
         return ready
 
     def flush(self) -> List[PreparedChunk]:
-        total_samples = self._previous_tail.size + self._buffer_total_samples
+        total_samples = self._written - self._timeline_start
         if total_samples == 0:
             return []
         chunk = self._build_chunk(total_samples)
@@ -154,42 +203,84 @@ class ChunkAccumulator:
             return []
         return [chunk]
 
-    def _update_silence_state(self, new_samples: np.ndarray) -> None:
-        if new_samples.size == 0:
+    def _count_active(self, start: int, stop: int) -> int:
+        """Count samples above the silence threshold in ``[start, stop)``."""
+
+        capacity = self._ring.shape[1]
+        count = 0
+        while start < stop:
+            offset = start % capacity
+            length = min(stop - start, capacity - offset)
+            window = self._ring[0, offset : offset + length]
+            count += int(np.count_nonzero(np.abs(window) > self._silence_threshold))
+            start += length
+        return count
+
+    def _append(
+        self, samples: np.ndarray, conditioned: Optional[np.ndarray]
+    ) -> None:
+        size = samples.size
+        lookback = self._silence_lookback_samples
+        window_start = max(self._written - lookback, 0)
+        retain_from = min(self._timeline_start, window_start)
+        self._ensure_capacity(self._written + size - retain_from, retain_from)
+
+        # Retire samples that fall out of the lookback window before the ring
+        # slots they occupy can be overwritten by the new samples.
+        new_window_start = max(self._written + size - lookback, 0)
+        if new_window_start >= self._written:
+            self._window_active_samples = 0
+        else:
+            self._window_active_samples -= self._count_active(
+                window_start, new_window_start
+            )
+
+        capacity = self._ring.shape[1]
+        offset = self._written % capacity
+        first = min(size, capacity - offset)
+        self._ring[0, offset : offset + first] = samples[:first]
+        self._ring[0, : size - first] = samples[first:]
+        if conditioned is not None:
+            self._ring[1, offset : offset + first] = conditioned[:first]
+            self._ring[1, : size - first] = conditioned[first:]
+        self._written += size
+
+        counted_from = max(self._written - size, new_window_start)
+        self._window_active_samples += self._count_active(counted_from, self._written)
+
+    def _ensure_capacity(self, required: int, retain_from: int) -> None:
+        capacity = self._ring.shape[1]
+        if required <= capacity:
             return
+        new_capacity = max(required, capacity * 2)
+        retained = self._read(retain_from, self._written)
+        self._ring = np.zeros((self._ring.shape[0], new_capacity), dtype=np.float32)
+        offset = retain_from % new_capacity
+        first = min(retained.shape[1], new_capacity - offset)
+        self._ring[:, offset : offset + first] = retained[:, :first]
+        self._ring[:, : retained.shape[1] - first] = retained[:, first:]
+
+    def _read(self, start: int, stop: int) -> np.ndarray:
+        """Copy absolute positions ``[start, stop)`` out of the ring."""
+
+        capacity = self._ring.shape[1]
+        size = stop - start
+        output = np.empty((self._ring.shape[0], size), dtype=np.float32)
+        offset = start % capacity
+        first = min(size, capacity - offset)
+        output[:, :first] = self._ring[:, offset : offset + first]
+        output[:, first:] = self._ring[:, : size - first]
+        return output
+
+    def _update_silence_state(self, new_sample_count: int) -> None:
         required = self._silence_lookback_samples
-        if required <= 0:
-            return
-        active_samples = 0
-        counted_samples = 0
-        remaining = required
-        for segment in reversed(self._buffer_segments):
-            if remaining <= 0:
-                break
-            if segment.size == 0:
-                continue
-            window = segment[-remaining:]
-            active_samples += int(
-                np.count_nonzero(np.abs(window) > self._silence_threshold)
-            )
-            counted_samples += window.size
-            remaining -= window.size
-        if remaining > 0 and self._previous_tail.size > 0:
-            window = self._previous_tail[-remaining:]
-            if window.size:
-                active_samples += int(
-                    np.count_nonzero(np.abs(window) > self._silence_threshold)
-                )
-                counted_samples += window.size
-        if counted_samples < required:
+        if self._written - self._timeline_start < required:
             return
-        active_ratio = (
-            float(active_samples / counted_samples) if counted_samples else 0.0
-        )
+        active_ratio = float(self._window_active_samples / required)
         self._last_window_silent = active_ratio < self._active_ratio_threshold
         if self._last_window_silent:
             self._silence_duration_samples = min(
-                self._silence_duration_samples + new_samples.size,
+                self._silence_duration_samples + new_sample_count,
                 self._max_chunk_samples,
             )
         else:
@@ -201,90 +292,26 @@ class ChunkAccumulator:
         return self._silence_duration_samples >= self._silence_hold_samples
 
     def _build_chunk(self, chunk_sample_count: int) -> PreparedChunk:
-        total_available = self._previous_tail.size + self._buffer_total_samples
-        chunk_sample_count = min(chunk_sample_count, total_available)
-        prefix = self._previous_tail.copy()
-        needed_from_buffer = max(chunk_sample_count - prefix.size, 0)
-        body_parts: List[np.ndarray] = []
-        while needed_from_buffer > 0 and self._buffer_segments:
-            segment = self._buffer_segments[0]
-            if segment.size <= needed_from_buffer:
-                body_parts.append(segment)
-                self._buffer_segments.popleft()
-                self._buffer_total_samples -= segment.size
-                needed_from_buffer -= segment.size
-            else:
-                body_parts.append(segment[:needed_from_buffer])
-                self._buffer_segments[0] = segment[needed_from_buffer:]
-                self._buffer_total_samples -= needed_from_buffer
-                needed_from_buffer = 0
-        body: np.ndarray
-        if not body_parts:
-            body = np.empty(0, dtype=np.float32)
-        elif len(body_parts) == 1:
-            body = body_parts[0]
-        else:
-            body = np.concatenate(body_parts)
-        if prefix.size and body.size:
-            samples = np.concatenate((prefix, body))
-        elif prefix.size:
-            samples = prefix
-        elif body.size:
-            samples = body
-        else:
-            samples = np.empty(0, dtype=np.float32)
-        if self._context_samples > 0 and samples.size > 0:
-            tail_start = max(samples.size - self._context_samples, 0)
-            self._previous_tail = samples[tail_start:].copy()
-        else:
-            self._previous_tail = np.empty(0, dtype=np.float32)
+        prefix_samples = self._prefix_samples
+        body_samples = min(
+            max(chunk_sample_count - prefix_samples, 0), self._buffer_total_samples
+        )
+        chunk_size = prefix_samples + body_samples
+        chunk_start = self._timeline_start
+        data = self._read(chunk_start, chunk_start + chunk_size)
+
+        # The next prefix is the tail of this chunk, which is contiguous with
+        # the remaining body audio, so the timeline simply moves forward.
+        tail = min(self._context_samples, chunk_size)
+        self._timeline_start = chunk_start + chunk_size - tail
+        self._prefix_samples = tail
         self._silence_duration_samples = 0
         self._last_window_silent = False
-        return PreparedChunk(samples=samples, prefix_samples=prefix.size)
-
-
-class _LiveAudioListener:
-    """Buffers PCM audio for HTTP listeners without blocking transcription."""
-
-    def __init__(self, queue_size: int = 32) -> None:
-        self.queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=queue_size)
-        self._closed = False
-
-    def feed(self, chunk: bytes) -> None:
-        if self._closed or not chunk:
-            return
-        try:
-            self.queue.put_nowait(chunk)
-        except asyncio.QueueFull:
-            try:
-                self.queue.get_nowait()
-            except asyncio.QueueEmpty:
-                return
-            else:
-                self.queue.task_done()
-            try:
-                self.queue.put_nowait(chunk)
-            except asyncio.QueueFull:
-                return
-
-    def close(self) -> None:
-        if self._closed:
-            return
-        self._closed = True
-        try:
-            self.queue.put_nowait(None)
-        except asyncio.QueueFull:
-            while True:
-                try:
-                    self.queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
-                else:
-                    self.queue.task_done()
-            try:
-                self.queue.put_nowait(None)
-            except asyncio.QueueFull:
-                return
+        return PreparedChunk(
+            samples=data[0],
+            prefix_samples=prefix_samples,
+            conditioned=data[1] if self._track_conditioned else None,
+        )
 
 
 LOGGER = logging.getLogger(__name__)
@@ -314,13 +341,18 @@ class StreamWorker:
         *,
         config: WhisperConfig,
         transcription_executor: Optional[TranscriptionExecutor] = None,
+        transcription_scheduler: Optional[TranscriptionScheduler] = None,
         initial_prompt: Optional[str] = None,
         remote_upstreams: Optional[list[RemoteUpstreamConfig]] = None,
         llm_corrector: Optional[AbstractLLMCorrector] = None,
+        on_overload_change: Optional[
+            Callable[[Stream, OverloadTransition], Awaitable[None]]
+        ] = None,
     ) -> None:
         self.stream = stream
         self.transcriber = transcriber
         self._transcription_executor = transcription_executor
+        self._transcription_scheduler = transcription_scheduler
         self._llm_corrector: AbstractLLMCorrector = llm_corrector or NoOpCorrector()
         self.database = database
         self.alert_evaluator = alert_evaluator
@@ -332,10 +364,21 @@ class StreamWorker:
         self.on_upstream_reconnect = (
             on_upstream_reconnect or self._async_noop
         )
+        self.on_overload_change = on_overload_change or self._async_noop
+        # The controller always tracks the real-time factor (the speech gate
+        # uses it to estimate saved inference time) but only changes levels
+        # when overload handling is enabled, and skips degradation steps the
+        # transcriber cannot honour.
+        self._overload = OverloadController(
+            config.overload,
+            backend_actions=getattr(transcriber, "overload_actions", frozenset()),
+        )
+        self._overload_enabled = config.overload.enabled
 
         self._upstream_connected = True
         self._pending_reconnect_attempt: Optional[int] = None
         self._initial_prompt = (initial_prompt or "").strip() or None
+        self._priority_talkgroups = frozenset(config.priorityTalkgroups)
         self._remote_selector: Optional[MultiUpstreamSelector] = None
         self._remote_upstreams: Optional[list[RemoteUpstreamConfig]] = remote_upstreams
 
@@ -361,6 +404,7 @@ class StreamWorker:
             silence_lookback_seconds=silence_lookback_seconds,
             silence_hold_seconds=silence_hold_seconds,
             active_ratio_threshold=active_ratio_threshold,
+            track_conditioned=True,
         )
 
         self._silence_threshold = silence_threshold
@@ -398,6 +442,11 @@ class StreamWorker:
             max(self._silence_threshold * 1.5, 0.01),
             1.0,
         )
+        self._speech_gate = config.speechGate
+        self._excluded_talkgroups = frozenset(config.speechGate.excludedTalkgroups)
+        self._gate_skips: Dict[str, int] = {}
+        self._gate_skipped_audio_seconds = 0.0
+        self._gate_saved_inference_seconds = 0.0
         self._hallucination_phrases = self._prepare_hallucination_phrases(
             config.silenceHallucinationPhrases,
             self._initial_prompt or config.initialPrompt,
@@ -450,8 +499,7 @@ class StreamWorker:
             self._segment_repetition_min_chars = None
             self._segment_repetition_max_allowed_repeats = None
 
-        self._live_audio_lock = asyncio.Lock()
-        self._live_audio_listeners: Set[_LiveAudioListener] = set()
+        self._live_audio = LiveAudioRing(self.sample_rate)
         self._live_audio_header = self._build_wav_header(self.sample_rate)
 
         self._task: Optional[asyncio.Task[None]] = None
@@ -462,6 +510,8 @@ class StreamWorker:
         self._consecutive_failures = 0
         self._consecutive_failures_lock = asyncio.Lock()
         self._worker_count = self._resolve_concurrency(config.maxConcurrentProcesses)
+        self._trunked_max_pending = config.trunkedMaxPendingCalls
+        self._trunked_dispatcher: Optional[TrunkedCallDispatcher] = None
         self._blocking_supported: Optional[bool] = None
         bytes_per_sample = 2  # s16le output from ffmpeg
         target_read_seconds = 1.0
@@ -532,6 +582,8 @@ class StreamWorker:
             await self.on_status_change(self.stream, StreamStatus.STOPPED)
         finally:
             await self._shutdown_live_audio()
+            if self._transcription_scheduler is not None:
+                self._transcription_scheduler.remove_stream(self.stream.id)
 
     @staticmethod
     def _resolve_concurrency(value: Optional[int]) -> int:
@@ -569,76 +621,38 @@ class StreamWorker:
             + struct.pack("<I", data_size)
         )
 
-    async def _register_live_audio_listener(
-        self, listener: _LiveAudioListener
-    ) -> None:
-        async with self._live_audio_lock:
-            self._live_audio_listeners.add(listener)
-            listener_count = len(self._live_audio_listeners)
-        LOGGER.info(
-            "Live audio listener registered for stream %s (listeners=%d)",
-            self.stream.id,
-            listener_count,
-        )
-
-    async def _unregister_live_audio_listener(
-        self, listener: _LiveAudioListener
-    ) -> None:
-        async with self._live_audio_lock:
-            self._live_audio_listeners.discard(listener)
-            listener_count = len(self._live_audio_listeners)
-        LOGGER.info(
-            "Live audio listener removed for stream %s (listeners=%d)",
-            self.stream.id,
-            listener_count,
-        )
-
-    async def _broadcast_live_audio(self, pcm_bytes: bytes) -> None:
-        if not pcm_bytes:
-            return
-        async with self._live_audio_lock:
-            listeners = tuple(self._live_audio_listeners)
-        if not listeners:
-            return
-        LOGGER.debug(
-            "Broadcasting %d bytes of live audio for stream %s to %d listener(s)",
-            len(pcm_bytes),
-            self.stream.id,
-            len(listeners),
-        )
-        for listener in listeners:
-            listener.feed(pcm_bytes)
-
     async def _shutdown_live_audio(self) -> None:
-        async with self._live_audio_lock:
-            listeners = tuple(self._live_audio_listeners)
-            self._live_audio_listeners.clear()
-        if listeners:
+        listener_count = self._live_audio.listener_count
+        if listener_count:
             LOGGER.info(
                 "Shutting down %d live audio listener(s) for stream %s",
-                len(listeners),
+                listener_count,
                 self.stream.id,
             )
-        for listener in listeners:
-            listener.close()
+        self._live_audio.close()
 
     async def iter_live_audio(self) -> AsyncIterator[bytes]:
-        listener = _LiveAudioListener()
-        await self._register_live_audio_listener(listener)
+        reader = self._live_audio.open_reader()
+        LOGGER.info(
+            "Live audio listener registered for stream %s (listeners=%d)",
+            self.stream.id,
+            self._live_audio.listener_count,
+        )
         try:
             yield self._live_audio_header
             while True:
-                chunk = await listener.queue.get()
+                chunk = await reader.read()
                 if chunk is None:
-                    listener.queue.task_done()
                     break
-                try:
-                    yield chunk
-                finally:
-                    listener.queue.task_done()
+                yield chunk
         finally:
-            listener.close()
-            await self._unregister_live_audio_listener(listener)
+            reader.close()
+            LOGGER.info(
+                "Live audio listener removed for stream %s (listeners=%d)",
+                self.stream.id,
+                self._live_audio.listener_count,
+            )
+
     def _start_transcription_workers(self) -> None:
         if self._chunk_queue is not None:
             raise RuntimeError("Transcription workers already running")
@@ -999,36 +1013,75 @@ class StreamWorker:
             self.stream.id,
         )
 
-        while not self._stop_event.is_set():
-            if self._worker_failure is not None:
-                break
+        # Calls on different talk groups are transcribed concurrently; calls
+        # within a talk group stay in arrival order.
+        dispatcher = TrunkedCallDispatcher(
+            self._process_trunked_call,
+            worker_count=self._worker_count,
+            max_pending=self._trunked_max_pending,
+            priority_talkgroups=self._priority_talkgroups,
+            name=f"trunked-{self.stream.id}",
+        )
+        self._trunked_dispatcher = dispatcher
+        dispatcher.start()
+        try:
+            while not self._stop_event.is_set():
+                if self._worker_failure is not None:
+                    break
 
-            result = await selector.read_trunked(timeout=0.5)
-            if result is None:
-                continue
+                result = await selector.read_trunked(timeout=0.5)
+                if result is None:
+                    continue
 
-            source_id, chunk = result
+                source_id, chunk = result
 
-            # Skip encrypted calls (no audio to transcribe)
-            if chunk.metadata.encrypted:
-                LOGGER.debug(
-                    "Stream %s skipping encrypted call from TG %s",
-                    self.stream.id,
-                    chunk.metadata.talkgroupId,
-                )
-                continue
+                gate_reason = self._trunked_gate_reason(chunk)
+                if gate_reason is not None:
+                    self._record_gate_skip(gate_reason, chunk.audio.size)
+                    LOGGER.debug(
+                        "Stream %s skipping call (%.2fs) from TG %s: %s",
+                        self.stream.id,
+                        chunk.audio.size / self.sample_rate,
+                        chunk.metadata.talkgroupId,
+                        gate_reason,
+                    )
+                    continue
 
-            # Skip very short calls that likely won't transcribe well
-            if chunk.audio.size < self.sample_rate * 0.5:  # Less than 0.5 seconds
-                LOGGER.debug(
-                    "Stream %s skipping short call (%.2fs) from TG %s",
-                    self.stream.id,
-                    chunk.audio.size / self.sample_rate,
-                    chunk.metadata.talkgroupId,
-                )
-                continue
+                priority = str(chunk.metadata.talkgroupId) in self._priority_talkgroups
+                if self._should_shed(priority=priority):
+                    continue
+                await dispatcher.submit(chunk)
+                await self._update_overload_state()
+        finally:
+            await dispatcher.close(
+                drain=not self._stop_event.is_set() and self._worker_failure is None
+            )
+        if self._worker_failure is not None:
+            worker_failure = self._worker_failure
+            self._worker_failure = None
+            raise worker_failure
 
+    async def _process_trunked_call(self, chunk) -> None:
+        try:
             await self._transcribe_trunked_call(chunk)
+            await self._update_overload_state()
+            async with self._consecutive_failures_lock:
+                self._consecutive_failures = 0
+        except Exception as exc:  # pylint: disable=broad-except
+            await self._handle_transcription_failure(exc)
+            raise
+
+    def get_trunked_metrics(self) -> Optional[Dict[str, Any]]:
+        """Per-talk group call counters for trunked streams, if any."""
+
+        dispatcher = self._trunked_dispatcher
+        if dispatcher is None:
+            return None
+        metrics = dispatcher.metrics()
+        selector = self._remote_selector
+        if selector is not None:
+            metrics["upstreamDropped"] = selector.trunked_dropped_calls()
+        return metrics
 
     async def _transcribe_trunked_call(self, chunk) -> None:
         """Transcribe a complete trunked radio call with metadata."""
@@ -1046,22 +1099,16 @@ class StreamWorker:
         # Run transcription
         language = self.stream.language
         bundle = await self._run_transcription(
-            processed_audio, self.sample_rate, language
+            processed_audio,
+            self.sample_rate,
+            language,
+            priority=str(chunk.metadata.talkgroupId) in self._priority_talkgroups,
         )
 
         text = bundle.text.strip()
         if text:
             text = self._phrase_canonicalizer.canonicalize(text)
 
-        # Skip low-quality transcriptions
-        if self._is_low_energy(chunk.audio):
-            LOGGER.debug(
-                "Stream %s TG %s dropping low-energy call",
-                self.stream.id,
-                chunk.metadata.talkgroupId,
-            )
-            return
-
         # Build segments list
         segments: Optional[List[TranscriptionSegment]] = None
         if bundle.segments:
@@ -1127,7 +1174,11 @@ class StreamWorker:
 
         # Apply LLM correction if enabled
         corrected_text: Optional[str] = None
-        if text and text not in (BLANK_AUDIO_TOKEN, UNABLE_TO_TRANSCRIBE_TOKEN):
+        if (
+            text
+            and text not in (BLANK_AUDIO_TOKEN, UNABLE_TO_TRANSCRIBE_TOKEN)
+            and not self._overload_active(OverloadAction.SKIP_LLM)
+        ):
             try:
                 correction_result = await self._llm_corrector.correct(text)
                 if correction_result.discard:
@@ -1334,10 +1385,7 @@ class StreamWorker:
             self._ignore_initial_samples = 0
         if trimmed_int_samples.size == 0:
             return result
-        trimmed_bytes = trimmed_int_samples.tobytes()
-        if len(trimmed_bytes) < 2:
-            return result
-        await self._broadcast_live_audio(trimmed_bytes)
+        self._live_audio.write(trimmed_int_samples)
         samples = trimmed_float_samples
         if samples.size == 0:
             return result
@@ -1349,7 +1397,10 @@ class StreamWorker:
         is_low_energy = self._is_low_energy(samples)
         if active_ratio >= self._active_ratio_threshold or not is_low_energy:
             self._last_non_silent_monotonic = time.monotonic()
-        chunks = self._chunker.add_samples(samples)
+        # Condition each read exactly once as it arrives; chunks then only need
+        # per-chunk gain normalisation before inference.
+        conditioned = self._audio_frontend.filter(samples)
+        chunks = self._chunker.add_samples(samples, conditioned)
         if not chunks:
             return result
         if self._chunk_queue is None:
@@ -1357,7 +1408,10 @@ class StreamWorker:
                 await self._transcribe_chunk(chunk)
             return result
         for chunk in chunks:
+            if self._should_shed(priority=False):
+                continue
             await self._chunk_queue.put(chunk)
+        await self._update_overload_state()
         return result
 
     # Public API for server-side push ingest
@@ -1394,6 +1448,7 @@ class StreamWorker:
                 break
             try:
                 await self._transcribe_chunk(chunk)
+                await self._update_overload_state()
                 # Reset consecutive failure counter on success
                 async with self._consecutive_failures_lock:
                     self._consecutive_failures = 0
@@ -1440,19 +1495,174 @@ class StreamWorker:
         )
         return False
 
+    def _overload_active(self, action: OverloadAction) -> bool:
+        return self._overload_enabled and self._overload.is_active(action)
+
+    def _should_shed(self, *, priority: bool) -> bool:
+        """Return True when load shedding should drop this low-priority audio."""
+
+        if priority or self.stream.pinned:
+            return False
+        if not self._overload_active(OverloadAction.SHED_LOW_PRIORITY):
+            return False
+        self._overload.record_dropped_chunk()
+        LOGGER.debug(
+            "Stream %s dropping audio while transcription is overloaded",
+            self.stream.id,
+        )
+        return True
+
+    async def _update_overload_state(self) -> None:
+        if not self._overload_enabled:
+            return
+        overload = self._overload
+        queue = self._chunk_queue
+        dispatcher = self._trunked_dispatcher
+        if dispatcher is not None:
+            depth = dispatcher.pending_count
+        else:
+            depth = queue.qsize() if queue is not None else 0
+        transition = overload.evaluate(depth)
+        if transition is None:
+            return
+        LOGGER.info(
+            "Stream %s overload level %d -> %d (%s)",
+            self.stream.id,
+            transition.previous_level,
+            transition.level,
+            transition.detail(),
+        )
+        try:
+            await self.on_overload_change(self.stream, transition)
+        except Exception:  # pragma: no cover - defensive logging
+            LOGGER.exception(
+                "Failed to report overload change for stream %s", self.stream.id
+            )
+
+    def _speech_gate_reason(self, samples: np.ndarray) -> Optional[str]:
+        """Why *samples* should skip Whisper, or ``None`` to transcribe them."""
+
+        gate = self._speech_gate
+        if samples.size / self.sample_rate < gate.minDurationSeconds:
+            return "duration"
+        if gate.lowEnergy and self._is_low_energy(samples):
+            return "energy"
+        if gate.minActiveRatio is not None:
+            active_ratio = float(np.mean(np.abs(samples) > self._silence_threshold))
+            if active_ratio < gate.minActiveRatio:
+                return "activeRatio"
+        return None
+
+    def _trunked_gate_reason(self, chunk) -> Optional[str]:
+        gate = self._speech_gate
+        if gate.skipEncryptedCalls and chunk.metadata.encrypted:
+            return "encrypted"
+        if str(chunk.metadata.talkgroupId) in self._excluded_talkgroups:
+            return "talkgroup"
+        if chunk.audio.size < self.sample_rate * gate.minCallSeconds:
+            return "duration"
+        if chunk.audio.size and gate.lowEnergy and self._is_low_energy(chunk.audio):
+            return "energy"
+        return None
+
+    def _record_gate_skip(self, reason: str, sample_count: int) -> None:
+        self._gate_skips[reason] = self._gate_skips.get(reason, 0) + 1
+        if reason == "encrypted":
+            # Encrypted audio was never going to be transcribed.
+            return
+        audio_seconds = sample_count / self.sample_rate
+        self._gate_skipped_audio_seconds += audio_seconds
+        real_time_factor = self._overload.real_time_factor
+        if real_time_factor is not None:
+            self._gate_saved_inference_seconds += audio_seconds * real_time_factor
+
+    def get_speech_gate_metrics(self) -> Optional[Dict[str, Any]]:
+        """Chunks and calls the speech gate kept away from Whisper, if any."""
+
+        if not self._gate_skips:
+            return None
+        return {
+            "skipped": dict(self._gate_skips),
+            "skippedAudioSeconds": round(self._gate_skipped_audio_seconds, 1),
+            "estimatedInferenceSecondsSaved": round(
+                self._gate_saved_inference_seconds, 1
+            ),
+        }
+
     async def _run_transcription(
-        self, audio: np.ndarray, sample_rate: int, language: Optional[str]
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        language: Optional[str],
+        *,
+        priority: bool = False,
     ) -> TranscriptionResultBundle:
+        result = await self._dispatch_transcription(
+            audio, sample_rate, language, priority=priority
+        )
+        # Only time spent in the model counts, not time queued for it.
+        inference_seconds = getattr(result, "inference_seconds", None)
+        if inference_seconds is not None:
+            self._overload.record_processing(
+                audio.shape[0] / max(sample_rate, 1), inference_seconds
+            )
+        return result
+
+    async def _dispatch_transcription(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        language: Optional[str],
+        *,
+        priority: bool,
+    ) -> TranscriptionResultBundle:
+        # Degraded-mode overrides; the controller only activates the ones
+        # the transcriber honours, so every path can pass them through.
+        overrides: Dict[str, Any] = {}
+        if self._overload_active(OverloadAction.REDUCE_BEAM):
+            overrides["beam_size"] = self._overload.reduced_beam_size
+        if self._overload_active(OverloadAction.FALLBACK_MODEL):
+            overrides["use_fallback_model"] = True
+        scheduler = self._transcription_scheduler
+        if scheduler is not None and self._blocking_supported is not False:
+            try:
+                result = await scheduler.submit(
+                    audio,
+                    sample_rate,
+                    language,
+                    initial_prompt=self._initial_prompt,
+                    stream_id=self.stream.id,
+                    priority=priority or bool(self.stream.pinned),
+                    **overrides,
+                )
+            except NotImplementedError:
+                self._blocking_supported = False
+            else:
+                self._blocking_supported = True
+                return result
         executor = self._transcription_executor
-        if executor is not None and self._blocking_supported is not False:
+        if (
+            scheduler is None
+            and executor is not None
+            and self._blocking_supported is not False
+        ):
             blocking_method = getattr(self.transcriber, "transcribe_blocking", None)
             if blocking_method is not None:
-                try:
-                    result = await executor.run(
-                        lambda: blocking_method(
-                            audio, sample_rate, language, initial_prompt=self._initial_prompt
-                        )
+
+                def run_blocking() -> TranscriptionResultBundle:
+                    started = time.monotonic()
+                    result = blocking_method(
+                        audio,
+                        sample_rate,
+                        language,
+                        initial_prompt=self._initial_prompt,
+                        **overrides,
                     )
+                    result.inference_seconds = time.monotonic() - started
+                    return result
+
+                try:
+                    result = await executor.run(run_blocking)
                 except NotImplementedError:
                     self._blocking_supported = False
                 else:
@@ -1460,16 +1670,23 @@ class StreamWorker:
                     return result
             else:
                 self._blocking_supported = False
+        # Transcribers without a blocking path run here directly: they are not
+        # batched, fairly queued or bounded by the scheduler.
         transcribe = self.transcriber.transcribe
         signature = inspect.signature(transcribe)
+        started = time.monotonic()
         if "initial_prompt" in signature.parameters:
-            return await transcribe(
+            result = await transcribe(
                 audio,
                 sample_rate,
                 language,
                 initial_prompt=self._initial_prompt,
+                **overrides,
             )
-        return await transcribe(audio, sample_rate, language)
+        else:
+            result = await transcribe(audio, sample_rate, language, **overrides)
+        result.inference_seconds = time.monotonic() - started
+        return result
 
     async def _transcribe_chunk(self, chunk: PreparedChunk) -> None:
         if chunk.samples.size == 0:
@@ -1479,11 +1696,33 @@ class StreamWorker:
         if effective_samples.size == 0:
             return
 
-        language = self.stream.language
-        transcription_samples = self._prepare_transcription_audio(chunk.samples)
-        bundle = await self._run_transcription(
-            transcription_samples, self.sample_rate, language
-        )
+        gate_reason = self._speech_gate_reason(effective_samples)
+        gated_blank = gate_reason is not None
+        if gate_reason is not None:
+            self._record_gate_skip(gate_reason, effective_samples.size)
+            if not self._should_emit_blank_audio(effective_samples):
+                LOGGER.debug(
+                    "Stream %s skipping non-speech chunk: %s",
+                    self.stream.id,
+                    gate_reason,
+                )
+                return
+            # Continue as if Whisper heard nothing, producing a blank marker.
+            # The near-silent clip is not kept.
+            bundle = TranscriptionResultBundle("", [], self.stream.language)
+        else:
+            language = self.stream.language
+            if chunk.conditioned is not None:
+                transcription_samples = self._audio_frontend.apply_agc(
+                    chunk.conditioned, self._agc_target_rms
+                )
+            else:
+                transcription_samples = self._prepare_transcription_audio(
+                    chunk.samples
+                )
+            bundle = await self._run_transcription(
+                transcription_samples, self.sample_rate, language
+            )
 
         start_offset_seconds = (
             prefix_samples / self.sample_rate if prefix_samples else 0.0
@@ -1553,15 +1792,6 @@ class StreamWorker:
             text = ""
             segments = []
 
-        if text and self._is_low_energy(effective_samples):
-            LOGGER.debug(
-                "Stream %s dropping low-energy transcription output: %s",
-                self.stream.id,
-                text,
-            )
-            text = ""
-            segments = []
-
         if text and self._is_punctuation_only(text):
             text = ""
             segments = []
@@ -1620,7 +1850,9 @@ class StreamWorker:
             if trimmed_samples.size > record_start_index
             else np.empty(0, dtype=np.float32)
         )
-        skip_recording = text == BLANK_AUDIO_TOKEN and blank_due_to_hallucination
+        skip_recording = text == BLANK_AUDIO_TOKEN and (
+            blank_due_to_hallucination or gated_blank
+        )
         should_store_recording = record_samples.size > 0 and not skip_recording
         if should_store_recording:
             # Persist recordings for anything that carried energy so editors can
@@ -1646,7 +1878,11 @@ class StreamWorker:
 
         # Apply LLM correction for real transcriptions (not placeholders)
         corrected_text: Optional[str] = None
-        if text and text not in (BLANK_AUDIO_TOKEN, UNABLE_TO_TRANSCRIBE_TOKEN):
+        if (
+            text
+            and text not in (BLANK_AUDIO_TOKEN, UNABLE_TO_TRANSCRIBE_TOKEN)
+            and not self._overload_active(OverloadAction.SKIP_LLM)
+        ):
             try:
                 correction_result = await self._llm_corrector.correct(text)
                 if correction_result.discard:
@@ -1830,7 +2066,19 @@ class StreamWorker:
         return self._is_low_quality_transcription(avg_logprob)
 
     def _matches_hallucination_phrase(self, normalized_text: str) -> bool:
-        return normalized_text in self._hallucination_phrases
+        if normalized_text in self._hallucination_phrases:
+            return True
+        # The phrase said back to back is the same hallucination.
+        tokens = normalized_text.split()
+        for phrase in self._hallucination_phrases:
+            phrase_tokens = phrase.split()
+            if (
+                phrase_tokens
+                and len(tokens) % len(phrase_tokens) == 0
+                and tokens == phrase_tokens * (len(tokens) // len(phrase_tokens))
+            ):
+                return True
+        return False
 
     def _has_repeated_hallucination_phrase(self, normalized_text: str) -> bool:
         for phrase in self._hallucination_phrases:
@@ -2070,10 +2318,19 @@ class StreamWorker:
         return samples[trim_index:].copy(), trim_index
 
     async def _write_recording(self, samples: np.ndarray) -> Path:
-        file_name = f"stream-{self.stream.id}-{int(utcnow().timestamp()*1000)}.wav"
-        file_path = RECORDINGS_DIR / file_name
-        await asyncio.to_thread(sf.write, file_path, samples, self.sample_rate)
-        return file_path
+        created_at = utcnow()
+        file_name = f"stream-{self.stream.id}-{int(created_at.timestamp()*1000)}.wav"
+        path = await write_recording(
+            RECORDINGS_DIR / file_name,
+            samples,
+            self.sample_rate,
+            self.stream.recordingFormat,
+        )
+        stat = await asyncio.to_thread(path.stat)
+        await self.database.add_recording(
+            path.name, self.stream.id, created_at, stat.st_size
+        )
+        return path
 
     def _prepare_transcription_audio(self, samples: np.ndarray) -> np.ndarray:
         if samples.size == 0:
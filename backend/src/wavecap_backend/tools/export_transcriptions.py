@@ -26,7 +26,11 @@ from wavecap_backend.datetime_utils import (
     utcnow,
 )
 from wavecap_backend.models import TranscriptionResult, TranscriptionReviewStatus
-from wavecap_backend.state_paths import RECORDINGS_DIR, resolve_state_path
+from wavecap_backend.state_paths import (
+    RECORDINGS_DIR,
+    resolve_recording_file,
+    resolve_state_path,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -82,10 +86,11 @@ def _normalise_text(transcription: TranscriptionResult) -> str:
 def _resolve_audio_path(transcription: TranscriptionResult) -> Optional[Path]:
     if not transcription.recordingUrl:
         return None
-    candidate = RECORDINGS_DIR / Path(transcription.recordingUrl).name
-    if not candidate.exists():
+    name = Path(transcription.recordingUrl).name
+    candidate = resolve_recording_file(name, RECORDINGS_DIR)
+    if candidate is None:
         LOGGER.warning(
-            "Audio file missing for transcription %s: %s", transcription.id, candidate
+            "Audio file missing for transcription %s: %s", transcription.id, name
         )
         return None
     return candidate
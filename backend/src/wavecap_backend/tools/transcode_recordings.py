@@ -0,0 +1,191 @@
+"""Transcode stored WAV recordings to FLAC or Opus and update their URLs."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from wavecap_backend.database import StreamDatabase
+from wavecap_backend.models import RecordingFormat
+from wavecap_backend.recording_storage import (
+    RECORDING_IO_WORKERS,
+    recording_format_for,
+    transcode_recording,
+)
+from wavecap_backend.state_paths import RECORDINGS_DIR, resolve_state_path
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class TranscodeSummary:
+    """Outcome of a transcoding run."""
+
+    renames: Dict[str, str] = field(default_factory=dict)
+    failed: List[str] = field(default_factory=list)
+    bytes_before: int = 0
+    bytes_after: int = 0
+    updated_transcriptions: int = 0
+
+
+def find_recordings(
+    directory: Path,
+    target: RecordingFormat,
+    stream_id: Optional[str] = None,
+) -> List[Path]:
+    """Return recordings in *directory* that are not yet in *target* format."""
+
+    pattern = f"stream-{stream_id}-*" if stream_id else "stream-*"
+    return sorted(
+        path
+        for path in directory.glob(pattern)
+        if path.is_file()
+        and recording_format_for(path) not in (None, target)
+    )
+
+
+def _transcode_one(
+    path: Path, target: RecordingFormat
+) -> tuple[Path, int, Optional[Path], int]:
+    size_before = path.stat().st_size
+    try:
+        new_path = transcode_recording(path, target)
+    except Exception:
+        LOGGER.warning("Failed to transcode %s", path, exc_info=True)
+        return path, size_before, None, 0
+    return path, size_before, new_path, new_path.stat().st_size
+
+
+async def transcode_recordings(
+    db_path: Path,
+    recordings_dir: Path,
+    target: RecordingFormat,
+    *,
+    stream_id: Optional[str] = None,
+    workers: int = RECORDING_IO_WORKERS,
+    dry_run: bool = False,
+) -> TranscodeSummary:
+    summary = TranscodeSummary()
+    files = find_recordings(recordings_dir, target, stream_id)
+    if dry_run:
+        summary.bytes_before = sum(path.stat().st_size for path in files)
+        summary.renames = {path.name: path.name for path in files}
+        return summary
+
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(
+        max_workers=max(1, workers), thread_name_prefix="transcode"
+    ) as pool:
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, _transcode_one, path, target)
+                for path in files
+            )
+        )
+    for source, size_before, new_path, size_after in results:
+        if new_path is None:
+            summary.failed.append(source.name)
+            continue
+        summary.bytes_before += size_before
+        summary.bytes_after += size_after
+        if new_path.name != source.name:
+            summary.renames[source.name] = new_path.name
+
+    if summary.renames:
+        database = StreamDatabase(db_path)
+        try:
+            summary.updated_transcriptions = await database.rename_recordings(
+                summary.renames
+            )
+        finally:
+            await database.close()
+    return summary
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--format",
+        type=RecordingFormat,
+        choices=[RecordingFormat.FLAC, RecordingFormat.OPUS, RecordingFormat.WAV],
+        default=RecordingFormat.FLAC,
+        help="Target recording format (default: flac)",
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=resolve_state_path("runtime.sqlite"),
+        help="Path to the SQLite database containing transcriptions (default: state/runtime.sqlite)",
+    )
+    parser.add_argument(
+        "--recordings-dir",
+        type=Path,
+        default=RECORDINGS_DIR,
+        help="Directory holding recordings (default: state/recordings)",
+    )
+    parser.add_argument(
+        "--stream",
+        type=str,
+        default=None,
+        help="Only transcode recordings from this stream ID",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=RECORDING_IO_WORKERS,
+        help="Number of files to encode in parallel",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List how many files would be transcoded without changing anything",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    summary = asyncio.run(
+        transcode_recordings(
+            args.db,
+            args.recordings_dir,
+            args.format,
+            stream_id=args.stream,
+            workers=args.workers,
+            dry_run=args.dry_run,
+        )
+    )
+    if args.dry_run:
+        LOGGER.info(
+            "Would transcode %s recordings (%.1f MiB) to %s",
+            len(summary.renames),
+            summary.bytes_before / (1024 * 1024),
+            args.format.value,
+        )
+        return
+    LOGGER.info(
+        "Transcoded %s recordings to %s: %.1f MiB -> %.1f MiB; updated %s transcriptions",
+        len(summary.renames),
+        args.format.value,
+        summary.bytes_before / (1024 * 1024),
+        summary.bytes_after / (1024 * 1024),
+        summary.updated_transcriptions,
+    )
+    if summary.failed:
+        LOGGER.warning("Failed to transcode %s recordings", len(summary.failed))
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution entry point
+    main()
@@ -0,0 +1,220 @@
+"""Stand-in WaveCap-SDR voice emitter for local testing and benchmarking.
+
+``serve`` accepts trunked radio clients and sends synthetic calls, using the
+binary framing when the client offers it and JSON otherwise (or always JSON
+with ``--legacy``). ``--benchmark`` skips the network and times how long the
+client takes to decode the same calls in each framing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from wavecap_backend.models import RemoteUpstreamConfig
+from wavecap_backend.trunked_radio import (
+    VOICE_SUBPROTOCOL_BINARY,
+    VOICE_SUBPROTOCOL_JSON,
+    TrunkedRadioClient,
+    encode_binary_call,
+    encode_json_call,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+SyntheticCall = Tuple[Dict[str, Any], bytes]
+
+
+def synthetic_call(
+    talkgroup_id: int,
+    *,
+    seconds: float = 5.0,
+    sample_rate: int = 16000,
+    call_id: int = 0,
+) -> SyntheticCall:
+    """Return a call header and PCM16 tone resembling a WaveCap-SDR call."""
+
+    t = np.arange(int(seconds * sample_rate), dtype=np.float32) / sample_rate
+    tone = 0.3 * np.sin(2 * np.pi * (440 + 40 * (talkgroup_id % 10)) * t)
+    pcm = (tone * 32767).astype("<i2").tobytes()
+    header = {
+        "streamId": f"recorder_0_call_{call_id}",
+        "talkgroupId": talkgroup_id,
+        "talkgroupName": f"Talkgroup {talkgroup_id}",
+        "sourceId": 1000 + call_id,
+        "encrypted": False,
+        "startTime": time.time(),
+        "durationSeconds": seconds,
+        "frequency": 774_000_000 + 12_500 * (talkgroup_id % 16),
+    }
+    return header, pcm
+
+
+def synthetic_calls(
+    count: int, *, talkgroups: Sequence[int] = (1616, 1617, 1618), seconds: float = 5.0
+) -> List[SyntheticCall]:
+    return [
+        synthetic_call(talkgroups[index % len(talkgroups)], seconds=seconds, call_id=index)
+        for index in range(count)
+    ]
+
+
+def _select_subprotocol(connection: Any, offered: Sequence[str]) -> Optional[str]:
+    for subprotocol in (VOICE_SUBPROTOCOL_BINARY, VOICE_SUBPROTOCOL_JSON):
+        if subprotocol in offered:
+            return subprotocol
+    return None
+
+
+@dataclass
+class EmitterServer:
+    """A running emitter; ``url`` is the address clients should connect to."""
+
+    url: str
+    server: Any
+
+    async def close(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+
+async def serve(
+    calls: Iterable[SyntheticCall],
+    *,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    legacy: bool = False,
+    interval: float = 0.0,
+) -> EmitterServer:
+    """Start an emitter that sends *calls* to every client that connects.
+
+    ``legacy`` mimics an older WaveCap-SDR that negotiates no subprotocol and
+    only sends JSON.
+    """
+
+    from websockets.asyncio.server import serve as websocket_serve
+
+    frames = list(calls)
+
+    async def handler(connection: Any) -> None:
+        binary = connection.subprotocol == VOICE_SUBPROTOCOL_BINARY
+        for header, pcm in frames:
+            if binary:
+                await connection.send(encode_binary_call(header, pcm))
+            else:
+                await connection.send(encode_json_call(header, pcm))
+            if interval:
+                await asyncio.sleep(interval)
+        await connection.wait_closed()
+
+    server = await websocket_serve(
+        handler,
+        host,
+        port,
+        select_subprotocol=None if legacy else _select_subprotocol,
+        max_size=None,
+    )
+    bound_port = next(iter(server.sockets)).getsockname()[1]
+    return EmitterServer(url=f"ws://{host}:{bound_port}", server=server)
+
+
+async def benchmark(calls: Sequence[SyntheticCall]) -> Dict[str, float]:
+    """Return seconds spent decoding *calls* in each framing."""
+
+    results: Dict[str, float] = {}
+    framings = {
+        "json": [encode_json_call(header, pcm) for header, pcm in calls],
+        "binary": [encode_binary_call(header, pcm) for header, pcm in calls],
+    }
+    for name, frames in framings.items():
+        client = TrunkedRadioClient(
+            RemoteUpstreamConfig(id=f"bench-{name}", mode="trunked", url="ws://bench")
+        )
+        started = time.perf_counter()
+        for frame in frames:
+            await client._process_message(frame)
+            client._queue.get_nowait()
+        results[name] = time.perf_counter() - started
+        results[f"{name}_bytes"] = float(sum(len(frame) for frame in frames))
+    return results
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Interface to listen on (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8765, help="Port to listen on (default: 8765)"
+    )
+    parser.add_argument(
+        "--calls", type=int, default=200, help="Number of calls to emit (default: 200)"
+    )
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        default=5.0,
+        help="Duration of each synthetic call in seconds (default: 5)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Delay between calls when serving, in seconds (default: 0.5)",
+    )
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="Behave like an emitter without binary framing support",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Time client-side decoding of both framings instead of serving",
+    )
+    return parser
+
+
+async def _serve_forever(args: argparse.Namespace) -> None:
+    emitter = await serve(
+        synthetic_calls(args.calls, seconds=args.seconds),
+        host=args.host,
+        port=args.port,
+        legacy=args.legacy,
+        interval=args.interval,
+    )
+    LOGGER.info("Emitting %d calls to clients of %s", args.calls, emitter.url)
+    try:
+        await asyncio.Future()
+    finally:
+        await emitter.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_arg_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if not args.benchmark:
+        try:
+            asyncio.run(_serve_forever(args))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    results = asyncio.run(benchmark(synthetic_calls(args.calls, seconds=args.seconds)))
+    for name in ("json", "binary"):
+        LOGGER.info(
+            "%-6s %8.1f ms  %8.1f MiB",
+            name,
+            results[name] * 1000.0,
+            results[f"{name}_bytes"] / (1024 * 1024),
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution entry point
+    main()
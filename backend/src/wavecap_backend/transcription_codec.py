@@ -0,0 +1,126 @@
+"""Compact binary encodings for stored waveforms and transcription segments.
+
+Both formats start with a one-byte version so the layout can change without
+another column migration.
+
+Waveform, version 1: one unsigned byte per bar, the 0.0-1.0 amplitude scaled
+to 0-255. Decoded values are rounded to three decimals like
+:func:`~wavecap_backend.waveform.compute_waveform` output.
+
+Segments, version 1: an unsigned 16-bit segment count, then per segment the
+``id`` and ``seek`` as signed 32-bit integers, the six float fields as
+doubles, and the UTF-8 text prefixed by its unsigned 16-bit byte length. All
+values are little-endian.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from typing import Any, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from .models import TranscriptionSegment
+
+__all__ = [
+    "decode_segments",
+    "decode_waveform",
+    "encode_segments",
+    "encode_waveform",
+]
+
+WAVEFORM_VERSION = 1
+SEGMENTS_VERSION = 1
+
+_HEADER = struct.Struct("<BH")
+_SEGMENT = struct.Struct("<ii6dH")
+_FLOAT_FIELDS = (
+    "no_speech_prob",
+    "temperature",
+    "avg_logprob",
+    "compression_ratio",
+    "start",
+    "end",
+)
+_MAX_TEXT_BYTES = 0xFFFF
+
+SegmentLike = Union[TranscriptionSegment, Mapping[str, Any]]
+
+
+def encode_waveform(waveform: Optional[Sequence[float]]) -> Optional[bytes]:
+    if not waveform:
+        return None
+    values = np.clip(np.asarray(waveform, dtype=np.float64), 0.0, 1.0)
+    values = np.nan_to_num(values, nan=0.0)
+    quantized = np.rint(values * 255.0).astype(np.uint8)
+    return bytes((WAVEFORM_VERSION,)) + quantized.tobytes()
+
+
+def decode_waveform(data: Optional[bytes]) -> Optional[List[float]]:
+    if not data:
+        return None
+    version = data[0]
+    if version != WAVEFORM_VERSION:
+        raise ValueError(f"Unsupported waveform encoding version {version}")
+    levels = np.frombuffer(data, dtype=np.uint8, offset=1)
+    return np.round(levels / 255.0, 3).tolist()
+
+
+def _finite(value: Any) -> float:
+    try:
+        parsed = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return parsed if math.isfinite(parsed) else 0.0
+
+
+def encode_segments(segments: Optional[Sequence[SegmentLike]]) -> Optional[bytes]:
+    if not segments:
+        return None
+    parts = [_HEADER.pack(SEGMENTS_VERSION, len(segments))]
+    for segment in segments:
+        if not isinstance(segment, TranscriptionSegment):
+            segment = TranscriptionSegment.model_validate(segment)
+        text = segment.text.encode("utf-8")[:_MAX_TEXT_BYTES]
+        parts.append(
+            _SEGMENT.pack(
+                segment.id,
+                segment.seek,
+                *(_finite(getattr(segment, name)) for name in _FLOAT_FIELDS),
+                len(text),
+            )
+        )
+        parts.append(text)
+    return b"".join(parts)
+
+
+def decode_segments(data: Optional[bytes]) -> Optional[List[TranscriptionSegment]]:
+    """Rebuild segments from :func:`encode_segments` output.
+
+    The values were validated when they were encoded, so the models are
+    constructed without running validation again.
+    """
+
+    if not data:
+        return None
+    version, count = _HEADER.unpack_from(data, 0)
+    if version != SEGMENTS_VERSION:
+        raise ValueError(f"Unsupported segment encoding version {version}")
+    view = memoryview(data)
+    offset = _HEADER.size
+    segments: List[TranscriptionSegment] = []
+    for _ in range(count):
+        segment_id, seek, *floats, text_length = _SEGMENT.unpack_from(data, offset)
+        offset += _SEGMENT.size
+        text = str(view[offset : offset + text_length], "utf-8", errors="replace")
+        offset += text_length
+        segments.append(
+            TranscriptionSegment.model_construct(
+                id=segment_id,
+                text=text,
+                seek=seek,
+                **dict(zip(_FLOAT_FIELDS, floats)),
+            )
+        )
+    return segments or None
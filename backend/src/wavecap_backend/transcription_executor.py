@@ -20,7 +20,12 @@ class _ExecutorJob(Generic[T]):
 
 
 class TranscriptionExecutor:
-    """Runs blocking transcription work on a dedicated pool of threads."""
+    """Runs blocking transcription work on a dedicated pool of threads.
+
+    At most ``queue_size`` jobs are queued or running at once. Callers beyond
+    that wait on a semaphore that is released as each job finishes, rather
+    than polling the queue.
+    """
 
     def __init__(self, *, worker_count: int, queue_size: int) -> None:
         if worker_count <= 0:
@@ -28,15 +33,19 @@ class TranscriptionExecutor:
         if queue_size <= 0:
             raise ValueError("queue_size must be positive")
         self._worker_count = worker_count
-        self._queue: "queue.Queue[Optional[_ExecutorJob[object]]]" = queue.Queue(
-            maxsize=queue_size
-        )
+        self._queue_size = queue_size
+        self._queue: "queue.Queue[Optional[_ExecutorJob[object]]]" = queue.Queue()
+        self._slots: Optional[asyncio.Semaphore] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._threads: list[threading.Thread] = []
         self._started = False
         self._closing = False
         self._lock = threading.Lock()
 
+    @property
+    def worker_count(self) -> int:
+        return self._worker_count
+
     async def start(self) -> None:
         """Initialise thread pool workers bound to the current loop."""
 
@@ -47,6 +56,7 @@ class TranscriptionExecutor:
                     raise RuntimeError("Executor already bound to a different loop")
                 return
             self._loop = loop
+            self._slots = asyncio.Semaphore(self._queue_size)
             self._started = True
             for index in range(self._worker_count):
                 thread = threading.Thread(
@@ -90,32 +100,18 @@ class TranscriptionExecutor:
         if not self._threads:
             return
         for _ in range(len(self._threads)):
-            await self._enqueue_sentinel()
+            self._queue.put(None)
         if wait:
             await asyncio.gather(*(asyncio.to_thread(thread.join) for thread in self._threads))
             self._threads.clear()
 
     async def _enqueue_job(self, job: _ExecutorJob[T]) -> None:
-        while True:
-            if self._closing:
-                raise RuntimeError("TranscriptionExecutor is shutting down")
-            try:
-                self._queue.put(job, block=False)
-            except queue.Full:
-                await asyncio.sleep(0.01)
-                continue
-            else:
-                return
-
-    async def _enqueue_sentinel(self) -> None:
-        while True:
-            try:
-                self._queue.put(None, block=False)
-            except queue.Full:
-                await asyncio.sleep(0.01)
-                continue
-            else:
-                return
+        assert self._slots is not None
+        await self._slots.acquire()
+        if self._closing:
+            self._slots.release()
+            raise RuntimeError("TranscriptionExecutor is shutting down")
+        self._queue.put(job)
 
     def _worker_loop(self) -> None:
         loop = self._loop
@@ -130,6 +126,11 @@ class TranscriptionExecutor:
                 loop.call_soon_threadsafe(self._reject_future, job.future, exc)
             else:
                 loop.call_soon_threadsafe(self._resolve_future, job.future, result)
+            loop.call_soon_threadsafe(self._release_slot)
+
+    def _release_slot(self) -> None:
+        if self._slots is not None:
+            self._slots.release()
 
     @staticmethod
     def _resolve_future(future: asyncio.Future[T], result: T) -> None:
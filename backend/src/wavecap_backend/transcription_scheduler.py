@@ -0,0 +1,431 @@
+"""Cross-stream batching and fair scheduling of Whisper inference requests."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set
+
+import numpy as np
+
+from .transcription_executor import TranscriptionExecutor
+from .whisper_transcriber import (
+    AbstractTranscriber,
+    TranscriptionRequest,
+    TranscriptionResultBundle,
+)
+
+__all__ = ["TranscriptionScheduler"]
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_KEY = "_default"
+
+
+@dataclass
+class _PendingRequest:
+    """A submitted chunk waiting to be dispatched in a batch."""
+
+    request: TranscriptionRequest
+    future: asyncio.Future[TranscriptionResultBundle]
+    enqueued_at: float
+    queue_key: str
+    finish_tag: float
+    priority: bool = False
+
+
+@dataclass
+class _StreamQueue:
+    """Pending chunks and wait statistics for one stream."""
+
+    items: Deque[_PendingRequest] = field(default_factory=deque)
+    last_finish_tag: float = 0.0
+    dispatched: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    last_priority: bool = False
+
+
+class TranscriptionScheduler:
+    """Collects chunks from every stream worker and runs them in batches.
+
+    Each stream has its own sub-queue. Chunks are dequeued in weighted fair
+    order: every chunk is stamped with a virtual finish tag of
+    ``max(virtual clock, stream's previous tag) + 1 / weight`` and the chunk
+    with the smallest tag goes next, so a chatty stream cannot starve a quiet
+    one and priority chunks (weight ``priority_weight``) are served that many
+    times as often under contention.
+
+    The oldest pending chunk opens a collection window of up to
+    ``max_wait_seconds``; the batch is dispatched once the window closes or
+    ``max_batch_size`` chunks are waiting. At most one batch per executor
+    thread is in flight, so under load chunks keep accumulating here and the
+    next batch is naturally larger. Each chunk's result or error is delivered
+    back to the coroutine that submitted it.
+
+    A stream may have at most ``max_pending_per_stream`` chunks waiting here;
+    further submissions from it wait until one of its chunks is dispatched,
+    so a stalled model pushes back on the stream instead of growing the
+    queue without bound.
+    """
+
+    def __init__(
+        self,
+        *,
+        executor: TranscriptionExecutor,
+        transcriber: AbstractTranscriber,
+        max_batch_size: int = 1,
+        max_wait_seconds: float = 0.0,
+        priority_weight: float = 1.0,
+        max_pending_per_stream: int = 32,
+    ) -> None:
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive")
+        if priority_weight <= 0:
+            raise ValueError("priority_weight must be positive")
+        if max_pending_per_stream <= 0:
+            raise ValueError("max_pending_per_stream must be positive")
+        self._executor = executor
+        self._transcriber = transcriber
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max(float(max_wait_seconds), 0.0)
+        self._priority_weight = float(priority_weight)
+        self._max_pending_per_stream = max_pending_per_stream
+        self._queues: Dict[str, _StreamQueue] = {}
+        # Streams that have stopped; their queues go once they drain.
+        self._retired: Set[str] = set()
+        self._pending_count = 0
+        self._virtual_time = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        # Replaced each time chunks leave a queue, waking every blocked submitter.
+        self._space_freed: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._dispatcher: Optional[asyncio.Task[None]] = None
+        self._batch_tasks: Set[asyncio.Task[None]] = set()
+        self._closing = False
+
+        self._submitted = 0
+        self._completed_batches = 0
+        self._completed_items = 0
+        self._largest_batch = 0
+        self._last_batch_size = 0
+        self._total_queue_delay = 0.0
+        self._max_queue_delay = 0.0
+        self._last_queue_delay = 0.0
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+
+    async def start(self) -> None:
+        """Start the dispatcher on the running loop."""
+
+        if self._dispatcher is not None:
+            return
+        self._closing = False
+        self._wakeup = asyncio.Event()
+        self._space_freed = asyncio.Event()
+        self._slots = asyncio.Semaphore(max(self._executor.worker_count, 1))
+        self._dispatcher = asyncio.create_task(
+            self._dispatch_loop(), name="transcription-scheduler"
+        )
+
+    async def close(self) -> None:
+        """Stop dispatching and fail any chunks that were never scheduled."""
+
+        self._closing = True
+        dispatcher = self._dispatcher
+        self._dispatcher = None
+        if dispatcher is not None:
+            dispatcher.cancel()
+            await asyncio.gather(dispatcher, return_exceptions=True)
+        batch_tasks = list(self._batch_tasks)
+        for task in batch_tasks:
+            task.cancel()
+        if batch_tasks:
+            await asyncio.gather(*batch_tasks, return_exceptions=True)
+        for stream_queue in self._queues.values():
+            while stream_queue.items:
+                item = stream_queue.items.popleft()
+                if not item.future.done():
+                    item.future.set_exception(
+                        RuntimeError("TranscriptionScheduler is shutting down")
+                    )
+        self._pending_count = 0
+        self._notify_space()
+
+    async def submit(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        language: Optional[str],
+        *,
+        initial_prompt: Optional[str] = None,
+        stream_id: Optional[str] = None,
+        priority: bool = False,
+        beam_size: Optional[int] = None,
+        use_fallback_model: bool = False,
+    ) -> TranscriptionResultBundle:
+        """Queue *audio* for the next batch and await its transcription."""
+
+        if self._dispatcher is None or self._wakeup is None:
+            raise RuntimeError("TranscriptionScheduler has not been started")
+        if self._closing:
+            raise RuntimeError("TranscriptionScheduler is shutting down")
+        key = stream_id or DEFAULT_QUEUE_KEY
+        await self._wait_for_space(key)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[TranscriptionResultBundle] = loop.create_future()
+        self._retired.discard(key)
+        stream_queue = self._queues.setdefault(key, _StreamQueue())
+        weight = self._priority_weight if priority else 1.0
+        finish_tag = max(self._virtual_time, stream_queue.last_finish_tag) + 1.0 / weight
+        stream_queue.last_finish_tag = finish_tag
+        stream_queue.last_priority = priority
+        stream_queue.items.append(
+            _PendingRequest(
+                request=TranscriptionRequest(
+                    audio=audio,
+                    sample_rate=sample_rate,
+                    language=language,
+                    initial_prompt=initial_prompt,
+                    beam_size=beam_size,
+                    use_fallback_model=use_fallback_model,
+                ),
+                future=future,
+                enqueued_at=time.monotonic(),
+                queue_key=key,
+                finish_tag=finish_tag,
+                priority=priority,
+            )
+        )
+        self._pending_count += 1
+        self._submitted += 1
+        self._wakeup.set()
+        return await future
+
+    async def _wait_for_space(self, key: str) -> None:
+        """Wait until *key*'s queue has room for another chunk."""
+
+        while True:
+            if self._closing or self._space_freed is None:
+                raise RuntimeError("TranscriptionScheduler is shutting down")
+            stream_queue = self._queues.get(key)
+            if (
+                stream_queue is None
+                or len(stream_queue.items) < self._max_pending_per_stream
+            ):
+                return
+            await self._space_freed.wait()
+
+    def _notify_space(self) -> None:
+        if self._space_freed is not None:
+            self._space_freed.set()
+            self._space_freed = asyncio.Event()
+
+    def remove_stream(self, stream_id: str) -> None:
+        """Forget *stream_id*'s queue and statistics once it has drained."""
+
+        stream_queue = self._queues.get(stream_id)
+        if stream_queue is None:
+            return
+        if any(not item.future.done() for item in stream_queue.items):
+            self._retired.add(stream_id)
+            return
+        self._pending_count -= len(stream_queue.items)
+        del self._queues[stream_id]
+        self._notify_space()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return queue delay and batch size statistics, overall and per stream."""
+
+        now = time.monotonic()
+        batches = self._completed_batches
+        streams: Dict[str, Dict[str, Any]] = {}
+        for key, stream_queue in self._queues.items():
+            streams[key] = {
+                "queueDepth": len(stream_queue.items),
+                "oldestWaitSeconds": (
+                    now - stream_queue.items[0].enqueued_at
+                    if stream_queue.items
+                    else 0.0
+                ),
+                "dispatched": stream_queue.dispatched,
+                "averageWaitSeconds": (
+                    stream_queue.total_wait / stream_queue.dispatched
+                    if stream_queue.dispatched
+                    else 0.0
+                ),
+                "maxWaitSeconds": stream_queue.max_wait,
+                "priority": stream_queue.last_priority,
+            }
+        return {
+            "maxBatchSize": self._max_batch_size,
+            "maxWaitSeconds": self._max_wait_seconds,
+            "priorityWeight": self._priority_weight,
+            "maxPendingPerStream": self._max_pending_per_stream,
+            "queueDepth": self._pending_count,
+            "inFlightBatches": len(self._batch_tasks),
+            "submitted": self._submitted,
+            "completedBatches": batches,
+            "completedItems": self._completed_items,
+            "averageBatchSize": (self._completed_items / batches) if batches else 0.0,
+            "largestBatchSize": self._largest_batch,
+            "lastBatchSize": self._last_batch_size,
+            "averageQueueDelaySeconds": (
+                self._total_queue_delay / self._completed_items
+                if self._completed_items
+                else 0.0
+            ),
+            "maxQueueDelaySeconds": self._max_queue_delay,
+            "lastQueueDelaySeconds": self._last_queue_delay,
+            "streams": streams,
+        }
+
+    async def _dispatch_loop(self) -> None:
+        assert self._wakeup is not None and self._slots is not None
+        while True:
+            while not self._pending_count:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            await self._collect_window()
+            await self._slots.acquire()
+            batch = self._take_batch()
+            if not batch:
+                self._slots.release()
+                continue
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _collect_window(self) -> None:
+        assert self._wakeup is not None
+        if self._max_batch_size <= 1 or self._max_wait_seconds <= 0:
+            return
+        oldest = min(
+            stream_queue.items[0].enqueued_at
+            for stream_queue in self._queues.values()
+            if stream_queue.items
+        )
+        deadline = oldest + self._max_wait_seconds
+        while self._pending_count < self._max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return
+
+    def _take_batch(self) -> List[_PendingRequest]:
+        batch: List[_PendingRequest] = []
+        while len(batch) < self._max_batch_size:
+            item = self._pop_next()
+            if item is None:
+                break
+            batch.append(item)
+        return batch
+
+    def _pop_next(self) -> Optional[_PendingRequest]:
+        """Remove and return the live chunk with the smallest finish tag."""
+
+        best: Optional[_StreamQueue] = None
+        drained: List[str] = []
+        abandoned = 0
+        for key, stream_queue in self._queues.items():
+            items = stream_queue.items
+            while items and items[0].future.done():
+                # Drop chunks whose submitter gave up waiting.
+                items.popleft()
+                self._pending_count -= 1
+                abandoned += 1
+            if not items and key in self._retired:
+                drained.append(key)
+            elif items and (best is None or items[0].finish_tag < best.items[0].finish_tag):
+                best = stream_queue
+        for key in drained:
+            del self._queues[key]
+            self._retired.discard(key)
+        if best is None:
+            if abandoned:
+                self._notify_space()
+            return None
+        self._notify_space()
+        item = best.items.popleft()
+        self._pending_count -= 1
+        self._virtual_time = max(self._virtual_time, item.finish_tag)
+        if not best.items and item.queue_key in self._retired:
+            del self._queues[item.queue_key]
+            self._retired.discard(item.queue_key)
+        return item
+
+    async def _run_batch(self, batch: List[_PendingRequest]) -> None:
+        assert self._slots is not None
+        try:
+            dispatched_at = time.monotonic()
+            for item in batch:
+                delay = dispatched_at - item.enqueued_at
+                self._total_queue_delay += delay
+                self._max_queue_delay = max(self._max_queue_delay, delay)
+                self._last_queue_delay = delay
+                stream_queue = self._queues.get(item.queue_key)
+                if stream_queue is not None:
+                    stream_queue.dispatched += 1
+                    stream_queue.total_wait += delay
+                    stream_queue.max_wait = max(stream_queue.max_wait, delay)
+            self._completed_batches += 1
+            self._completed_items += len(batch)
+            self._last_batch_size = len(batch)
+            self._largest_batch = max(self._largest_batch, len(batch))
+            await self._execute(batch)
+        finally:
+            self._slots.release()
+
+    async def _execute(self, batch: List[_PendingRequest]) -> None:
+        requests = [item.request for item in batch]
+
+        def run_batch() -> tuple[List[TranscriptionResultBundle], float]:
+            started = time.monotonic()
+            results = self._transcriber.transcribe_batch_blocking(requests)
+            return results, time.monotonic() - started
+
+        try:
+            results, inference_seconds = await self._executor.run(run_batch)
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Transcriber returned {len(results)} results for {len(batch)} chunks"
+                )
+        except asyncio.CancelledError:
+            for item in batch:
+                item.future.cancel()
+            raise
+        except Exception as exc:
+            if len(batch) > 1:
+                # Retry one at a time so a single bad chunk only fails itself.
+                LOGGER.warning(
+                    "Batched transcription of %d chunks failed; retrying individually",
+                    len(batch),
+                    exc_info=exc,
+                )
+                for item in batch:
+                    await self._execute([item])
+                return
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(exc)
+            return
+        # Split the batch's model time across its chunks by audio length.
+        durations = [
+            item.request.audio.shape[0] / max(item.request.sample_rate, 1)
+            for item in batch
+        ]
+        total_duration = sum(durations)
+        for item, result, duration in zip(batch, results, durations):
+            if total_duration > 0:
+                result.inference_seconds = inference_seconds * duration / total_duration
+            if not item.future.done():
+                item.future.set_result(result)
@@ -0,0 +1,280 @@
+"""Concurrent transcription of trunked radio calls, ordered per talkgroup."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .trunked_radio import TrunkedCallChunk
+
+LOGGER = logging.getLogger(__name__)
+
+__all__ = ["TalkgroupCallCounters", "TrunkedCallDispatcher"]
+
+
+@dataclass
+class TalkgroupCallCounters:
+    """Per-talkgroup call accounting reported by ``TrunkedCallDispatcher``."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    dropped: int = 0
+    deferred: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "deferred": self.deferred,
+        }
+
+
+@dataclass
+class _QueuedCall:
+    sequence: int
+    chunk: TrunkedCallChunk
+
+
+class TrunkedCallDispatcher:
+    """Runs trunked calls on a pool of workers, one call per talkgroup at a time.
+
+    Calls on different talkgroups are transcribed concurrently, while calls on
+    the same talkgroup are handled strictly in arrival order, so transcripts
+    for a conversation are emitted in sequence. Ready priority talkgroups are
+    served before others.
+
+    At most ``max_pending`` calls may be queued or running. When the budget is
+    full, a call on an ordinary talkgroup is dropped. A call on a priority
+    talkgroup evicts the oldest queued ordinary call instead, and if only
+    priority calls are queued it waits (is deferred) for a slot.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[TrunkedCallChunk], Awaitable[None]],
+        *,
+        worker_count: int,
+        max_pending: int,
+        priority_talkgroups: Iterable[str] = (),
+        name: str = "trunked",
+    ) -> None:
+        self._handler = handler
+        self._worker_count = max(int(worker_count), 1)
+        self._max_pending = max(int(max_pending), self._worker_count)
+        self._priority_talkgroups = frozenset(str(tg) for tg in priority_talkgroups)
+        self._name = name
+        self._lanes: Dict[str, Deque[_QueuedCall]] = {}
+        self._ready_priority: Deque[str] = deque()
+        self._ready_normal: Deque[str] = deque()
+        self._busy: Set[str] = set()
+        self._pending = 0
+        self._sequence = itertools.count()
+        self._counters: Dict[str, TalkgroupCallCounters] = {}
+        self._condition: Optional[asyncio.Condition] = None
+        self._workers: List[asyncio.Task[None]] = []
+        self._closing = False
+
+    @property
+    def pending_count(self) -> int:
+        """Calls queued or being transcribed."""
+
+        return self._pending
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._condition = asyncio.Condition()
+        self._closing = False
+        self._workers = [
+            asyncio.create_task(self._run_worker(), name=f"{self._name}-{index}")
+            for index in range(self._worker_count)
+        ]
+
+    async def submit(self, chunk: TrunkedCallChunk) -> bool:
+        """Queue *chunk*, returning False if the overflow policy dropped it."""
+
+        condition = self._require_condition()
+        talkgroup = str(chunk.metadata.talkgroupId)
+        priority = talkgroup in self._priority_talkgroups
+        counters = self._counters_for(talkgroup)
+        async with condition:
+            if self._closing:
+                return False
+            counters.submitted += 1
+            if self._pending >= self._max_pending:
+                if not priority:
+                    counters.dropped += 1
+                    LOGGER.warning(
+                        "%s: dropping call on talkgroup %s; %d calls in flight",
+                        self._name,
+                        talkgroup,
+                        self._pending,
+                    )
+                    return False
+                if not self._evict_oldest_ordinary_call():
+                    counters.deferred += 1
+                    await condition.wait_for(
+                        lambda: self._closing or self._pending < self._max_pending
+                    )
+                    if self._closing:
+                        counters.dropped += 1
+                        return False
+            self._lanes.setdefault(talkgroup, deque()).append(
+                _QueuedCall(next(self._sequence), chunk)
+            )
+            self._pending += 1
+            if talkgroup not in self._busy and len(self._lanes[talkgroup]) == 1:
+                self._mark_ready(talkgroup)
+            condition.notify_all()
+        return True
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued call has been handled."""
+
+        condition = self._require_condition()
+        async with condition:
+            try:
+                await asyncio.wait_for(
+                    condition.wait_for(lambda: self._pending == 0), timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                return False
+        return True
+
+    async def close(self, *, drain: bool, timeout: float = 30.0) -> None:
+        """Stop the workers, optionally letting queued calls finish first."""
+
+        if not self._workers:
+            return
+        if drain and not await self.drain(timeout):
+            LOGGER.warning(
+                "%s: timed out draining %d trunked calls", self._name, self._pending
+            )
+        condition = self._require_condition()
+        async with condition:
+            self._closing = True
+            condition.notify_all()
+        for task in self._workers:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        self._lanes.clear()
+        self._ready_priority.clear()
+        self._ready_normal.clear()
+        self._busy.clear()
+        self._pending = 0
+
+    def metrics(self) -> Dict[str, object]:
+        return {
+            "workers": self._worker_count,
+            "maxPending": self._max_pending,
+            "pending": self._pending,
+            "talkgroups": {
+                talkgroup: counters.as_dict()
+                for talkgroup, counters in self._counters.items()
+            },
+        }
+
+    def _require_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            raise RuntimeError("TrunkedCallDispatcher has not been started")
+        return self._condition
+
+    def _counters_for(self, talkgroup: str) -> TalkgroupCallCounters:
+        counters = self._counters.get(talkgroup)
+        if counters is None:
+            counters = TalkgroupCallCounters()
+            self._counters[talkgroup] = counters
+        return counters
+
+    def _mark_ready(self, talkgroup: str) -> None:
+        if talkgroup in self._priority_talkgroups:
+            self._ready_priority.append(talkgroup)
+        else:
+            self._ready_normal.append(talkgroup)
+
+    def _evict_oldest_ordinary_call(self) -> bool:
+        victim: Optional[str] = None
+        oldest: Optional[int] = None
+        for talkgroup, lane in self._lanes.items():
+            if talkgroup in self._priority_talkgroups or not lane:
+                continue
+            if oldest is None or lane[0].sequence < oldest:
+                victim, oldest = talkgroup, lane[0].sequence
+        if victim is None:
+            return False
+        lane = self._lanes[victim]
+        lane.popleft()
+        self._pending -= 1
+        self._counters_for(victim).dropped += 1
+        LOGGER.warning(
+            "%s: dropping queued call on talkgroup %s for a priority call",
+            self._name,
+            victim,
+        )
+        if not lane:
+            del self._lanes[victim]
+            if victim not in self._busy:
+                self._ready_normal.remove(victim)
+        return True
+
+    async def _run_worker(self) -> None:
+        condition = self._require_condition()
+        while True:
+            async with condition:
+                await condition.wait_for(
+                    lambda: self._closing
+                    or bool(self._ready_priority)
+                    or bool(self._ready_normal)
+                )
+                if self._closing:
+                    return
+                ready = self._ready_priority or self._ready_normal
+                talkgroup = ready.popleft()
+                call = self._lanes[talkgroup].popleft()
+                self._busy.add(talkgroup)
+            counters = self._counters_for(talkgroup)
+            try:
+                await self._handler(call.chunk)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # The handler reports its own errors; only count them here.
+                counters.failed += 1
+                LOGGER.debug(
+                    "%s: call on talkgroup %s failed",
+                    self._name,
+                    talkgroup,
+                    exc_info=True,
+                )
+            else:
+                counters.completed += 1
+            finally:
+                async with condition:
+                    self._busy.discard(talkgroup)
+                    self._pending = max(self._pending - 1, 0)
+                    lane = self._lanes.get(talkgroup)
+                    if lane:
+                        self._mark_ready(talkgroup)
+                    elif lane is not None:
+                        del self._lanes[talkgroup]
+                    condition.notify_all()
@@ -2,9 +2,13 @@
 
 This module provides an async WebSocket client that connects to WaveCap-SDR's
 multiplexed voice stream endpoint. Each WebSocket message contains a complete
-call from a single talk group, encoded as JSON with base64 PCM16 audio.
+call from a single talk group.
 
-Message format from WaveCap-SDR:
+Two framings are understood on the same endpoint. The client offers the
+``wavecap.voice.binary`` subprotocol first; emitters that accept it send
+binary frames, and emitters that ignore subprotocols keep sending JSON.
+
+JSON message (text frame, base64 PCM16 audio):
 {
     "streamId": "recorder_0_call_12345",
     "talkgroupId": 1616,
@@ -17,6 +21,14 @@ Message format from WaveCap-SDR:
     "sourceLocation": {"latitude": 47.6, "longitude": -122.3},
     "audio": "base64_encoded_pcm16..."
 }
+
+Binary message:
+    bytes 0-3   magic ``b"WCV1"``
+    bytes 4-7   header length N (unsigned little-endian)
+    bytes 8-    N bytes of UTF-8 JSON with the fields above minus ``audio``
+                and an optional ``audioFormat`` of ``"pcm16"`` (default) or
+                ``"f32"``
+    remainder   raw little-endian PCM samples
 """
 
 from __future__ import annotations
@@ -25,9 +37,10 @@ import asyncio
 import base64
 import json
 import logging
+import struct
 import time
 from dataclasses import dataclass, field
-from typing import Optional, Set
+from typing import Any, Callable, Dict, Mapping, Optional, Set, Tuple
 
 import numpy as np
 
@@ -35,6 +48,68 @@ from .models import RemoteUpstreamConfig, TrunkedRadioMetadata
 
 LOGGER = logging.getLogger(__name__)
 
+VOICE_SUBPROTOCOL_BINARY = "wavecap.voice.binary"
+VOICE_SUBPROTOCOL_JSON = "wavecap.voice.json"
+BINARY_CALL_MAGIC = b"WCV1"
+_BINARY_PREFIX = struct.Struct("<4sI")
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+_PCM_DTYPES = {"pcm16": np.dtype("<i2"), "f32": np.dtype("<f4")}
+
+
+def encode_binary_call(
+    header: Mapping[str, Any], pcm: bytes, audio_format: str = "pcm16"
+) -> bytes:
+    """Frame *pcm* behind a JSON *header* in the binary call format."""
+
+    payload = dict(header)
+    payload.pop("audio", None)
+    if audio_format != "pcm16":
+        payload["audioFormat"] = audio_format
+    header_bytes = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return b"".join(
+        (_BINARY_PREFIX.pack(BINARY_CALL_MAGIC, len(header_bytes)), header_bytes, pcm)
+    )
+
+
+def encode_json_call(header: Mapping[str, Any], pcm: bytes) -> str:
+    """Encode PCM16 *pcm* as a JSON call message with base64 audio."""
+
+    payload = dict(header)
+    payload["audio"] = base64.b64encode(pcm).decode("ascii")
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def _is_binary_call(raw: str | bytes) -> bool:
+    return isinstance(raw, bytes) and raw[:4] == BINARY_CALL_MAGIC
+
+
+def _split_binary_call(raw: bytes) -> Tuple[Dict[str, Any], memoryview]:
+    if len(raw) < _BINARY_PREFIX.size:
+        raise ValueError("binary call frame is truncated")
+    _magic, header_length = _BINARY_PREFIX.unpack_from(raw)
+    audio_offset = _BINARY_PREFIX.size + header_length
+    if audio_offset > len(raw):
+        raise ValueError("binary call header overruns the frame")
+    view = memoryview(raw)
+    header = json.loads(bytes(view[_BINARY_PREFIX.size : audio_offset]))
+    if not isinstance(header, dict):
+        raise ValueError("binary call header must be a JSON object")
+    return header, view[audio_offset:]
+
+
+def _decode_pcm(pcm: bytes | memoryview, audio_format: str = "pcm16") -> np.ndarray:
+    """Return float32 samples for *pcm*, viewing the frame without copying it."""
+
+    dtype = _PCM_DTYPES.get(audio_format)
+    if dtype is None:
+        raise ValueError(f"unsupported audio format {audio_format!r}")
+    usable = len(pcm) - len(pcm) % dtype.itemsize
+    samples = np.frombuffer(pcm, dtype=dtype, count=usable // dtype.itemsize)
+    if dtype.kind == "f":
+        return samples.astype(np.float32, copy=False)
+    # Convert and scale into a single new float32 array.
+    return np.multiply(samples, _PCM16_SCALE, dtype=np.float32)
+
 
 @dataclass
 class TrunkedCallChunk:
@@ -49,6 +124,8 @@ class TrunkedCallChunk:
     metadata: TrunkedRadioMetadata
     sample_rate: int = 16000
     call_start_time: Optional[float] = None  # Unix timestamp
+    # time.monotonic() when the call was queued by the client
+    received_mono: float = field(default_factory=time.monotonic)
 
 
 @dataclass
@@ -62,6 +139,8 @@ class TrunkedRadioClient:
 
     cfg: RemoteUpstreamConfig
     target_sample_rate: int = 16000
+    # Called after each call is queued, so readers can wait without polling.
+    on_call: Optional[Callable[[], None]] = field(default=None, repr=False)
 
     _ws: Optional[object] = field(default=None, init=False, repr=False)
     _queue: asyncio.Queue[TrunkedCallChunk] = field(
@@ -74,6 +153,9 @@ class TrunkedRadioClient:
     _connected: bool = field(default=False, init=False, repr=False)
     _talkgroup_filter: Set[int] = field(default_factory=set, init=False, repr=False)
     _last_error: Optional[str] = field(default=None, init=False, repr=False)
+    _dropped_by_talkgroup: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         if self.cfg.talkgroupFilter:
@@ -124,10 +206,32 @@ class TrunkedRadioClient:
         except asyncio.TimeoutError:
             return None
 
+    def read_nowait(self) -> Optional[TrunkedCallChunk]:
+        """Return the next queued call chunk, or None when none is waiting."""
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
     def pending_count(self) -> int:
         """Number of chunks waiting to be read."""
         return self._queue.qsize()
 
+    def dropped_calls(self) -> Dict[str, int]:
+        """Calls dropped on queue overflow, keyed by talk group ID."""
+        return dict(self._dropped_by_talkgroup)
+
+    def _record_drop(self, chunk: TrunkedCallChunk) -> None:
+        talkgroup = str(chunk.metadata.talkgroupId)
+        self._dropped_by_talkgroup[talkgroup] = (
+            self._dropped_by_talkgroup.get(talkgroup, 0) + 1
+        )
+        LOGGER.warning(
+            "Trunked client %s: queue full, dropping call from TG %s",
+            self.cfg.id,
+            talkgroup,
+        )
+
     async def _run(self) -> None:
         """Main connection loop with exponential backoff reconnection."""
         try:
@@ -165,15 +269,22 @@ class TrunkedRadioClient:
                 if self.cfg.authToken:
                     headers["Authorization"] = f"Bearer {self.cfg.authToken}"
 
-                async with connect(url, additional_headers=headers) as ws:
+                async with connect(
+                    url,
+                    additional_headers=headers,
+                    subprotocols=[VOICE_SUBPROTOCOL_BINARY, VOICE_SUBPROTOCOL_JSON],
+                ) as ws:
                     self._ws = ws
                     self._connected = True
                     self._last_error = None
                     reconnect_attempt = 0
                     LOGGER.info(
-                        "Trunked client %s: connected to %s",
+                        "Trunked client %s: connected to %s (%s framing)",
                         self.cfg.id,
                         url,
+                        "binary"
+                        if ws.subprotocol == VOICE_SUBPROTOCOL_BINARY
+                        else "JSON",
                     )
 
                     async for message in ws:
@@ -197,7 +308,10 @@ class TrunkedRadioClient:
     async def _process_message(self, raw: str | bytes) -> None:
         """Parse a WaveCap-SDR voice message and queue the audio."""
         try:
-            if isinstance(raw, bytes):
+            binary = _is_binary_call(raw)
+            if binary:
+                data, pcm = _split_binary_call(raw)
+            elif isinstance(raw, bytes):
                 data = json.loads(raw.decode("utf-8"))
             else:
                 data = json.loads(raw)
@@ -212,14 +326,16 @@ class TrunkedRadioClient:
             if self._talkgroup_filter and talkgroup_id not in self._talkgroup_filter:
                 return
 
-            # Decode base64 PCM16 audio
-            audio_b64 = data.get("audio", "")
-            if not audio_b64:
-                return
-
-            pcm_bytes = base64.b64decode(audio_b64)
-            samples = np.frombuffer(pcm_bytes, dtype=np.int16)
-            audio = samples.astype(np.float32) / 32768.0
+            if binary:
+                if not pcm:
+                    return
+                audio = _decode_pcm(pcm, str(data.get("audioFormat") or "pcm16"))
+            else:
+                # Decode base64 PCM16 audio
+                audio_b64 = data.get("audio", "")
+                if not audio_b64:
+                    return
+                audio = _decode_pcm(base64.b64decode(audio_b64))
 
             # Extract frequency (convert Hz to MHz if present)
             frequency_hz = data.get("frequency") or data.get("frequencyHz")
@@ -266,16 +382,15 @@ class TrunkedRadioClient:
             except asyncio.QueueFull:
                 # Drop oldest to make room
                 try:
-                    self._queue.get_nowait()
+                    self._record_drop(self._queue.get_nowait())
                 except asyncio.QueueEmpty:
                     pass
                 try:
                     self._queue.put_nowait(chunk)
                 except asyncio.QueueFull:
-                    LOGGER.warning(
-                        "Trunked client %s: dropping call due to queue overflow",
-                        self.cfg.id,
-                    )
+                    self._record_drop(chunk)
+            if self.on_call is not None:
+                self.on_call()
 
         except Exception as exc:
             LOGGER.warning(
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import inspect
 import logging
 import platform
 import threading
 import time
 import warnings
-from typing import Any, List, Optional, Tuple, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     import multiprocessing
@@ -26,6 +28,11 @@ warnings.filterwarnings(
 import numpy as np
 from faster_whisper import WhisperModel
 
+try:  # pragma: no cover - batched pipeline ships with faster-whisper >= 1.1
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:  # pragma: no cover - older faster-whisper releases
+    BatchedInferencePipeline = None  # type: ignore[assignment,misc]
+
 try:  # pragma: no cover - depends on optional CUDA runtime availability
     import ctranslate2  # type: ignore
 except Exception:  # pragma: no cover - absence of CUDA/ctranslate2 is expected on CPU-only envs
@@ -36,7 +43,7 @@ try:  # pragma: no cover - mlx-whisper is optional, only available on Apple Sili
 except Exception:  # pragma: no cover
     mlx_whisper = None  # type: ignore[assignment]
 
-from .models import TranscriptionSegment, WhisperConfig
+from .models import OverloadAction, TranscriptionSegment, WhisperConfig
 
 LOGGER = logging.getLogger(__name__)
 
@@ -57,9 +64,30 @@ class TranscriptionResultBundle:
         self.language = language
         self.no_speech_prob = no_speech_prob
         self.avg_logprob = avg_logprob
+        # Seconds of model time spent on this audio, set by whoever ran it.
+        self.inference_seconds: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class TranscriptionRequest:
+    """One chunk of audio submitted as part of a batched transcription."""
+
+    audio: np.ndarray
+    sample_rate: int
+    language: Optional[str]
+    initial_prompt: Optional[str] = None
+    # Degraded-mode overrides; backends that cannot honour them ignore them.
+    beam_size: Optional[int] = None
+    use_fallback_model: bool = False
 
 
 class AbstractTranscriber:
+    # Degraded-mode overrides this backend honours. A backend listing
+    # REDUCE_BEAM accepts ``beam_size`` and one listing FALLBACK_MODEL accepts
+    # ``use_fallback_model`` as keywords to transcribe and transcribe_blocking;
+    # the overload controller skips the actions a backend does not list.
+    overload_actions: FrozenSet[OverloadAction] = frozenset()
+
     async def transcribe(
         self,
         audio: np.ndarray,
@@ -80,13 +108,57 @@ class AbstractTranscriber:
     ) -> TranscriptionResultBundle:
         raise NotImplementedError
 
+    def transcribe_batch_blocking(
+        self, requests: Sequence[TranscriptionRequest]
+    ) -> List[TranscriptionResultBundle]:
+        """Transcribe several chunks, returning one bundle per request.
+
+        Backends without a batched decoder run the requests one after another.
+        """
+
+        return [
+            self.transcribe_blocking(
+                request.audio,
+                request.sample_rate,
+                request.language,
+                initial_prompt=request.initial_prompt,
+                **self._override_kwargs(request),
+            )
+            for request in requests
+        ]
+
+    def _override_kwargs(self, request: TranscriptionRequest) -> Dict[str, Any]:
+        """Keyword arguments for the overrides in *request* this backend honours."""
+
+        kwargs: Dict[str, Any] = {}
+        if (
+            request.beam_size is not None
+            and OverloadAction.REDUCE_BEAM in self.overload_actions
+        ):
+            kwargs["beam_size"] = request.beam_size
+        if (
+            request.use_fallback_model
+            and OverloadAction.FALLBACK_MODEL in self.overload_actions
+        ):
+            kwargs["use_fallback_model"] = True
+        return kwargs
+
 
 class WhisperTranscriber(AbstractTranscriber):
     """Wraps the faster-whisper model."""
 
+    # faster-whisper's batched decoder truncates each clip to one 30 s window.
+    BATCH_MAX_CLIP_SECONDS = 30.0
+    overload_actions = frozenset(
+        {OverloadAction.REDUCE_BEAM, OverloadAction.FALLBACK_MODEL}
+    )
+
     def __init__(self, config: WhisperConfig, *, preload_model: bool = True):
         self.config = config
         self._model: Optional[WhisperModel] = None
+        self._model_name: Optional[str] = None
+        self._fallback_model: Optional[WhisperModel] = None
+        self._batched_pipeline: Optional[Any] = None
         self._model_lock = threading.Lock()
         concurrency = self._resolve_concurrency(self.config.maxConcurrentProcesses)
         self._semaphore = threading.Semaphore(concurrency)
@@ -109,11 +181,13 @@ class WhisperTranscriber(AbstractTranscriber):
         return any(marker in message for marker in gpu_markers)
 
     def _load_cpu_model(self, model_name: str) -> WhisperModel:
-        return WhisperModel(
+        model = WhisperModel(
             model_name,
             device="cpu",
             compute_type="float32",
         )
+        self._model_name = model_name
+        return model
 
     def _gpu_runtime_available(self) -> bool:
         if ctranslate2 is None:
@@ -141,7 +215,9 @@ class WhisperTranscriber(AbstractTranscriber):
     def _create_model(self) -> WhisperModel:
         try:
             if self._gpu_runtime_available():
-                return WhisperModel(self.config.model)
+                model = WhisperModel(self.config.model)
+                self._model_name = self.config.model
+                return model
             fallback_model = self.config.cpuFallbackModel or self.config.model
             if fallback_model == self.config.model:
                 LOGGER.info(
@@ -250,9 +326,17 @@ class WhisperTranscriber(AbstractTranscriber):
         language: Optional[str],
         *,
         initial_prompt: Optional[str] = None,
+        beam_size: Optional[int] = None,
+        use_fallback_model: bool = False,
     ) -> TranscriptionResultBundle:
         return await asyncio.to_thread(
-            self.transcribe_blocking, audio, sample_rate, language, initial_prompt=initial_prompt
+            self.transcribe_blocking,
+            audio,
+            sample_rate,
+            language,
+            initial_prompt=initial_prompt,
+            beam_size=beam_size,
+            use_fallback_model=use_fallback_model,
         )
 
     def transcribe_blocking(
@@ -262,15 +346,171 @@ class WhisperTranscriber(AbstractTranscriber):
         language: Optional[str],
         *,
         initial_prompt: Optional[str] = None,
+        beam_size: Optional[int] = None,
+        use_fallback_model: bool = False,
+    ) -> TranscriptionResultBundle:
+        return self._transcribe_request(
+            TranscriptionRequest(
+                audio,
+                sample_rate,
+                language,
+                initial_prompt,
+                beam_size=beam_size,
+                use_fallback_model=use_fallback_model,
+            )
+        )
+
+    def _transcribe_request(
+        self, request: TranscriptionRequest
     ) -> TranscriptionResultBundle:
+        audio = request.audio
         with self._semaphore:
-            model = self._ensure_model_blocking()
+            model = (
+                self._ensure_fallback_model_blocking()
+                if request.use_fallback_model
+                else self._ensure_model_blocking()
+            )
             LOGGER.debug("Running Whisper inference on %s samples", audio.shape[0])
             segments, info = self._run_model_transcription(
-                model, audio, language, override_initial_prompt=initial_prompt
+                model,
+                audio,
+                request.language,
+                override_initial_prompt=request.initial_prompt,
+                beam_size=request.beam_size,
             )
         return self._build_result_bundle(segments, info)
 
+    def _ensure_fallback_model_blocking(self) -> WhisperModel:
+        """Return the smaller CPU model used while a stream is overloaded."""
+
+        model = self._ensure_model_blocking()
+        fallback_name = self.config.cpuFallbackModel
+        if not fallback_name or fallback_name == self._model_name:
+            return model
+        if self._fallback_model is None:
+            with self._model_lock:
+                if self._fallback_model is None:
+                    LOGGER.info("Loading Whisper fallback model %s", fallback_name)
+                    self._fallback_model = WhisperModel(
+                        fallback_name, device="cpu", compute_type="float32"
+                    )
+        return self._fallback_model
+
+    def transcribe_batch_blocking(
+        self, requests: Sequence[TranscriptionRequest]
+    ) -> List[TranscriptionResultBundle]:
+        """Decode compatible chunks together through the batched pipeline.
+
+        Chunks that share a language and prompt and fit in a single decoder
+        window are concatenated and passed as separate clips, so the encoder
+        and decoder run once per batch instead of once per chunk. Anything
+        else, including a group whose batched call fails, is transcribed on
+        its own.
+        """
+
+        if len(requests) <= 1 or BatchedInferencePipeline is None:
+            return [self._transcribe_request(request) for request in requests]
+        results: List[Optional[TranscriptionResultBundle]] = [None] * len(requests)
+        groups: Dict[Tuple[str, Optional[str], Optional[int]], List[int]] = {}
+        for index, request in enumerate(requests):
+            language = request.language or self.config.language
+            duration = request.audio.shape[0] / max(request.sample_rate, 1)
+            if (
+                not language
+                or request.use_fallback_model
+                or not 0 < duration <= self.BATCH_MAX_CLIP_SECONDS
+            ):
+                continue
+            prompt = request.initial_prompt or self.config.initialPrompt
+            groups.setdefault((language, prompt, request.beam_size), []).append(index)
+        for (language, prompt, beam_size), indices in groups.items():
+            if len(indices) < 2:
+                continue
+            try:
+                bundles = self._run_batched_transcription(
+                    [requests[index] for index in indices],
+                    language,
+                    prompt,
+                    beam_size=beam_size,
+                )
+            except Exception as exc:
+                LOGGER.warning(
+                    "Batched Whisper inference failed; transcribing %d chunks individually",
+                    len(indices),
+                    exc_info=exc,
+                )
+                continue
+            for index, bundle in zip(indices, bundles):
+                results[index] = bundle
+        for index, request in enumerate(requests):
+            if results[index] is None:
+                results[index] = self._transcribe_request(request)
+        return [bundle for bundle in results if bundle is not None]
+
+    def _ensure_batched_pipeline(self, model: WhisperModel) -> Any:
+        if self._batched_pipeline is None:
+            with self._model_lock:
+                if self._batched_pipeline is None:
+                    self._batched_pipeline = BatchedInferencePipeline(model=model)
+        return self._batched_pipeline
+
+    def _run_batched_transcription(
+        self,
+        requests: Sequence[TranscriptionRequest],
+        language: str,
+        initial_prompt: Optional[str],
+        *,
+        beam_size: Optional[int] = None,
+    ) -> List[TranscriptionResultBundle]:
+        with self._semaphore:
+            model = self._ensure_model_blocking()
+            pipeline = self._ensure_batched_pipeline(model)
+            sampling_rate = model.feature_extractor.sampling_rate
+            parts: List[np.ndarray] = []
+            offsets: List[float] = []
+            clips: List[dict[str, float]] = []
+            position = 0
+            for request in requests:
+                audio = np.asarray(request.audio, dtype=np.float32).reshape(-1)
+                offsets.append(position / sampling_rate)
+                parts.append(audio)
+                position += audio.size
+                clips.append({"start": offsets[-1], "end": position / sampling_rate})
+            LOGGER.debug(
+                "Running batched Whisper inference on %s chunks (%s samples)",
+                len(requests),
+                position,
+            )
+            segment_iter, info = pipeline.transcribe(
+                np.concatenate(parts),
+                language=language,
+                task="transcribe",
+                beam_size=max(int(beam_size or self.config.beamSize), 1),
+                temperature=float(self.config.decodeTemperature),
+                initial_prompt=initial_prompt,
+                without_timestamps=False,
+                vad_filter=False,
+                clip_timestamps=clips,
+                batch_size=len(requests),
+            )
+            segments = list(segment_iter)
+            frames_per_second = model.frames_per_second
+        grouped: List[List[Any]] = [[] for _ in requests]
+        for segment in segments:
+            # Segment times are relative to the concatenated audio; allow for
+            # the millisecond rounding faster-whisper applies to them.
+            index = max(bisect.bisect_right(offsets, segment.start + 0.001) - 1, 0)
+            grouped[index].append(segment)
+        return [
+            self._build_result_bundle(
+                clip_segments,
+                info,
+                time_offset=offset,
+                seek_offset=int(offset * frames_per_second),
+            )
+            for clip_segments, offset in zip(grouped, offsets)
+        ]
+
     def _run_model_transcription(
         self,
         model: WhisperModel,
@@ -278,12 +518,13 @@ class WhisperTranscriber(AbstractTranscriber):
         language: Optional[str],
         *,
         override_initial_prompt: Optional[str] = None,
+        beam_size: Optional[int] = None,
     ) -> Tuple[List[Any], Any]:
         supported_params, accepts_var_kwargs = self._get_transcribe_param_support(model)
         kwargs: dict[str, Any] = {
             "language": language or self.config.language,
             "task": "transcribe",
-            "beam_size": max(int(self.config.beamSize), 1),
+            "beam_size": max(int(beam_size or self.config.beamSize), 1),
             "temperature": float(self.config.decodeTemperature),
             "condition_on_previous_text": bool(self.config.conditionOnPreviousText),
             "without_timestamps": False,
@@ -304,7 +545,11 @@ class WhisperTranscriber(AbstractTranscriber):
 
     @staticmethod
     def _build_result_bundle(
-        segments: List[Any], info: Any
+        segments: List[Any],
+        info: Any,
+        *,
+        time_offset: float = 0.0,
+        seek_offset: int = 0,
     ) -> TranscriptionResultBundle:
         text_parts: List[str] = []
         segment_models: List[TranscriptionSegment] = []
@@ -318,9 +563,9 @@ class WhisperTranscriber(AbstractTranscriber):
                     temperature=segment.temperature,
                     avg_logprob=segment.avg_logprob,
                     compression_ratio=segment.compression_ratio,
-                    start=segment.start,
-                    end=segment.end,
-                    seek=segment.seek,
+                    start=max(segment.start - time_offset, 0.0),
+                    end=max(segment.end - time_offset, 0.0),
+                    seek=max(segment.seek - seek_offset, 0),
                 )
             )
         return TranscriptionResultBundle(
@@ -1094,6 +1339,7 @@ __all__ = [
     "MLXWhisperTranscriber",
     "SubprocessMLXTranscriber",
     "PassthroughTranscriber",
+    "TranscriptionRequest",
     "TranscriptionResultBundle",
     "create_transcriber",
     "mlx_available",
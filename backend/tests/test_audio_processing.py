@@ -17,6 +17,7 @@ from wavecap_backend.audio_processing import (
 from wavecap_backend.database import StreamDatabase
 from wavecap_backend.models import (
     AlertsConfig,
+    SpeechGateConfig,
     Stream,
     StreamSource,
     StreamStatus,
@@ -423,6 +424,51 @@ def test_audio_frontend_preserves_stereo_to_mono() -> None:
     assert processed.size == mono.size
 
 
+def _reference_frontend(
+    processor: AudioFrontEndProcessor, chunks: List[np.ndarray]
+) -> np.ndarray:
+    """Per-sample implementation of the filter cascade used as an oracle."""
+    hp_in = hp_out = de_out = lp_out = 0.0
+    output: List[float] = []
+    for chunk in chunks:
+        for raw in chunk:
+            value = float(raw)
+            if processor._hp_alpha is not None:
+                hp_out = processor._hp_alpha * (hp_out + value - hp_in)
+                hp_in = value
+                value = float(np.float32(hp_out))
+            if processor._de_alpha is not None:
+                de_out = de_out + processor._de_alpha * (value - de_out)
+                value = float(np.float32(de_out))
+            if processor._lp_alpha is not None:
+                lp_out = lp_out + processor._lp_alpha * (value - lp_out)
+                value = float(np.float32(lp_out))
+            output.append(value)
+    return np.asarray(output, dtype=np.float32)
+
+
+def test_audio_frontend_matches_sample_by_sample_reference() -> None:
+    """Vectorised cascade matches the stateful per-sample filters across calls."""
+    config = AudioFrontEndConfig(
+        sample_rate=16000,
+        highpass_cutoff_hz=20.0,
+        lowpass_cutoff_hz=3800.0,
+        deemphasis_time_constant=75e-6,
+        agc_target_rms=None,
+    )
+    processor = AudioFrontEndProcessor(config)
+    rng = np.random.default_rng(1234)
+    chunks = [
+        (rng.standard_normal(size) * 0.2 + 0.1).astype(np.float32)
+        for size in (1, 7, 64, 65, 1000, 4097)
+    ]
+
+    processed = np.concatenate([processor.process(chunk) for chunk in chunks])
+    expected = _reference_frontend(processor, chunks)
+
+    np.testing.assert_allclose(processed, expected, atol=1e-6)
+
+
 # --- ChunkAccumulator Tests ---
 
 
@@ -639,6 +685,7 @@ async def test_worker_agc_boosts_quiet_audio(tmp_path: Path) -> None:
         activeSamplesInLookbackPct=0.1,
         highpassCutoffHz=None,
         agcTargetRms=0.1,  # Target RMS
+        speechGate=SpeechGateConfig(lowEnergy=False),
     )
 
     bundle = TranscriptionResultBundle("Test", [], "en", no_speech_prob=0.1)
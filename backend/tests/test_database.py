@@ -1,3 +1,6 @@
+import asyncio
+import json
+import sqlite3
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch
 import uuid
@@ -6,16 +9,21 @@ import pytest
 
 from wavecap_backend.database import (
     StreamDatabase,
+    TranscriptionCursor,
+    build_search_query,
     DB_RETRY_MAX_ATTEMPTS,
     DB_RETRY_BASE_DELAY,
 )
 from wavecap_backend.datetime_utils import utcnow
 from wavecap_backend.models import (
+    DatabaseConfig,
     Stream,
     StreamSource,
     StreamStatus,
     TranscriptionResult,
     TranscriptionReviewStatus,
+    TranscriptionSegment,
+    TranscriptionView,
 )
 
 
@@ -348,7 +356,7 @@ async def test_append_transcription_with_segments(tmp_path):
 
 @pytest.mark.asyncio
 async def test_append_transcription_with_waveform(tmp_path):
-    """Waveform data is persisted and loaded correctly."""
+    """Waveform data is persisted and loaded at 8-bit resolution."""
     db = StreamDatabase(tmp_path / "runtime.sqlite")
     stream = _make_stream()
     await db.save_stream(stream)
@@ -358,7 +366,9 @@ async def test_append_transcription_with_waveform(tmp_path):
     await db.append_transcription(tx)
 
     transcriptions = await db.load_recent_transcriptions(stream.id, limit=10)
-    assert transcriptions[0].waveform == [0.1, 0.5, 0.8, 0.3, 0.2]
+    assert transcriptions[0].waveform == pytest.approx(
+        [0.1, 0.5, 0.8, 0.3, 0.2], abs=1 / 255
+    )
 
     await db.close()
 
@@ -498,3 +508,569 @@ async def test_speech_boundary_offsets_persisted(tmp_path):
     assert transcriptions[0].speechEndOffset == 2.3
 
     await db.close()
+
+
+def _committed_transcription_count(db_path) -> int:
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM transcriptions").fetchone()[0]
+
+
+@pytest.mark.asyncio
+async def test_appends_are_committed_together_on_flush(tmp_path):
+    """Buffered appends stay uncommitted until a flush writes them at once."""
+    db_path = tmp_path / "runtime.sqlite"
+    db = StreamDatabase(db_path, config=DatabaseConfig(writeFlushIntervalSeconds=60))
+    stream = _make_stream()
+    await db.save_stream(stream)
+
+    base_time = utcnow()
+    for index in range(3):
+        await db.append_transcription(
+            _make_transcription(stream.id, base_time + timedelta(seconds=index))
+        )
+    assert _committed_transcription_count(db_path) == 0
+
+    commits = []
+    original_commit = db._commit_with_retry
+
+    async def counting_commit(session):
+        commits.append(1)
+        await original_commit(session)
+
+    db._commit_with_retry = counting_commit
+    await db.flush()
+
+    assert _committed_transcription_count(db_path) == 3
+    assert len(commits) == 1
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_other_writes_do_not_flush_buffered_appends(tmp_path):
+    db_path = tmp_path / "runtime.sqlite"
+    db = StreamDatabase(db_path, config=DatabaseConfig(writeFlushIntervalSeconds=60))
+    stream = _make_stream()
+    await db.save_stream(stream)
+    kept = _make_transcription(stream.id, utcnow())
+    reviewed = _make_transcription(stream.id, utcnow())
+    await db.append_transcription(kept)
+    await db.append_transcription(reviewed)
+
+    await db.save_stream(stream)
+    await db.remove_recordings(["missing.wav"])
+    assert _committed_transcription_count(db_path) == 0
+
+    # Reviewing a buffered row flushes first so the update is not lost.
+    await db.update_review(
+        reviewed.id, "fixed", TranscriptionReviewStatus.VERIFIED, "tester"
+    )
+    assert _committed_transcription_count(db_path) == 2
+
+    # Deleting a stream discards its buffered rows instead of committing them.
+    await db.append_transcription(_make_transcription(stream.id, utcnow()))
+    await db.delete_stream(stream.id)
+    await db.flush()
+    assert _committed_transcription_count(db_path) == 0
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_see_buffered_writes(tmp_path):
+    """Queries merge pending writes without flushing them."""
+    db_path = tmp_path / "runtime.sqlite"
+    db = StreamDatabase(db_path, config=DatabaseConfig(writeFlushIntervalSeconds=60))
+    stream = _make_stream()
+    await db.save_stream(stream)
+    committed = _make_transcription(stream.id, utcnow() - timedelta(seconds=5))
+    await db.append_transcription(committed)
+    await db.flush()
+    tx = _make_transcription(stream.id, utcnow())
+    await db.append_transcription(tx)
+    tx.text = "revised"
+    await db.append_transcription(tx)
+
+    results, has_more = await db.query_transcriptions(stream.id, limit=1)
+    recent = await db.load_recent_transcriptions(stream.id, limit=5)
+
+    assert [(item.id, item.text) for item in results] == [(tx.id, "revised")]
+    assert has_more
+    assert [item.id for item in recent] == [tx.id, committed.id]
+    assert _committed_transcription_count(db_path) == 1
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_see_rows_while_their_flush_commits(tmp_path):
+    db_path = tmp_path / "runtime.sqlite"
+    db = StreamDatabase(db_path, config=DatabaseConfig(writeFlushIntervalSeconds=60))
+    stream = _make_stream()
+    await db.save_stream(stream)
+    tx = _make_transcription(stream.id, utcnow())
+    await db.append_transcription(tx)
+    await db.update_stream_activity(stream.id, tx.timestamp)
+
+    committing = asyncio.Event()
+    release = asyncio.Event()
+    original_commit = db._commit_with_retry
+
+    async def blocked_commit(session):
+        committing.set()
+        await release.wait()
+        await original_commit(session)
+
+    db._commit_with_retry = blocked_commit
+    flush = asyncio.create_task(db.flush())
+    await asyncio.wait_for(committing.wait(), timeout=1)
+
+    recent = await db.load_recent_transcriptions(stream.id)
+    results, _ = await db.query_transcriptions(stream.id)
+    streams = await db.load_streams()
+    assert [item.id for item in recent] == [tx.id]
+    assert [item.id for item in results] == [tx.id]
+    assert streams[0].lastActivityAt == tx.timestamp
+
+    release.set()
+    await flush
+    db._commit_with_retry = original_commit
+    assert _committed_transcription_count(db_path) == 1
+    assert [item.id for item in await db.load_recent_transcriptions(stream.id)] == [
+        tx.id
+    ]
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_size_triggers_background_flush(tmp_path):
+    db_path = tmp_path / "runtime.sqlite"
+    db = StreamDatabase(
+        db_path,
+        config=DatabaseConfig(writeFlushIntervalSeconds=60, writeBatchSize=2),
+    )
+    stream = _make_stream()
+    await db.save_stream(stream)
+
+    await db.append_transcription(_make_transcription(stream.id, utcnow()))
+    await db.append_transcription(_make_transcription(stream.id, utcnow()))
+    for _ in range(100):
+        if _committed_transcription_count(db_path) == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    assert _committed_transcription_count(db_path) == 2
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_writes(tmp_path):
+    db_path = tmp_path / "runtime.sqlite"
+    db = StreamDatabase(db_path, config=DatabaseConfig(writeFlushIntervalSeconds=60))
+    stream = _make_stream()
+    await db.save_stream(stream)
+    activity = utcnow()
+    await db.append_transcription(_make_transcription(stream.id, activity))
+    await db.update_stream_activity(stream.id, activity - timedelta(minutes=1))
+    await db.update_stream_activity(stream.id, activity)
+
+    await db.close()
+
+    assert _committed_transcription_count(db_path) == 1
+    reopened = StreamDatabase(db_path)
+    streams = await reopened.load_streams()
+    assert streams[0].lastActivityAt == activity
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_append_waits_when_buffer_is_full(tmp_path):
+    db = StreamDatabase(
+        tmp_path / "runtime.sqlite",
+        config=DatabaseConfig(writeFlushIntervalSeconds=60, maxPendingWrites=1),
+    )
+    stream = _make_stream()
+    await db.save_stream(stream)
+    await db.append_transcription(_make_transcription(stream.id, utcnow()))
+
+    blocked = asyncio.create_task(
+        db.append_transcription(_make_transcription(stream.id, utcnow()))
+    )
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+
+    await db.flush()
+    await asyncio.wait_for(blocked, timeout=1)
+    results, _ = await db.query_transcriptions(stream.id)
+    assert len(results) == 2
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_rows_buffered(tmp_path):
+    db_path = tmp_path / "runtime.sqlite"
+    db = StreamDatabase(db_path, config=DatabaseConfig(writeFlushIntervalSeconds=60))
+    stream = _make_stream()
+    await db.save_stream(stream)
+    await db.append_transcription(_make_transcription(stream.id, utcnow()))
+
+    with patch.object(
+        db, "_commit_with_retry", AsyncMock(side_effect=Exception("disk I/O error"))
+    ):
+        with pytest.raises(Exception, match="disk I/O error"):
+            await db.flush()
+    assert _committed_transcription_count(db_path) == 0
+
+    await db.flush()
+    assert _committed_transcription_count(db_path) == 1
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_database_uses_wal_and_read_only_pool(tmp_path):
+    db_path = tmp_path / "runtime.sqlite"
+    db = StreamDatabase(db_path, config=DatabaseConfig(readPoolSize=2))
+    stream = _make_stream()
+    await db.save_stream(stream)
+    await db.load_streams()
+
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    async with db._read_session() as session:
+        connection = await session.connection()
+        query_only = await connection.exec_driver_sql("PRAGMA query_only")
+        assert query_only.scalar() == 1
+
+    metrics = db.metrics()
+    assert metrics["journalMode"] == "wal"
+    assert metrics["reader"]["poolSize"] == 2
+    assert metrics["reader"]["sessions"] >= 1
+    assert metrics["writer"]["sessions"] >= 1
+    assert metrics["commits"] >= 1
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_do_not_wait_for_open_write_transaction(tmp_path):
+    db = StreamDatabase(tmp_path / "runtime.sqlite")
+    stream = _make_stream()
+    await db.save_stream(stream)
+    committed = _make_transcription(stream.id, utcnow())
+    await db.append_transcription(committed)
+    await db.flush()
+
+    async with db._session(commit=False) as session:
+        # Hold the write lock with an uncommitted row while the API reads.
+        connection = await session.connection()
+        await connection.exec_driver_sql(
+            "UPDATE transcriptions SET text = 'uncommitted'"
+        )
+        results, _ = await asyncio.wait_for(
+            db.query_transcriptions(stream.id), timeout=1
+        )
+        await session.rollback()
+
+    assert [item.text for item in results] == [committed.text]
+    await db.close()
+
+
+def test_build_search_query_supports_phrases_and_prefixes():
+    assert build_search_query("horse") == '"horse"*'
+    assert build_search_query('"structure fire" eng*') == '"structure fire" "eng"*'
+    assert build_search_query('say "hi') == '"say"* "hi"*'
+    assert build_search_query('   ""  ') is None
+
+
+@pytest.mark.asyncio
+async def test_search_matches_phrases_and_pages_by_time(tmp_path):
+    db = StreamDatabase(tmp_path / "runtime.sqlite")
+    stream = _make_stream()
+    await db.save_stream(stream)
+    base_time = utcnow()
+    texts = [
+        "Structure fire on Main Street",
+        "Fire out, structure secure",
+        "Engine 4 responding to structure fire",
+    ]
+    rows = []
+    for index, text in enumerate(texts):
+        row = _make_transcription(stream.id, base_time - timedelta(seconds=index))
+        row.text = text
+        rows.append(row)
+        await db.append_transcription(row)
+
+    phrase, _ = await db.query_transcriptions(
+        stream.id, search='"structure fire"'
+    )
+    assert [item.id for item in phrase] == [rows[0].id, rows[2].id]
+
+    first_page, has_more = await db.query_transcriptions(
+        stream.id, limit=1, search="structure"
+    )
+    assert has_more is True
+    next_page, _ = await db.query_transcriptions(
+        stream.id, limit=5, search="structure", before=first_page[0].timestamp
+    )
+    assert [item.id for item in first_page + next_page] == [row.id for row in rows]
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_search_across_streams_ranked_by_relevance(tmp_path):
+    db = StreamDatabase(tmp_path / "runtime.sqlite")
+    first = _make_stream("stream-1")
+    second = _make_stream("stream-2")
+    await db.save_stream(first)
+    await db.save_stream(second)
+    weak = _make_transcription(first.id, utcnow())
+    weak.text = "Unit clear, returning to station after a long and quiet shift"
+    strong = _make_transcription(second.id, utcnow() - timedelta(seconds=30))
+    strong.text = "Ambulance ambulance"
+    weak.correctedText = "Ambulance clear"
+    for row in (weak, strong):
+        await db.append_transcription(row)
+
+    results, _ = await db.query_transcriptions(
+        None, search="ambulance", order="relevance"
+    )
+
+    assert [item.id for item in results] == [strong.id, weak.id]
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_initialize_backfills_search_index(tmp_path):
+    db_path = tmp_path / "runtime.sqlite"
+    db = StreamDatabase(db_path)
+    stream = _make_stream()
+    await db.save_stream(stream)
+    row = _make_transcription(stream.id, utcnow())
+    row.text = "Backfilled dispatch"
+    await db.append_transcription(row)
+    await db.close()
+    with sqlite3.connect(db_path) as connection:
+        for trigger in ("insert", "delete", "update"):
+            connection.execute(f"DROP TRIGGER transcriptions_fts_{trigger}")
+        connection.execute("DROP TABLE transcriptions_fts")
+
+    reopened = StreamDatabase(db_path)
+    results, _ = await reopened.query_transcriptions(stream.id, search="dispatch")
+
+    assert [item.id for item in results] == [row.id]
+    await reopened.close()
+
+
+def test_transcription_cursor_round_trips_and_rejects_garbage():
+    cursor = TranscriptionCursor(utcnow(), "abc", "after")
+
+    assert TranscriptionCursor.decode(cursor.encode()) == cursor
+    with pytest.raises(ValueError):
+        TranscriptionCursor.decode("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_through_identical_timestamps(tmp_path):
+    db = StreamDatabase(tmp_path / "runtime.sqlite")
+    stream = _make_stream()
+    await db.save_stream(stream)
+    shared_time = utcnow()
+    rows = [_make_transcription(stream.id, shared_time) for _ in range(5)]
+    for row in rows:
+        await db.append_transcription(row)
+    expected = sorted((row.id for row in rows), reverse=True)
+
+    seen = []
+    cursor = None
+    while True:
+        page, has_more = await db.query_transcriptions(
+            stream.id, limit=2, cursor=cursor
+        )
+        seen.extend(item.id for item in page)
+        if not has_more:
+            break
+        cursor = TranscriptionCursor(page[-1].timestamp, page[-1].id, "before")
+
+    assert seen == expected
+
+    newer, has_newer = await db.query_transcriptions(
+        stream.id,
+        limit=2,
+        cursor=TranscriptionCursor(shared_time, expected[-1], "after"),
+    )
+    assert [item.id for item in newer] == expected[-3:-1]
+    assert has_newer is True
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_merged_timeline_for_selected_streams(tmp_path):
+    db = StreamDatabase(tmp_path / "runtime.sqlite")
+    for stream_id in ("a", "b", "c"):
+        await db.save_stream(_make_stream(stream_id))
+    base_time = utcnow()
+    expected = []
+    for index in range(6):
+        stream_id = ("a", "b", "c")[index % 3]
+        row = _make_transcription(stream_id, base_time - timedelta(seconds=index))
+        await db.append_transcription(row)
+        if stream_id != "c":
+            expected.append(row.id)
+
+    page, has_more = await db.query_transcriptions(
+        None, limit=3, stream_ids=["a", "b"]
+    )
+    rest, rest_has_more = await db.query_transcriptions(
+        None,
+        limit=3,
+        stream_ids=["a", "b"],
+        cursor=TranscriptionCursor(page[-1].timestamp, page[-1].id, "before"),
+    )
+
+    assert has_more is True
+    assert rest_has_more is False
+    assert [item.id for item in page + rest] == expected
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_legacy_json_rows_are_read_and_migrated(tmp_path):
+    db_path = tmp_path / "runtime.sqlite"
+    db = StreamDatabase(db_path)
+    stream = _make_stream()
+    await db.save_stream(stream)
+    row = _make_transcription(stream.id, utcnow())
+    await db.append_transcription(row)
+    await db.close()
+    segment = {
+        "id": 0,
+        "text": "Legacy",
+        "no_speech_prob": 0.1,
+        "temperature": 0.0,
+        "avg_logprob": -0.4,
+        "compression_ratio": 1.1,
+        "start": 0.0,
+        "end": 1.25,
+        "seek": 0,
+    }
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "UPDATE transcriptions SET waveform = ?, segments = ?,"
+            " waveformData = NULL, segmentsData = NULL WHERE id = ?",
+            ("[0.25, 1.0]", json.dumps([segment]), row.id),
+        )
+
+    reopened = StreamDatabase(db_path)
+    [loaded] = await reopened.load_recent_transcriptions(stream.id)
+    assert loaded.waveform == pytest.approx([0.25, 1.0], abs=1 / 255)
+    assert loaded.segments[0].text == "Legacy"
+
+    await reopened.migrate_legacy_encodings()
+    assert reopened.metrics()["legacyRowsMigrated"] == 1
+    [migrated] = await reopened.load_recent_transcriptions(stream.id)
+    assert migrated.segments[0].model_dump() == segment
+    await reopened.close()
+
+    with sqlite3.connect(db_path) as connection:
+        stored = connection.execute(
+            "SELECT waveform, segments, length(waveformData), segmentsData"
+            " IS NOT NULL FROM transcriptions"
+        ).fetchone()
+    assert stored == (None, None, 3, 1)
+
+
+@pytest.mark.asyncio
+async def test_summary_view_keeps_waveform_and_skips_segments(tmp_path):
+    from wavecap_backend.models import PagerIncidentDetails
+
+    db = StreamDatabase(tmp_path / "runtime.sqlite")
+    stream = _make_stream()
+    await db.save_stream(stream)
+    row = _make_transcription(stream.id, utcnow())
+    row.correctedText = "corrected"
+    row.waveform = [0.5, 1.0]
+    row.eventMetadata = {"source": "test"}
+    row.pagerIncident = PagerIncidentDetails(incidentId="INC001")
+    row.segments = [
+        TranscriptionSegment(
+            id=0, text="transcription", start=0.0, end=1.0, seek=0,
+            no_speech_prob=0.1, temperature=0.0, avg_logprob=-0.5, compression_ratio=1.2,
+        )
+    ]
+    await db.append_transcription(row)
+
+    [summary], has_more = await db.query_transcriptions(
+        stream.id, view=TranscriptionView.SUMMARY
+    )
+    [recent] = await db.load_recent_transcriptions(
+        stream.id, view=TranscriptionView.SUMMARY
+    )
+    [full], _ = await db.query_transcriptions(stream.id)
+
+    assert not has_more
+    for item in (summary, recent):
+        assert (item.id, item.text, item.correctedText) == (
+            row.id,
+            "transcription",
+            "corrected",
+        )
+        assert item.segments is None and item.pagerIncident is None
+        # The dashboard draws the playback waveform from summary rows.
+        assert item.waveform == pytest.approx([0.5, 1.0], abs=0.01)
+        assert item.eventMetadata == {"source": "test"}
+    assert full.segments is not None and full.waveform is not None
+    assert full.pagerIncident.incidentId == "INC001"
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_recordings_use_per_stream_cutoffs(tmp_path):
+    db = StreamDatabase(tmp_path / "runtime.sqlite")
+    await db.initialize()
+    assert db.needs_recording_import
+    now = utcnow()
+    await db.import_recordings(
+        [
+            ("stream-a-1.wav", "a", now - timedelta(hours=3), 10),
+            ("stream-a-2.wav", "a", now - timedelta(minutes=5), 20),
+            ("stream-b-3.flac", "b", now - timedelta(days=30), 30),
+            ("stream-c-4.wav", "c", now - timedelta(days=10), 40),
+            ("stream-c-5.wav", "c", now - timedelta(days=1), 50),
+        ]
+    )
+    assert not db.needs_recording_import
+    # Already indexed files are left untouched by a repeated import.
+    await db.import_recordings([("stream-a-1.wav", "a", now, 99)])
+    await db.add_recording("stream-a-6.opus", "a", now - timedelta(hours=2), 60)
+
+    expired = await db.expired_recordings(
+        {"a": now - timedelta(hours=1), "b": None},
+        now - timedelta(days=7),
+    )
+    assert sorted(expired) == [
+        ("stream-a-1.wav", 10),
+        ("stream-a-6.opus", 60),
+        ("stream-c-4.wav", 40),
+    ]
+    assert await db.expired_recordings({}, now, limit=2) == [
+        ("stream-b-3.flac", 30),
+        ("stream-c-4.wav", 40),
+    ]
+
+    await db.remove_recordings(["stream-a-1.wav", "stream-a-6.opus"])
+    assert await db.stream_recordings("a") == ["stream-a-2.wav"]
+
+    await db.close()
+    reopened = StreamDatabase(tmp_path / "runtime.sqlite")
+    await reopened.initialize()
+    assert not reopened.needs_recording_import
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_recording_index_entries_commit_without_flush(tmp_path):
+    db_path = tmp_path / "runtime.sqlite"
+    db = StreamDatabase(db_path, config=DatabaseConfig(writeFlushIntervalSeconds=60))
+    await db.initialize()
+    await db.add_recording("stream-a-1.wav", "a", utcnow(), 10)
+
+    with sqlite3.connect(db_path) as connection:
+        rows = connection.execute("SELECT name, sizeBytes FROM recordings").fetchall()
+    assert rows == [("stream-a-1.wav", 10)]
+    await db.close()
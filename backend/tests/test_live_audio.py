@@ -0,0 +1,69 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from wavecap_backend.live_audio import LiveAudioRing
+
+
+def _pcm(start: int, count: int) -> np.ndarray:
+    return np.arange(start, start + count, dtype=np.int16)
+
+
+@pytest.mark.asyncio
+async def test_readers_share_ring_and_see_wrapped_writes():
+    ring = LiveAudioRing(sample_rate=8, seconds=1.0)  # 16 bytes
+    first = ring.open_reader()
+    ring.write(_pcm(0, 5))
+    assert await first.read() == _pcm(0, 5).tobytes()
+
+    # A listener joining later starts at live audio, not the backlog.
+    second = ring.open_reader()
+    assert ring.listener_count == 2
+    ring.write(_pcm(5, 5))  # wraps around the end of the buffer
+    assert await first.read() == _pcm(5, 5).tobytes()
+    assert await second.read() == _pcm(5, 5).tobytes()
+    assert second.skipped_bytes == 0
+
+    first.close()
+    first.close()
+    assert ring.listener_count == 1
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_lagging_reader_skips_ahead_to_recent_audio():
+    ring = LiveAudioRing(sample_rate=8, seconds=1.0)
+    reader = ring.open_reader()
+    for start in range(0, 40, 4):
+        ring.write(_pcm(start, 4))
+
+    chunk = await reader.read()
+
+    assert reader.skipped_bytes > 0
+    assert chunk == _pcm(40 - len(chunk) // 2, len(chunk) // 2).tobytes()
+    reader.close()
+
+
+@pytest.mark.asyncio
+async def test_close_ends_waiting_readers_but_not_new_ones():
+    ring = LiveAudioRing(sample_rate=8, seconds=1.0)
+    reader = ring.open_reader()
+    pending = asyncio.create_task(reader.read())
+    await asyncio.sleep(0)
+    assert not pending.done()
+
+    ring.close()
+    assert await pending is None
+
+    later = ring.open_reader()
+    ring.write(_pcm(0, 2))
+    assert await later.read() == _pcm(0, 2).tobytes()
+    reader.close()
+    later.close()
+
+
+def test_write_without_listeners_is_skipped():
+    ring = LiveAudioRing(sample_rate=8, seconds=1.0)
+    ring.write(_pcm(0, 4))
+    assert ring.written == 0
@@ -0,0 +1,105 @@
+from wavecap_backend.models import OverloadAction, OverloadConfig
+from wavecap_backend.overload_controller import OverloadController
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _controller(**overrides):
+    config = OverloadConfig(enabled=True, minDwellSeconds=5.0, **overrides)
+    clock = _Clock()
+    return OverloadController(config, clock=clock), clock
+
+
+def test_controller_escalates_one_level_per_dwell_period():
+    controller, clock = _controller(escalateQueueDepth=2)
+
+    first = controller.evaluate(8)
+    assert first is not None
+    assert (first.previous_level, first.level) == (0, 1)
+    assert first.actions == (OverloadAction.REDUCE_BEAM,)
+    assert controller.is_active(OverloadAction.REDUCE_BEAM)
+    assert not controller.is_active(OverloadAction.FALLBACK_MODEL)
+
+    clock.now = 1.0
+    assert controller.evaluate(8) is None
+
+    clock.now = 6.0
+    second = controller.evaluate(8)
+    assert second is not None
+    assert second.level == 2
+    assert controller.is_active(OverloadAction.FALLBACK_MODEL)
+    assert "level 2" in second.describe()
+
+
+def test_controller_steps_down_once_backlog_clears():
+    controller, clock = _controller(escalateQueueDepth=2)
+    controller.evaluate(4)
+    clock.now = 10.0
+    controller.evaluate(4)
+    assert controller.level == 2
+
+    clock.now = 20.0
+    # Still above half of level two's threshold: hold.
+    assert controller.evaluate(3) is None
+
+    recovered = controller.evaluate(1)
+    assert recovered is not None
+    assert recovered.level == 1
+    assert not recovered.escalated
+
+    clock.now = 30.0
+    controller.record_dropped_chunk()
+    final = controller.evaluate(0)
+    assert final is not None
+    assert final.level == 0
+    assert final.dropped_chunks == 1
+    assert "recovered" in final.describe()
+
+
+def test_controller_escalates_when_slower_than_real_time():
+    controller, _ = _controller(escalateQueueDepth=10, realTimeFactorLimit=1.0)
+    controller.record_processing(audio_seconds=2.0, processing_seconds=5.0)
+
+    transition = controller.evaluate(1)
+
+    assert transition is not None
+    assert transition.level == 1
+    assert transition.real_time_factor == 2.5
+    assert "real-time factor 2.50" in transition.detail()
+
+
+def test_controller_only_applies_configured_actions():
+    controller, clock = _controller(
+        escalateQueueDepth=1, actions=[OverloadAction.SKIP_LLM]
+    )
+    controller.evaluate(10)
+    clock.now = 10.0
+
+    assert controller.evaluate(10) is None
+    assert controller.level == 1
+    assert controller.is_active(OverloadAction.SKIP_LLM)
+    assert not controller.is_active(OverloadAction.REDUCE_BEAM)
+
+
+def test_controller_skips_actions_the_backend_cannot_honour():
+    config = OverloadConfig(enabled=True, escalateQueueDepth=1)
+    controller = OverloadController(
+        config, backend_actions=[OverloadAction.REDUCE_BEAM]
+    )
+
+    transition = controller.evaluate(10)
+    assert transition is not None
+    assert transition.actions == (OverloadAction.REDUCE_BEAM,)
+
+    controller = OverloadController(config, backend_actions=())
+    transition = controller.evaluate(10)
+    assert transition is not None
+    # Level 1 is the first action the backend does not need to honour.
+    assert transition.actions == (OverloadAction.SKIP_LLM,)
+    assert not controller.is_active(OverloadAction.FALLBACK_MODEL)
@@ -0,0 +1,130 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from wavecap_backend.database import StreamDatabase
+from wavecap_backend.datetime_utils import utcnow
+from wavecap_backend.models import (
+    RecordingFormat,
+    Stream,
+    StreamStatus,
+    TranscriptionResult,
+)
+from wavecap_backend.recording_storage import (
+    recording_media_type,
+    transcode_recording,
+    write_recording,
+)
+from wavecap_backend.state_paths import resolve_recording_file
+from wavecap_backend.stream_manager import StreamManager
+from wavecap_backend.tools.transcode_recordings import transcode_recordings
+
+
+def _tone(sample_rate: int = 16000, seconds: float = 0.5) -> np.ndarray:
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    return (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("recording_format", "suffix", "media_type"),
+    [
+        (RecordingFormat.WAV, ".wav", "audio/wav"),
+        (RecordingFormat.FLAC, ".flac", "audio/flac"),
+        (RecordingFormat.OPUS, ".opus", "audio/ogg; codecs=opus"),
+    ],
+)
+async def test_write_recording_encodes_requested_format(
+    tmp_path, recording_format, suffix, media_type
+):
+    path = await write_recording(
+        tmp_path / "stream-a-1.wav", _tone(), 16000, recording_format
+    )
+
+    assert path == tmp_path / f"stream-a-1{suffix}"
+    assert recording_media_type(path) == media_type
+    info = sf.info(str(path))
+    assert info.samplerate == 16000
+    assert info.frames > 0
+    assert [item.name for item in tmp_path.iterdir()] == [path.name]
+
+
+@pytest.mark.asyncio
+async def test_opus_falls_back_to_flac_for_unsupported_rates(tmp_path):
+    path = await write_recording(
+        tmp_path / "stream-a-1.wav", _tone(22050), 22050, RecordingFormat.OPUS
+    )
+
+    assert path.suffix == ".flac"
+
+
+def test_transcode_to_flac_is_lossless_and_keeps_mtime(tmp_path):
+    source = tmp_path / "stream-a-1.wav"
+    sf.write(source, _tone(), 16000)
+    os.utime(source, (1_000_000, 1_000_000))
+    original, _ = sf.read(str(source), dtype="int16")
+
+    target = transcode_recording(source, RecordingFormat.FLAC)
+
+    assert target.name == "stream-a-1.flac"
+    assert not source.exists()
+    assert target.stat().st_mtime == 1_000_000
+    decoded, _ = sf.read(str(target), dtype="int16")
+    np.testing.assert_array_equal(decoded, original)
+    assert resolve_recording_file("stream-a-1.wav", tmp_path) == target
+    assert resolve_recording_file("../stream-a-1.wav", tmp_path) is None
+    assert StreamManager._extract_stream_id_from_recording(target) == "a"
+
+
+@pytest.mark.asyncio
+async def test_transcode_tool_rewrites_recording_urls(tmp_path):
+    recordings = tmp_path / "recordings"
+    recordings.mkdir()
+    sf.write(recordings / "stream-a-1.wav", _tone(), 16000)
+    sf.write(recordings / "stream-b-2.wav", _tone(), 16000)
+    db_path = tmp_path / "runtime.sqlite"
+    db = StreamDatabase(db_path)
+    for stream_id, name in (("a", "stream-a-1.wav"), ("b", "stream-b-2.wav")):
+        await db.save_stream(
+            Stream(
+                id=stream_id,
+                name=stream_id,
+                url="http://example.com",
+                status=StreamStatus.STOPPED,
+                createdAt=utcnow(),
+            )
+        )
+        await db.append_transcription(
+            TranscriptionResult.model_construct(
+                id=f"tx-{stream_id}",
+                streamId=stream_id,
+                text="hello",
+                timestamp=utcnow(),
+                recordingUrl=f"/recordings/{name}",
+            )
+        )
+    await db.close()
+
+    summary = await transcode_recordings(
+        db_path, recordings, RecordingFormat.FLAC, stream_id="a"
+    )
+
+    assert summary.renames == {"stream-a-1.wav": "stream-a-1.flac"}
+    assert summary.updated_transcriptions == 1
+    assert sorted(path.name for path in recordings.iterdir()) == [
+        "stream-a-1.flac",
+        "stream-b-2.wav",
+    ]
+    reopened = StreamDatabase(db_path)
+    urls = {
+        item.id: item.recordingUrl
+        for item in await reopened.export_transcriptions()
+    }
+    await reopened.close()
+    assert urls == {
+        "tx-a": "/recordings/stream-a-1.flac",
+        "tx-b": "/recordings/stream-b-2.wav",
+    }
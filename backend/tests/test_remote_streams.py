@@ -0,0 +1,196 @@
+import asyncio
+
+import pytest
+
+from wavecap_backend import remote_streams
+from wavecap_backend.models import RemoteUpstreamConfig
+from wavecap_backend.remote_streams import MultiUpstreamSelector
+
+
+def _selector() -> MultiUpstreamSelector:
+    return MultiUpstreamSelector(
+        [
+            RemoteUpstreamConfig(id="backup", mode="push", priority=1),
+            RemoteUpstreamConfig(id="primary", mode="push", priority=5),
+        ],
+        target_sample_rate=16000,
+        read_size_bytes=4096,
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_prefers_highest_priority_and_discards_backlog():
+    selector = _selector()
+    await selector.push_bytes("backup", b"b1")
+    assert await selector.read(timeout=0.1) == ("backup", b"b1")
+
+    await selector.push_bytes("backup", b"b2")
+    await selector.push_bytes("primary", b"p1")
+    await selector.push_bytes("backup", b"b3")
+
+    assert await selector.read(timeout=0.1) == ("primary", b"p1")
+    # Backup audio is dropped while the primary is live.
+    assert await selector.read(timeout=0.05) is None
+    states = {state.id: state.active for state in selector.states()}
+    assert states == {"primary": True, "backup": False}
+
+
+@pytest.mark.asyncio
+async def test_read_fails_over_when_primary_goes_quiet(monkeypatch):
+    monkeypatch.setattr(remote_streams, "UPSTREAM_FAILOVER_SECONDS", 0.05)
+    selector = _selector()
+    await selector.push_bytes("primary", b"p1")
+    assert await selector.read(timeout=0.1) == ("primary", b"p1")
+
+    await asyncio.sleep(0.06)
+    await selector.push_bytes("backup", b"b1")
+    assert await selector.read(timeout=0.1) == ("backup", b"b1")
+
+
+@pytest.mark.asyncio
+async def test_read_waits_for_push_and_times_out():
+    selector = _selector()
+    reader = asyncio.create_task(selector.read(timeout=1.0))
+    await asyncio.sleep(0.01)
+    await selector.push_bytes("primary", b"late")
+    assert await reader == ("primary", b"late")
+
+    assert await selector.read(timeout=0.01) is None
+    with pytest.raises(ValueError):
+        await selector.push_bytes("missing", b"x")
+
+
+def _pull_selector(monkeypatch):
+    started = []
+
+    async def fake_start(self):
+        started.append(self.cfg.id)
+        self.stop_event.clear()
+
+    async def fake_stop(self):
+        self.stop_event.set()
+
+    monkeypatch.setattr(remote_streams._PullProcess, "start", fake_start)
+    monkeypatch.setattr(remote_streams._PullProcess, "stop", fake_stop)
+    selector = MultiUpstreamSelector(
+        [
+            RemoteUpstreamConfig(id="primary", url="http://a", priority=5),
+            RemoteUpstreamConfig(id="standby", url="http://b", priority=1),
+        ],
+        target_sample_rate=16000,
+        read_size_bytes=4096,
+    )
+    return selector, started
+
+
+@pytest.mark.asyncio
+async def test_standby_pull_stays_idle_until_primary_stalls(monkeypatch):
+    monkeypatch.setattr(remote_streams, "UPSTREAM_FAILOVER_SECONDS", 0.05)
+    monkeypatch.setattr(remote_streams, "STANDBY_RESTORE_SECONDS", 0.05)
+    selector, started = _pull_selector(monkeypatch)
+    await selector.start()
+    assert started == ["primary"]
+
+    selector._deliver("primary", b"p1")
+    assert await selector.read(timeout=0.1) == ("primary", b"p1")
+    assert started == ["primary"]
+    states = {state.id: state for state in selector.states()}
+    assert states["standby"].standby is True
+    assert states["standby"].standbySeconds >= 0.0
+
+    # Primary goes quiet: the standby decoder is started.
+    await asyncio.sleep(0.06)
+    assert await selector.read(timeout=0.01) is None
+    assert started == ["primary", "standby"]
+    selector._deliver("standby", b"s1")
+    assert await selector.read(timeout=0.1) == ("standby", b"s1")
+    standby = {state.id: state for state in selector.states()}["standby"]
+    assert standby.standby is False
+    assert standby.failovers == 1
+    assert standby.lastFailoverMs is not None and standby.lastFailoverMs >= 50
+
+    # Primary recovers and stays live: the standby returns to idle.
+    selector._deliver("primary", b"p2")
+    assert await selector.read(timeout=0.1) == ("primary", b"p2")
+    await asyncio.sleep(0.03)
+    selector._deliver("primary", b"p3")
+    assert await selector.read(timeout=0.1) == ("primary", b"p3")
+    await asyncio.sleep(0.03)
+    selector._deliver("primary", b"p4")
+    assert await selector.read(timeout=0.1) == ("primary", b"p4")
+    standby = {state.id: state for state in selector.states()}["standby"]
+    assert standby.standby is True
+    assert selector._pulls["standby"].stop_event.is_set()
+
+
+@pytest.mark.asyncio
+async def test_hot_standby_pull_starts_immediately(monkeypatch):
+    selector, started = _pull_selector(monkeypatch)
+    selector._pulls["standby"].cfg.standby = False
+    await selector.start()
+    assert started == ["primary", "standby"]
+    assert not any(state.standby for state in selector.states())
+
+
+async def _trunked_selector(monkeypatch) -> MultiUpstreamSelector:
+    from wavecap_backend.trunked_radio import TrunkedRadioClient
+
+    async def fake_start(self):
+        return None
+
+    monkeypatch.setattr(TrunkedRadioClient, "start", fake_start)
+    selector = MultiUpstreamSelector(
+        [
+            RemoteUpstreamConfig(id="busy", mode="trunked", url="ws://a", priority=5),
+            RemoteUpstreamConfig(id="quiet", mode="trunked", url="ws://b", priority=1),
+        ],
+        target_sample_rate=16000,
+        read_size_bytes=4096,
+    )
+    await selector.start()
+    return selector
+
+
+async def _send_call(selector, source_id: str, call_id: int) -> None:
+    from wavecap_backend.trunked_radio import encode_binary_call
+
+    await selector._trunked_clients[source_id]._process_message(
+        encode_binary_call(
+            {"talkgroupId": 100, "streamId": f"{source_id}-{call_id}"}, b"\0\0" * 8
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_trunked_wakes_on_call_without_polling_quiet_client(monkeypatch):
+    selector = await _trunked_selector(monkeypatch)
+    # The quiet client comes second; a waiting read must not sit on it.
+    selector._trunked_cursor = 1
+    reader = asyncio.create_task(selector.read_trunked(timeout=5.0))
+    await asyncio.sleep(0.01)
+    started = asyncio.get_running_loop().time()
+    await _send_call(selector, "busy", 1)
+    source_id, chunk = await reader
+    assert (source_id, chunk.stream_id) == ("busy", "busy-1")
+    assert asyncio.get_running_loop().time() - started < 0.1
+    assert await selector.read_trunked(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_read_trunked_round_robins_and_reports_lag(monkeypatch):
+    selector = await _trunked_selector(monkeypatch)
+    for call_id in range(3):
+        await _send_call(selector, "busy", call_id)
+    await _send_call(selector, "quiet", 0)
+    await asyncio.sleep(0.02)
+
+    order = []
+    for _ in range(4):
+        source_id, chunk = await selector.read_trunked(timeout=0.1)
+        order.append(chunk.stream_id)
+    assert order == ["busy-0", "quiet-0", "busy-1", "busy-2"]
+
+    states = {state.id: state for state in selector.states()}
+    assert states["quiet"].queueLagMs >= 20
+    assert states["busy"].maxQueueLagMs >= states["busy"].queueLagMs
+    assert states["busy"].pendingCalls == 0
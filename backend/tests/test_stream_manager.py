@@ -1,12 +1,14 @@
 import asyncio
+import json
 import logging
 import os
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Iterable
 
 import pytest
 
-from wavecap_backend.database import StreamDatabase
+from wavecap_backend.database import StreamDatabase, TranscriptionCursor
 from wavecap_backend.datetime_utils import utcnow
 from wavecap_backend.models import (
     PagerIncidentDetails,
@@ -15,6 +17,8 @@ from wavecap_backend.models import (
     StreamSource,
     StreamStatus,
     TranscriptionEventType,
+    TranscriptionResult,
+    TranscriptionSegment,
     UpdateStreamRequest,
 )
 from wavecap_backend.stream_defaults import (
@@ -31,6 +35,7 @@ from wavecap_backend.stream_manager import (
     UPSTREAM_DISCONNECTED_MESSAGE,
     UPSTREAM_RECONNECTED_MESSAGE,
 )
+from wavecap_backend import stream_manager as stream_manager_module
 from wavecap_backend.whisper_transcriber import PassthroughTranscriber
 
 
@@ -169,6 +174,56 @@ async def test_initialize_removes_missing_streams(minimal_config, tmp_path):
         await _shutdown_manager(manager_two)
 
 
+@pytest.mark.asyncio
+async def test_initialize_loads_summary_rows_except_for_pager_streams(
+    minimal_config, tmp_path
+):
+    config = minimal_config.model_copy(deep=True)
+    config.streams = [
+        _audio_stream(stream_id="dispatch"),
+        _pager_stream(stream_id="pager-1", token="secret-token"),
+    ]
+    manager_one = _build_manager(config, tmp_path)
+    await _start_manager(manager_one)
+    for stream_id in ("dispatch", "pager-1"):
+        await manager_one.database.append_transcription(
+            TranscriptionResult(
+                id=f"{stream_id}-row",
+                streamId=stream_id,
+                text="Units respond",
+                timestamp=utcnow(),
+                waveform=[0.5, 1.0],
+                segments=[
+                    TranscriptionSegment(
+                        id=0, text="Units respond", start=0.0, end=1.0, seek=0,
+                        no_speech_prob=0.1, temperature=0.0, avg_logprob=-0.5,
+                        compression_ratio=1.2,
+                    )
+                ],
+                pagerIncident=PagerIncidentDetails(incidentId="INC-7"),
+            )
+        )
+    await manager_one.database.flush()
+    await _shutdown_manager(manager_one)
+
+    manager_two = _build_manager(config, tmp_path)
+    await _start_manager(manager_two)
+    try:
+        streams = {stream.id: stream for stream in manager_two.get_streams()}
+        [dispatch_row] = [
+            row for row in streams["dispatch"].transcriptions if row.id == "dispatch-row"
+        ]
+        [pager_row] = [
+            row for row in streams["pager-1"].transcriptions if row.id == "pager-1-row"
+        ]
+        assert dispatch_row.segments is None and dispatch_row.pagerIncident is None
+        assert dispatch_row.waveform is not None
+        assert pager_row.segments is not None
+        assert pager_row.pagerIncident.incidentId == "INC-7"
+    finally:
+        await _shutdown_manager(manager_two)
+
+
 @pytest.mark.asyncio
 async def test_start_and_stop_stream_records_events(minimal_config, tmp_path):
     config = minimal_config.model_copy(deep=True)
@@ -224,21 +279,29 @@ async def test_prune_expired_recordings_respects_per_stream_retention(
     try:
         now = utcnow().timestamp()
 
-        def _write(stream_id: str, age_seconds: float, suffix: int) -> Path:
+        async def _write(stream_id: str, age_seconds: float, suffix: int) -> Path:
             file_path = recordings_dir / f"stream-{stream_id}-{suffix}.wav"
             file_path.write_bytes(b"\x00")
             timestamp = now - age_seconds
             os.utime(file_path, (timestamp, timestamp))
+            await manager.database.add_recording(
+                file_path.name,
+                stream_id,
+                datetime.fromtimestamp(timestamp, tz=timezone.utc),
+                1,
+            )
             return file_path
 
-        expired_default = _write(
+        expired_default = await _write(
             "default-retention", DEFAULT_RECORDING_RETENTION_SECONDS + 10, 1
         )
-        fresh_default = _write(
+        fresh_default = await _write(
             "default-retention", DEFAULT_RECORDING_RETENTION_SECONDS - 10, 2
         )
-        expired_short = _write("short-retention", 30, 3)
-        keep_forever = _write("keep-forever", DEFAULT_RECORDING_RETENTION_SECONDS * 2, 4)
+        expired_short = await _write("short-retention", 30, 3)
+        keep_forever = await _write(
+            "keep-forever", DEFAULT_RECORDING_RETENTION_SECONDS * 2, 4
+        )
 
         await manager._prune_expired_recordings()
 
@@ -250,6 +313,46 @@ async def test_prune_expired_recordings_respects_per_stream_retention(
         await _shutdown_manager(manager)
 
 
+@pytest.mark.asyncio
+async def test_existing_recordings_are_indexed_on_first_start(
+    minimal_config, tmp_path
+):
+    config = minimal_config.model_copy(deep=True)
+    config.streams = [
+        _audio_stream(
+            stream_id="short-retention",
+            enabled=True,
+            recording_retention_seconds=20,
+        )
+    ]
+    recordings_dir = tmp_path / "recordings"
+    recordings_dir.mkdir(parents=True, exist_ok=True)
+    old_timestamp = utcnow().timestamp() - 60
+    expired = recordings_dir / "stream-short-retention-1.wav"
+    fresh = recordings_dir / "stream-short-retention-2.flac"
+    orphaned = recordings_dir / "stream-removed-3.wav"
+    for path in (expired, fresh, orphaned):
+        path.write_bytes(b"\x00")
+    os.utime(expired, (old_timestamp, old_timestamp))
+
+    manager = _build_manager(config, tmp_path)
+    await _start_manager(manager)
+    try:
+        assert not expired.exists()
+        assert fresh.exists()
+        assert sorted(
+            await manager.database.stream_recordings("short-retention")
+        ) == [fresh.name]
+        assert not manager.database.needs_recording_import
+
+        await manager.reset_stream("short-retention")
+        assert not fresh.exists()
+        assert await manager.database.stream_recordings("short-retention") == []
+        assert orphaned.exists()
+    finally:
+        await _shutdown_manager(manager)
+
+
 @pytest.mark.asyncio
 async def test_update_stream_fields(minimal_config, tmp_path):
     config = minimal_config.model_copy(deep=True)
@@ -270,6 +373,44 @@ async def test_update_stream_fields(minimal_config, tmp_path):
         await _shutdown_manager(manager)
 
 
+@pytest.mark.asyncio
+async def test_stream_changes_broadcast_as_versioned_patches(minimal_config, tmp_path):
+    config = minimal_config.model_copy(deep=True)
+    config.streams = [
+        _audio_stream(stream_id="first"),
+        _audio_stream(stream_id="second"),
+    ]
+    manager = _build_manager(config, tmp_path)
+    await _start_manager(manager)
+    try:
+        snapshot = manager.streams_snapshot_event()
+        assert snapshot.type == "streams_update"
+        assert manager.streams_snapshot_event() is snapshot
+        assert {entry["id"]: entry["version"] for entry in snapshot.payload} == {
+            "first": 1,
+            "second": 1,
+        }
+
+        queue = await manager.broadcaster.register()
+        await manager.update_stream("first", UpdateStreamRequest(name="Renamed"))
+        event = queue.get_nowait()
+        assert event.type == "streams_patch"
+        assert event.revision == snapshot.revision + 1
+        assert event.payload == [{"id": "first", "version": 2, "name": "Renamed"}]
+
+        # Re-applying the same values produces no broadcast at all.
+        await manager._broadcast_streams()
+        assert queue.empty()
+
+        resync = manager.streams_snapshot_event()
+        assert resync.revision == event.revision
+        names = {entry["id"]: entry["name"] for entry in resync.payload}
+        assert names["first"] == "Renamed"
+        await manager.broadcaster.unregister(queue)
+    finally:
+        await _shutdown_manager(manager)
+
+
 @pytest.mark.asyncio
 async def test_reset_stream_clears_transcriptions(minimal_config, tmp_path):
     config = minimal_config.model_copy(deep=True)
@@ -345,6 +486,46 @@ async def test_ingest_pager_message_appends_transcription(minimal_config, tmp_pa
         await _shutdown_manager(manager)
 
 
+@pytest.mark.asyncio
+async def test_query_transcriptions_returns_keyset_cursors(minimal_config, tmp_path):
+    config = minimal_config.model_copy(deep=True)
+    config.streams = [_audio_stream(enabled=False)]
+    manager = _build_manager(config, tmp_path)
+    await _start_manager(manager)
+    try:
+        stream = manager.get_streams()[0]
+        base_time = utcnow()
+        ids = []
+        for index in range(3):
+            result = TranscriptionResult(
+                id=f"tx-{index}",
+                streamId=stream.id,
+                text=f"call {index}",
+                timestamp=base_time - timedelta(seconds=index),
+            )
+            ids.append(result.id)
+            await manager.database.append_transcription(result)
+
+        first = await manager.query_transcriptions(stream.id, limit=2)
+        assert [item.id for item in first.transcriptions] == ids[:2]
+        assert first.hasMoreBefore is True
+        assert first.prevCursor is None
+
+        second = await manager.query_transcriptions(
+            stream.id, limit=2, cursor=TranscriptionCursor.decode(first.nextCursor)
+        )
+        assert [item.id for item in second.transcriptions] == ids[2:]
+        assert second.nextCursor is None
+        assert second.hasMoreAfter is True
+
+        back = await manager.query_transcriptions(
+            stream.id, limit=2, cursor=TranscriptionCursor.decode(second.prevCursor)
+        )
+        assert [item.id for item in back.transcriptions] == ids[:2]
+    finally:
+        await _shutdown_manager(manager)
+
+
 @pytest.mark.asyncio
 async def test_initialize_applies_broadcastify_preroll(minimal_config, tmp_path):
     config = minimal_config.model_copy(deep=True)
@@ -436,6 +617,176 @@ async def test_broadcaster_logs_warning_on_queue_overflow(caplog):
     await broadcaster.unregister(queue)
 
 
+@pytest.mark.asyncio
+async def test_broadcaster_serialises_each_event_once(monkeypatch):
+    calls = []
+    original = stream_manager_module.jsonable_encoder
+
+    def counting_encoder(value):
+        calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(stream_manager_module, "jsonable_encoder", counting_encoder)
+    broadcaster = StreamEventBroadcaster()
+    queues = [await broadcaster.register() for _ in range(5)]
+    event = StreamEvent("transcription", {"timestamp": utcnow(), "text": "hi"})
+
+    await broadcaster.publish(event)
+
+    frames = [queue.get_nowait().text_frame() for queue in queues]
+    assert len(calls) == 1
+    assert all(frame is frames[0] for frame in frames)
+    decoded = json.loads(frames[0])
+    assert decoded["type"] == "transcription"
+    assert decoded["data"]["text"] == "hi"
+
+
+def test_stream_event_binary_frame_round_trips():
+    msgpack = pytest.importorskip("msgpack")
+    event = StreamEvent("streams_update", [{"id": "a", "enabled": True}])
+
+    frame = event.binary_frame()
+
+    assert event.binary_frame() is frame
+    assert msgpack.unpackb(frame) == json.loads(event.text_frame())
+
+
+@pytest.mark.asyncio
+async def test_subscription_topics_narrow_events():
+    broadcaster = StreamEventBroadcaster()
+    everything = await broadcaster.register()
+    narrowed = await broadcaster.register()
+    narrowed.set_topics(stream_ids=["a"])
+    also_narrowed = await broadcaster.register()
+    also_narrowed.set_topics(stream_ids=["a"])
+    patches_only = await broadcaster.register()
+    patches_only.set_topics(event_types=["streams_patch"])
+
+    patch = StreamEvent(
+        "streams_patch",
+        [{"id": "a", "version": 2}, {"id": "b", "version": 5}],
+        revision=7,
+    )
+    alert = StreamEvent(
+        "transcription",
+        {"streamId": "b", "alerts": [{"ruleId": "fire"}]},
+        stream_id="b",
+    )
+    await broadcaster.publish(patch)
+    await broadcaster.publish(
+        StreamEvent("transcription", {"streamId": "b"}, stream_id="b")
+    )
+    await broadcaster.publish(alert)
+
+    assert everything.qsize() == 3
+    assert everything.get_nowait() is patch
+    # Stream state stays complete; only per-stream events are narrowed, and
+    # transcriptions that raised an alert get through for every stream.
+    assert narrowed.get_nowait() is patch
+    assert narrowed.get_nowait() is alert
+    assert narrowed.empty()
+    assert also_narrowed.get_nowait() is patch
+    assert also_narrowed.get_nowait() is alert
+    assert patches_only.get_nowait() is patch
+    assert patches_only.empty()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_coalesces_state_and_keeps_transcriptions():
+    broadcaster = StreamEventBroadcaster(max_queue_size=3)
+    queue = await broadcaster.register()
+
+    await broadcaster.publish(
+        StreamEvent(
+            "streams_patch",
+            [{"id": "a", "version": 1, "status": "queued"}],
+            revision=1,
+        )
+    )
+    await broadcaster.publish(StreamEvent("transcription", {"text": "one"}))
+    for revision, status in ((2, "transcribing"), (3, "error")):
+        await broadcaster.publish(
+            StreamEvent(
+                "streams_patch",
+                [{"id": "a", "version": revision, "status": status}],
+                revision=revision,
+            )
+        )
+    await broadcaster.publish(
+        StreamEvent(
+            "streams_patch", [{"id": "b", "version": 1, "name": "B"}], revision=4
+        )
+    )
+    await broadcaster.publish(StreamEvent("transcription", {"text": "two"}))
+
+    merged = queue.get_nowait()
+    assert merged.revision == 4
+    assert merged.payload == [
+        {"id": "a", "version": 3, "status": "error"},
+        {"id": "b", "version": 1, "name": "B"},
+    ]
+    assert [queue.get_nowait().payload["text"] for _ in range(2)] == ["one", "two"]
+    assert queue.empty()
+
+    # Once the merged patch is delivered, new state events queue afresh.
+    await broadcaster.publish(
+        StreamEvent("streams_patch", [{"id": "a", "version": 4}], revision=5)
+    )
+    assert queue.get_nowait().revision == 5
+
+
+@pytest.mark.asyncio
+async def test_resume_after_coalesced_patch_replays_queued_events():
+    broadcaster = StreamEventBroadcaster()
+    queue = await broadcaster.register()
+    await broadcaster.publish(
+        StreamEvent("streams_patch", [{"id": "a", "version": 1}], revision=1)
+    )
+    await broadcaster.publish(StreamEvent("transcription", {"text": "one"}))
+    await broadcaster.publish(
+        StreamEvent("streams_patch", [{"id": "a", "version": 2}], revision=2)
+    )
+
+    merged = queue.get_nowait()
+    assert (merged.seq, merged.revision) == (1, 2)
+
+    # The connection drops here; the client resumes from the last seq it saw.
+    resumed = await broadcaster.register(since=merged.seq, epoch=broadcaster.epoch)
+    assert resumed.resumed
+    replayed = [resumed.get_nowait() for _ in range(resumed.qsize())]
+    assert [(event.type, event.seq) for event in replayed] == [
+        ("transcription", 2),
+        ("streams_patch", 3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reconnecting_subscriber_replays_missed_events():
+    broadcaster = StreamEventBroadcaster(replay_size=3)
+    for index in range(3):
+        await broadcaster.publish(StreamEvent("transcription", {"index": index}))
+    assert broadcaster.last_seq == 3
+
+    resumed = await broadcaster.register(since=1, epoch=broadcaster.epoch)
+    assert resumed.resumed
+    assert [resumed.get_nowait().seq for _ in range(2)] == [2, 3]
+    assert json.loads(broadcaster._history[-1].text_frame())["seq"] == 3
+
+    up_to_date = await broadcaster.register(since=3, epoch=broadcaster.epoch)
+    assert up_to_date.resumed and up_to_date.empty()
+
+    await broadcaster.publish(StreamEvent("transcription", {"index": 3}))
+    # Sequence 1 has been evicted, and epochs from another process never match.
+    evicted = await broadcaster.register(since=0, epoch=broadcaster.epoch)
+    other_epoch = await broadcaster.register(since=3, epoch="previous-run")
+    fresh = await broadcaster.register()
+    await broadcaster.publish(StreamEvent("transcription", {"index": 4}))
+    for subscription in (evicted, other_epoch, fresh):
+        assert not subscription.resumed
+        assert subscription.get_nowait().seq == 5
+        assert subscription.empty()
+
+
 # --- Tests for pure utility functions ---
 
 
@@ -15,6 +15,9 @@ from wavecap_backend.alerts import TranscriptionAlertEvaluator
 from wavecap_backend.database import StreamDatabase
 from wavecap_backend.models import (
     AlertsConfig,
+    OverloadAction,
+    OverloadConfig,
+    SpeechGateConfig,
     Stream,
     StreamSource,
     StreamStatus,
@@ -233,6 +236,72 @@ async def test_worker_falls_back_when_blocking_not_supported(tmp_path):
     assert len(transcriber.calls) == 1
 
 
+class DegradableTranscriber(AbstractTranscriber):
+    overload_actions = frozenset(
+        {OverloadAction.REDUCE_BEAM, OverloadAction.FALLBACK_MODEL}
+    )
+
+    def __init__(self) -> None:
+        self.calls: List[dict] = []
+
+    def transcribe_blocking(self, audio, sample_rate, language, **kwargs):
+        self.calls.append(kwargs)
+        return TranscriptionResultBundle("degraded", [], language)
+
+
+@pytest.mark.asyncio
+async def test_worker_passes_overload_overrides_to_executor(tmp_path):
+    executor = TranscriptionExecutor(worker_count=1, queue_size=4)
+    await executor.start()
+    config = WhisperConfig(
+        sampleRate=16000,
+        overload=OverloadConfig(
+            enabled=True, escalateQueueDepth=1, minDwellSeconds=0, reducedBeamSize=2
+        ),
+    )
+    stream = Stream(
+        id="stream-1",
+        name="Example",
+        url="http://example.com/audio",
+        status=StreamStatus.STOPPED,
+        createdAt=datetime.utcnow(),
+        transcriptions=[],
+        source=StreamSource.AUDIO,
+    )
+
+    async def noop_transcription(_transcription: TranscriptionResult) -> None:
+        return
+
+    async def noop_status(_stream: Stream, _status: StreamStatus) -> None:
+        return
+
+    transcriber = DegradableTranscriber()
+    worker = StreamWorker(
+        stream=stream,
+        transcriber=transcriber,
+        transcription_executor=executor,
+        database=StreamDatabase(tmp_path / "runtime.sqlite"),
+        alert_evaluator=TranscriptionAlertEvaluator(
+            AlertsConfig(enabled=False, rules=[])
+        ),
+        on_transcription=noop_transcription,
+        on_status_change=noop_status,
+        config=config,
+    )
+    worker._overload.evaluate(10)
+    worker._overload.evaluate(10)
+
+    audio = np.zeros(16000, dtype=np.float32)
+    try:
+        await worker._run_transcription(audio, worker.sample_rate, None)
+    finally:
+        await executor.close()
+
+    assert transcriber.calls == [
+        {"initial_prompt": None, "beam_size": 2, "use_fallback_model": True}
+    ]
+
+
 @pytest.mark.asyncio
 async def test_worker_canonicalizes_domain_phrases(tmp_path):
     config = WhisperConfig(
@@ -627,6 +696,7 @@ async def test_worker_boosts_quiet_audio_before_transcription(tmp_path):
         silenceLookbackSeconds=0.25,
         silenceHoldSeconds=0.25,
         activeSamplesInLookbackPct=0.1,
+        speechGate=SpeechGateConfig(lowEnergy=False),
     )
 
     segment = TranscriptionSegment(
@@ -966,6 +1036,7 @@ async def test_worker_discards_hallucinated_silence(tmp_path):
         blankAudioMinActiveRatio=0.0,
         blankAudioMinRms=0.0,
         silenceHallucinationPhrases=["thank you"],
+        speechGate=SpeechGateConfig(lowEnergy=False),
     )
 
     bundle = TranscriptionResultBundle("Thank you.", [], "en", no_speech_prob=0.2)
@@ -1013,35 +1084,10 @@ async def test_worker_discards_hallucinated_silence(tmp_path):
     assert len(transcriber.calls) == 1
 
 
-@pytest.mark.asyncio
-async def test_worker_drops_low_energy_transcription(tmp_path):
-    config = WhisperConfig(
-        sampleRate=16000,
-        chunkLength=4,
-        minChunkDurationSeconds=1.0,
-        contextSeconds=0.0,
-        silenceThreshold=0.01,
-        silenceLookbackSeconds=0.25,
-        silenceHoldSeconds=0.25,
-        activeSamplesInLookbackPct=0.1,
-        blankAudioMinDurationSeconds=0.5,
-        blankAudioMinActiveRatio=0.0,
-        blankAudioMinRms=0.02,
-        silenceHallucinationPhrases=[],
-    )
-
-    bundle = TranscriptionResultBundle(
-        "Noarlunga, Noarlunga, SITREP.",
-        [],
-        "en",
-        no_speech_prob=0.3,
-        avg_logprob=-1.2,
-    )
-    transcriber = StubTranscriber([bundle])
-
+def _gate_worker(tmp_path, config: WhisperConfig, captured: List[TranscriptionResult]):
     stream = Stream(
-        id="stream-low-energy-drop",
-        name="Low energy",
+        id="stream-gate",
+        name="Gate",
         url="http://example.com/audio",
         status=StreamStatus.STOPPED,
         createdAt=datetime.utcnow(),
@@ -1049,35 +1095,164 @@ async def test_worker_drops_low_energy_transcription(tmp_path):
         source=StreamSource.AUDIO,
     )
 
-    db = StreamDatabase(tmp_path / "runtime.sqlite")
-    evaluator = TranscriptionAlertEvaluator(AlertsConfig(enabled=False, rules=[]))
-    captured: List[TranscriptionResult] = []
-
     async def capture(transcription: TranscriptionResult) -> None:
         captured.append(transcription)
 
     async def noop_status(_stream: Stream, _status: StreamStatus) -> None:
         return
 
-    worker = StreamWorker(
+    return StreamWorker(
         stream=stream,
-        transcriber=transcriber,
-        database=db,
-        alert_evaluator=evaluator,
+        # Raises if the gate lets a chunk through to the model.
+        transcriber=StubTranscriber([]),
+        database=StreamDatabase(tmp_path / "runtime.sqlite"),
+        alert_evaluator=TranscriptionAlertEvaluator(
+            AlertsConfig(enabled=False, rules=[])
+        ),
         on_transcription=capture,
         on_status_change=noop_status,
         config=config,
     )
 
-    rng = np.random.default_rng(12345)
-    noise = rng.normal(0.0, 0.002, 16000)
-    pcm = np.clip(noise, -1.0, 1.0)
-    samples = (np.round(pcm * 32767.0).astype(np.int16)).tobytes()
 
-    await worker._ingest_pcm_bytes(samples)
+@pytest.mark.asyncio
+async def test_speech_gate_skips_low_energy_chunk_without_inference(tmp_path):
+    config = WhisperConfig(
+        sampleRate=16000,
+        chunkLength=4,
+        minChunkDurationSeconds=1.0,
+        contextSeconds=0.0,
+        silenceThreshold=0.01,
+        blankAudioMinRms=0.02,
+    )
+    captured: List[TranscriptionResult] = []
+    worker = _gate_worker(tmp_path, config, captured)
+    # Earlier chunks took half their duration in the model.
+    worker._overload.record_processing(4.0, 2.0)
+
+    noise = np.random.default_rng(12345).normal(0.0, 0.002, 16000)
+    await worker._transcribe_chunk(
+        PreparedChunk(samples=noise.astype(np.float32), prefix_samples=0)
+    )
 
     assert captured == []
-    assert len(transcriber.calls) == 1
+    assert worker.transcriber.calls == []
+    metrics = worker.get_speech_gate_metrics()
+    assert metrics["skipped"] == {"energy": 1}
+    assert metrics["skippedAudioSeconds"] == pytest.approx(1.0)
+    assert metrics["estimatedInferenceSecondsSaved"] == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_speech_gate_emits_blank_audio_for_sparse_chunk(tmp_path):
+    config = WhisperConfig(
+        sampleRate=16000,
+        chunkLength=4,
+        minChunkDurationSeconds=1.0,
+        contextSeconds=0.0,
+        silenceThreshold=0.01,
+        blankAudioMinDurationSeconds=0.5,
+        blankAudioMinActiveRatio=0.0,
+        blankAudioMinRms=0.01,
+        speechGate=SpeechGateConfig(minActiveRatio=0.5),
+    )
+    captured: List[TranscriptionResult] = []
+    worker = _gate_worker(tmp_path, config, captured)
+
+    # A loud burst over a fifth of the chunk: energetic, but mostly idle.
+    samples = np.zeros(32000, dtype=np.float32)
+    samples[:6400] = 0.3
+
+    await worker._transcribe_chunk(PreparedChunk(samples=samples, prefix_samples=0))
+
+    assert worker.transcriber.calls == []
+    assert len(captured) == 1
+    assert captured[0].text == BLANK_AUDIO_TOKEN
+    assert captured[0].recordingUrl is None
+    assert worker.get_speech_gate_metrics()["skipped"] == {"activeRatio": 1}
+
+
+def test_speech_gate_applies_trunked_metadata_rules(tmp_path):
+    from wavecap_backend.models import TrunkedRadioMetadata
+    from wavecap_backend.trunked_radio import TrunkedCallChunk
+
+    config = WhisperConfig(
+        sampleRate=16000,
+        silenceThreshold=0.01,
+        speechGate=SpeechGateConfig(excludedTalkgroups=["900"], minCallSeconds=1.0),
+    )
+    worker = _gate_worker(tmp_path, config, [])
+    speech = np.full(16000, 0.2, dtype=np.float32)
+
+    def call(talkgroup: str, audio: np.ndarray, encrypted: bool = False):
+        return TrunkedCallChunk(
+            stream_id="call",
+            audio=audio,
+            metadata=TrunkedRadioMetadata(talkgroupId=talkgroup, encrypted=encrypted),
+        )
+
+    assert worker._trunked_gate_reason(call("100", speech, encrypted=True)) == "encrypted"
+    assert worker._trunked_gate_reason(call("900", speech)) == "talkgroup"
+    assert worker._trunked_gate_reason(call("100", speech[:8000])) == "duration"
+    assert worker._trunked_gate_reason(call("100", speech * 0.01)) == "energy"
+    assert worker._trunked_gate_reason(call("100", speech)) is None
+
+
+@pytest.mark.asyncio
+async def test_trunked_quiet_call_is_kept_when_energy_gate_is_off(tmp_path):
+    from wavecap_backend.models import TrunkedRadioMetadata
+    from wavecap_backend.trunked_radio import TrunkedCallChunk
+
+    config = WhisperConfig(
+        sampleRate=16000,
+        silenceThreshold=0.01,
+        silenceHallucinationPhrases=[],
+        speechGate=SpeechGateConfig(lowEnergy=False),
+    )
+    captured: List[TranscriptionResult] = []
+    worker = _gate_worker(tmp_path, config, captured)
+    worker.transcriber._bundles.append(
+        TranscriptionResultBundle("Engine 12 responding", [], "en")
+    )
+    chunk = TrunkedCallChunk(
+        stream_id="call",
+        audio=np.full(16000, 0.002, dtype=np.float32),
+        metadata=TrunkedRadioMetadata(talkgroupId="100"),
+    )
+
+    assert worker._trunked_gate_reason(chunk) is None
+    await worker._transcribe_trunked_call(chunk)
+
+    # The gate is the only low-energy check; inference is never thrown away.
+    assert len(worker.transcriber.calls) == 1
+    assert [item.text for item in captured] == ["Engine 12 responding"]
+
+
+@pytest.mark.asyncio
+async def test_quiet_chunk_is_kept_when_energy_gate_is_off(tmp_path):
+    config = WhisperConfig(
+        sampleRate=16000,
+        chunkLength=4,
+        minChunkDurationSeconds=1.0,
+        contextSeconds=0.0,
+        silenceThreshold=0.01,
+        silenceHallucinationPhrases=[],
+        speechGate=SpeechGateConfig(lowEnergy=False),
+    )
+    captured: List[TranscriptionResult] = []
+    worker = _gate_worker(tmp_path, config, captured)
+    worker.transcriber._bundles.append(
+        TranscriptionResultBundle("Noarlunga, Noarlunga, SITREP.", [], "en")
+    )
+    noise = np.random.default_rng(12345).normal(0.0, 0.002, 16000)
+
+    await worker._transcribe_chunk(
+        PreparedChunk(samples=noise.astype(np.float32), prefix_samples=0)
+    )
+
+    # As for trunked calls, the gate is the only low-energy check.
+    assert len(worker.transcriber.calls) == 1
+    assert [item.text for item in captured] == ["Noarlunga, Noarlunga, SITREP."]
 
 
 def test_prepare_hallucination_phrases_includes_initial_prompt() -> None:
@@ -1109,6 +1284,7 @@ async def test_worker_discards_all_right_here_we_go_hallucination(tmp_path):
         blankAudioMinActiveRatio=0.0,
         blankAudioMinRms=0.0,
         silenceHallucinationPhrases=["all right here we go"],
+        speechGate=SpeechGateConfig(lowEnergy=False),
     )
 
     bundle = TranscriptionResultBundle(
@@ -1178,6 +1354,7 @@ async def test_worker_discards_initial_prompt_hallucination(tmp_path):
         blankAudioMinRms=0.0,
         silenceHallucinationPhrases=[],
         initialPrompt=prompt,
+        speechGate=SpeechGateConfig(lowEnergy=False),
     )
 
     bundle = TranscriptionResultBundle(prompt, [], "en", no_speech_prob=0.2)
@@ -1304,6 +1481,7 @@ async def test_worker_discards_repeated_hallucinated_phrase(tmp_path):
         blankAudioMinActiveRatio=0.0,
         blankAudioMinRms=0.0,
         silenceHallucinationPhrases=["thank you"],
+        speechGate=SpeechGateConfig(lowEnergy=False),
     )
 
     bundle = TranscriptionResultBundle(
@@ -1437,6 +1615,7 @@ async def test_worker_discards_double_repeat_hallucination(tmp_path):
         blankAudioMinActiveRatio=0.0,
         blankAudioMinRms=0.0,
         silenceHallucinationPhrases=[],
+        speechGate=SpeechGateConfig(lowEnergy=False),
     )
 
     bundle = TranscriptionResultBundle(
@@ -1503,6 +1682,7 @@ async def test_worker_discards_repetitive_silence_hallucination(tmp_path):
         blankAudioMinActiveRatio=0.0,
         blankAudioMinRms=0.0,
         silenceHallucinationPhrases=[],
+        speechGate=SpeechGateConfig(lowEnergy=False),
     )
 
     bundle = TranscriptionResultBundle(
@@ -2435,3 +2615,227 @@ def test_chunk_accumulator_active_ratio_threshold():
     chunks = chunker.add_samples(mixed)
     # With 90% threshold, this should be considered silence and trigger flush
     assert len(chunks) == 1
+
+
+def test_chunk_accumulator_tracks_conditioned_audio_with_prefix():
+    """Conditioned audio is buffered in lock step with the raw samples."""
+    chunker = ChunkAccumulator(
+        sample_rate=16000,
+        max_chunk_seconds=2.0,
+        min_chunk_seconds=1.0,
+        context_seconds=0.5,
+        silence_threshold=0.01,
+        silence_lookback_seconds=0.25,
+        silence_hold_seconds=0.25,
+        active_ratio_threshold=0.1,
+        track_conditioned=True,
+    )
+
+    raw = np.linspace(-0.5, 0.5, 16000 * 4, dtype=np.float32)
+    conditioned = raw * 2.0
+    chunks: List[PreparedChunk] = []
+    for start in range(0, raw.size, 3000):
+        chunks.extend(
+            chunker.add_samples(
+                raw[start : start + 3000], conditioned[start : start + 3000]
+            )
+        )
+
+    assert len(chunks) == 2
+    for chunk in chunks:
+        assert chunk.conditioned is not None
+        assert chunk.conditioned.size == chunk.samples.size
+        np.testing.assert_array_equal(chunk.conditioned, chunk.samples * 2.0)
+    assert chunks[1].prefix_samples == 8000
+
+
+def test_chunk_accumulator_preserves_audio_across_ring_wraparound():
+    """Chunk bodies reassemble the input even after the ring wraps or grows."""
+    chunker = ChunkAccumulator(
+        sample_rate=1000,
+        max_chunk_seconds=2.0,
+        min_chunk_seconds=1.0,
+        context_seconds=0.3,
+        silence_threshold=0.01,
+        silence_lookback_seconds=0.5,
+        silence_hold_seconds=0.2,
+        active_ratio_threshold=0.5,
+    )
+
+    rng = np.random.default_rng(7)
+    reads = [
+        rng.uniform(-0.5, 0.5, size).astype(np.float32)
+        * (0.0 if index % 5 == 4 else 1.0)
+        for index, size in enumerate([170, 333, 900, 12000, 45, 2500] * 6)
+    ]
+    chunks: List[PreparedChunk] = []
+    for read in reads:
+        chunks.extend(chunker.add_samples(read))
+    chunks.extend(chunker.flush())
+
+    assert len(chunks) > 10
+    bodies = [chunk.samples[chunk.prefix_samples :] for chunk in chunks]
+    np.testing.assert_array_equal(np.concatenate(bodies), np.concatenate(reads))
+    for previous, current in zip(chunks, chunks[1:]):
+        assert current.prefix_samples == 300
+        np.testing.assert_array_equal(
+            current.samples[: current.prefix_samples], previous.samples[-300:]
+        )
+
+
+class _ReferenceChunkAccumulator:
+    """Straightforward array-backed model of ChunkAccumulator's decisions.
+
+    The buffered timeline is one array holding the carried prefix followed by
+    unemitted body audio, and the silence window is rescanned on every read.
+    """
+
+    def __init__(self, chunker: ChunkAccumulator) -> None:
+        self.max_chunk = chunker._max_chunk_samples
+        self.min_chunk = chunker._min_chunk_samples
+        self.context = chunker._context_samples
+        self.threshold = chunker._silence_threshold
+        self.lookback = chunker._silence_lookback_samples
+        self.hold = chunker._silence_hold_samples
+        self.ratio = chunker._active_ratio_threshold
+        self.timeline = np.empty(0, dtype=np.float32)
+        self.conditioned = np.empty(0, dtype=np.float32)
+        self.prefix = 0
+        self.silence = 0
+        self.silent = False
+
+    def add_samples(self, samples, conditioned):
+        self.timeline = np.concatenate((self.timeline, samples))
+        self.conditioned = np.concatenate((self.conditioned, conditioned))
+        if self.timeline.size >= self.lookback:
+            window = self.timeline[-self.lookback :]
+            active = np.count_nonzero(np.abs(window) > self.threshold)
+            self.silent = active / self.lookback < self.ratio
+            if self.silent:
+                self.silence = min(self.silence + samples.size, self.max_chunk)
+            else:
+                self.silence = 0
+        ready = []
+        while self.timeline.size:
+            if self.timeline.size >= self.max_chunk:
+                ready.append(self._emit(self.max_chunk))
+            elif self.timeline.size - self.prefix >= self.min_chunk and (
+                self.silent if self.hold == 0 else self.silence >= self.hold
+            ):
+                ready.append(self._emit(self.timeline.size))
+            else:
+                break
+        return ready
+
+    def flush(self):
+        if not self.timeline.size:
+            return []
+        chunk = self._emit(self.timeline.size)
+        return [chunk] if chunk[0].size > chunk[1] else []
+
+    def _emit(self, count):
+        size = min(count, self.timeline.size)
+        chunk = (self.timeline[:size], self.prefix, self.conditioned[:size])
+        tail = min(self.context, size)
+        self.timeline = self.timeline[size - tail :]
+        self.conditioned = self.conditioned[size - tail :]
+        self.prefix = tail
+        self.silence = 0
+        self.silent = False
+        return chunk
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_chunk_accumulator_matches_reference_on_random_reads(seed):
+    """Flush decisions and emitted audio match a simple array-backed model."""
+    rng = np.random.default_rng(seed)
+    sample_rate = int(rng.integers(200, 1000))
+    min_chunk_seconds = float(rng.uniform(0.2, 2.0))
+    chunker = ChunkAccumulator(
+        sample_rate=sample_rate,
+        max_chunk_seconds=float(rng.uniform(min_chunk_seconds, 4.0)),
+        min_chunk_seconds=min_chunk_seconds,
+        context_seconds=float(rng.uniform(0.0, 1.0)),
+        silence_threshold=0.05,
+        silence_lookback_seconds=float(rng.uniform(0.05, 3.0)),
+        silence_hold_seconds=float(rng.choice([0.0, rng.uniform(0.05, 1.0)])),
+        active_ratio_threshold=float(rng.uniform(0.0, 0.6)),
+        track_conditioned=True,
+    )
+    reference = _ReferenceChunkAccumulator(chunker)
+
+    emitted = []
+    expected = []
+    for _ in range(200):
+        # Mostly short reads, with occasional ones several chunks long so the
+        # ring both wraps around and has to grow.
+        size = int(
+            rng.integers(1, sample_rate * 12)
+            if rng.random() < 0.05
+            else rng.integers(1, sample_rate // 2)
+        )
+        level = rng.choice([0.0, 0.02, 0.5])
+        raw = (rng.uniform(-1.0, 1.0, size) * level).astype(np.float32)
+        conditioned = raw * 3.0 + 0.25
+        emitted.extend(chunker.add_samples(raw, conditioned))
+        expected.extend(reference.add_samples(raw, conditioned))
+        assert len(emitted) == len(expected)
+    emitted.extend(chunker.flush())
+    expected.extend(reference.flush())
+
+    assert len(emitted) == len(expected)
+    for chunk, (samples, prefix, conditioned) in zip(emitted, expected):
+        assert chunk.prefix_samples == prefix
+        np.testing.assert_array_equal(chunk.samples, samples)
+        np.testing.assert_array_equal(chunk.conditioned, conditioned)
+
+
+@pytest.mark.asyncio
+async def test_worker_filters_audio_once_at_ingest(tmp_path):
+    """Chunks reuse audio conditioned at ingest instead of re-filtering context."""
+    config = WhisperConfig(
+        sampleRate=16000,
+        chunkLength=2,
+        minChunkDurationSeconds=1.0,
+        contextSeconds=0.5,
+        agcTargetRms=None,
+    )
+    transcriber = StubTranscriber(
+        [TranscriptionResultBundle("", [], "en") for _ in range(2)]
+    )
+    worker = StreamWorker(
+        stream=Stream(
+            id="stream-ingest-filter",
+            name="Ingest Filter",
+            url="http://example.com/audio",
+            status=StreamStatus.STOPPED,
+            createdAt=datetime.utcnow(),
+            transcriptions=[],
+            source=StreamSource.AUDIO,
+        ),
+        transcriber=transcriber,
+        database=StreamDatabase(tmp_path / "runtime.sqlite"),
+        alert_evaluator=TranscriptionAlertEvaluator(
+            AlertsConfig(enabled=False, rules=[])
+        ),
+        on_transcription=lambda _tx: asyncio.sleep(0),
+        on_status_change=lambda _s, _st: asyncio.sleep(0),
+        config=config,
+    )
+    frontend_calls: List[int] = []
+    original_filter = worker._audio_frontend.filter
+
+    def counting_filter(samples: np.ndarray) -> np.ndarray:
+        frontend_calls.append(samples.size)
+        return original_filter(samples)
+
+    worker._audio_frontend.filter = counting_filter  # type: ignore[method-assign]
+
+    rng = np.random.default_rng(7)
+    audio = (rng.standard_normal(16000 * 4) * 0.2).astype(np.float32)
+    await worker._ingest_pcm_bytes((audio * 32768).astype(np.int16).tobytes())
+
+    assert sum(frontend_calls) == audio.size
+    assert len(transcriber.calls) == 2
+    # The second chunk carries 0.5s of context but is not filtered again.
+    assert transcriber.calls[1].size == 16000 * 2
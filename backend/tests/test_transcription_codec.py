@@ -0,0 +1,59 @@
+import pytest
+
+from wavecap_backend.models import TranscriptionSegment
+from wavecap_backend.transcription_codec import (
+    decode_segments,
+    decode_waveform,
+    encode_segments,
+    encode_waveform,
+)
+
+
+def test_waveform_is_quantised_to_one_byte_per_bar():
+    encoded = encode_waveform([0.0, 0.5, 1.0, 1.7])
+
+    assert len(encoded) == 5
+    assert decode_waveform(encoded) == [0.0, 0.502, 1.0, 1.0]
+    assert encode_waveform([]) is None
+    assert decode_waveform(None) is None
+
+
+def test_segments_round_trip_losslessly():
+    segments = [
+        TranscriptionSegment(
+            id=3,
+            text="Engine 5 respondiendo ñ",
+            no_speech_prob=0.0123456789,
+            temperature=0.2,
+            avg_logprob=-0.345678,
+            compression_ratio=1.5,
+            start=12.34,
+            end=15.0,
+            seek=1200,
+        ),
+        {
+            "id": 4,
+            "text": "",
+            "no_speech_prob": float("nan"),
+            "temperature": 0.0,
+            "avg_logprob": -1.0,
+            "compression_ratio": 0.0,
+            "start": 15.0,
+            "end": 16.5,
+            "seek": 1200,
+        },
+    ]
+
+    decoded = decode_segments(encode_segments(segments))
+
+    assert decoded[0] == segments[0]
+    assert decoded[1].no_speech_prob == 0.0
+    assert decoded[1].end == 16.5
+    assert encode_segments([]) is None
+
+
+def test_unknown_versions_are_rejected():
+    with pytest.raises(ValueError):
+        decode_waveform(b"\x09\x00")
+    with pytest.raises(ValueError):
+        decode_segments(b"\x09\x00\x00")
@@ -26,3 +26,17 @@ async def test_transcription_executor_rejects_after_close():
     await executor.close()
     with pytest.raises(RuntimeError):
         await executor.run(lambda: 42)
+
+
+@pytest.mark.asyncio
+async def test_transcription_executor_waits_for_capacity():
+    executor = TranscriptionExecutor(worker_count=1, queue_size=1)
+    await executor.start()
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(executor.run(lambda value=value: value) for value in range(5))),
+            timeout=2,
+        )
+    finally:
+        await executor.close()
+    assert results == [0, 1, 2, 3, 4]
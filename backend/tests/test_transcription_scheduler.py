@@ -0,0 +1,303 @@
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from wavecap_backend.transcription_executor import TranscriptionExecutor
+from wavecap_backend.transcription_scheduler import TranscriptionScheduler
+from wavecap_backend.whisper_transcriber import (
+    AbstractTranscriber,
+    TranscriptionResultBundle,
+)
+
+
+class _RecordingTranscriber(AbstractTranscriber):
+    def __init__(self, *, fail_marker: float | None = None) -> None:
+        self.batch_sizes: list[int] = []
+        self.fail_marker = fail_marker
+        self._lock = threading.Lock()
+
+    def transcribe_batch_blocking(self, requests):
+        with self._lock:
+            self.batch_sizes.append(len(requests))
+        return super().transcribe_batch_blocking(requests)
+
+    def transcribe_blocking(self, audio, sample_rate, language, *, initial_prompt=None):
+        marker = float(audio[0])
+        if marker == self.fail_marker:
+            raise ValueError("bad chunk")
+        return TranscriptionResultBundle(f"chunk {marker:g}", [], language)
+
+
+async def _start(transcriber, **kwargs):
+    executor = TranscriptionExecutor(worker_count=1, queue_size=4)
+    await executor.start()
+    scheduler = TranscriptionScheduler(
+        executor=executor, transcriber=transcriber, **kwargs
+    )
+    await scheduler.start()
+    return executor, scheduler
+
+
+def _chunk(marker: float) -> np.ndarray:
+    return np.full(160, marker, dtype=np.float32)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_batches_chunks_within_window():
+    transcriber = _RecordingTranscriber()
+    executor, scheduler = await _start(
+        transcriber, max_batch_size=4, max_wait_seconds=0.05
+    )
+    try:
+        results = await asyncio.gather(
+            *(scheduler.submit(_chunk(index), 16000, "en") for index in range(3))
+        )
+    finally:
+        await scheduler.close()
+        await executor.close()
+
+    assert [result.text for result in results] == ["chunk 0", "chunk 1", "chunk 2"]
+    assert transcriber.batch_sizes == [3]
+    metrics = scheduler.metrics()
+    assert metrics["completedBatches"] == 1
+    assert metrics["completedItems"] == 3
+    assert metrics["largestBatchSize"] == 3
+    assert metrics["averageQueueDelaySeconds"] > 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_respects_max_batch_size():
+    transcriber = _RecordingTranscriber()
+    executor, scheduler = await _start(
+        transcriber, max_batch_size=2, max_wait_seconds=0.05
+    )
+    try:
+        await asyncio.gather(
+            *(scheduler.submit(_chunk(index), 16000, "en") for index in range(5))
+        )
+    finally:
+        await scheduler.close()
+        await executor.close()
+
+    assert sum(transcriber.batch_sizes) == 5
+    assert max(transcriber.batch_sizes) == 2
+
+
+@pytest.mark.asyncio
+async def test_scheduler_isolates_failing_chunk():
+    transcriber = _RecordingTranscriber(fail_marker=1.0)
+    executor, scheduler = await _start(
+        transcriber, max_batch_size=3, max_wait_seconds=0.05
+    )
+    try:
+        results = await asyncio.gather(
+            *(scheduler.submit(_chunk(index), 16000, "en") for index in range(3)),
+            return_exceptions=True,
+        )
+    finally:
+        await scheduler.close()
+        await executor.close()
+
+    assert results[0].text == "chunk 0"
+    assert isinstance(results[1], ValueError)
+    assert results[2].text == "chunk 2"
+
+
+class _SlowTranscriber(_RecordingTranscriber):
+    def transcribe_batch_blocking(self, requests):
+        time.sleep(0.02)
+        return super().transcribe_batch_blocking(requests)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_splits_batch_inference_time_by_audio_length():
+    executor, scheduler = await _start(
+        _SlowTranscriber(), max_batch_size=2, max_wait_seconds=0.05
+    )
+    try:
+        short, long = await asyncio.gather(
+            scheduler.submit(_chunk(1), 16000, "en"),
+            scheduler.submit(np.full(480, 2.0, dtype=np.float32), 16000, "en"),
+        )
+    finally:
+        await scheduler.close()
+        await executor.close()
+
+    assert short.inference_seconds + long.inference_seconds >= 0.02
+    assert long.inference_seconds == pytest.approx(3 * short.inference_seconds)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_rejects_before_start():
+    executor = TranscriptionExecutor(worker_count=1, queue_size=2)
+    scheduler = TranscriptionScheduler(
+        executor=executor, transcriber=_RecordingTranscriber()
+    )
+    with pytest.raises(RuntimeError):
+        await scheduler.submit(_chunk(0), 16000, "en")
+
+
+class _GatedTranscriber(AbstractTranscriber):
+    """Records service order and blocks until the test opens the gate."""
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.order: list[float] = []
+
+    def transcribe_blocking(self, audio, sample_rate, language, *, initial_prompt=None):
+        self.gate.wait(timeout=5)
+        self.order.append(float(audio[0]))
+        return TranscriptionResultBundle("", [], language)
+
+
+async def _queue_chatty_backlog(scheduler, *, quiet_priority: bool):
+    tasks = [
+        asyncio.create_task(scheduler.submit(_chunk(0), 16000, "en", stream_id="chatty"))
+    ]
+    # Let the first chunk occupy the only executor thread.
+    await asyncio.sleep(0.05)
+    for marker in range(1, 5):
+        tasks.append(
+            asyncio.create_task(
+                scheduler.submit(_chunk(marker), 16000, "en", stream_id="chatty")
+            )
+        )
+    tasks.append(
+        asyncio.create_task(
+            scheduler.submit(
+                _chunk(99), 16000, "en", stream_id="quiet", priority=quiet_priority
+            )
+        )
+    )
+    await asyncio.sleep(0.05)
+    return tasks
+
+
+@pytest.mark.asyncio
+async def test_scheduler_interleaves_quiet_stream_with_chatty_backlog():
+    transcriber = _GatedTranscriber()
+    executor, scheduler = await _start(transcriber)
+    try:
+        tasks = await _queue_chatty_backlog(scheduler, quiet_priority=False)
+        metrics = scheduler.metrics()
+        assert metrics["streams"]["chatty"]["queueDepth"] == 4
+        assert metrics["streams"]["quiet"]["queueDepth"] == 1
+        assert metrics["streams"]["quiet"]["oldestWaitSeconds"] > 0
+        transcriber.gate.set()
+        await asyncio.gather(*tasks)
+    finally:
+        await scheduler.close()
+        await executor.close()
+
+    assert transcriber.order[0] == 0
+    assert transcriber.order.index(99) <= 2
+    assert scheduler.metrics()["streams"]["quiet"]["dispatched"] == 1
+
+
+@pytest.mark.asyncio
+async def test_scheduler_serves_priority_stream_first():
+    transcriber = _GatedTranscriber()
+    executor, scheduler = await _start(transcriber, priority_weight=4.0)
+    try:
+        tasks = await _queue_chatty_backlog(scheduler, quiet_priority=True)
+        transcriber.gate.set()
+        await asyncio.gather(*tasks)
+    finally:
+        await scheduler.close()
+        await executor.close()
+
+    assert transcriber.order[:2] == [0, 99]
+    assert scheduler.metrics()["streams"]["quiet"]["priority"] is True
+
+
+@pytest.mark.asyncio
+async def test_scheduler_forgets_removed_streams():
+    transcriber = _RecordingTranscriber()
+    executor, scheduler = await _start(transcriber)
+    try:
+        await scheduler.submit(_chunk(1), 16000, "en", stream_id="gone")
+        await scheduler.submit(_chunk(2), 16000, "en", stream_id="kept")
+        scheduler.remove_stream("gone")
+        assert set(scheduler.metrics()["streams"]) == {"kept"}
+
+        # A stream removed with work queued keeps its queue until it drains.
+        pending = [
+            asyncio.create_task(
+                scheduler.submit(_chunk(index), 16000, "en", stream_id="busy")
+            )
+            for index in range(3)
+        ]
+        await asyncio.sleep(0)
+        scheduler.remove_stream("busy")
+        await asyncio.gather(*pending)
+        await scheduler.submit(_chunk(9), 16000, "en", stream_id="kept")
+    finally:
+        await scheduler.close()
+        await executor.close()
+
+    assert set(scheduler.metrics()["streams"]) == {"kept"}
+
+
+@pytest.mark.asyncio
+async def test_scheduler_bounds_each_streams_backlog():
+    transcriber = _GatedTranscriber()
+    executor, scheduler = await _start(transcriber, max_pending_per_stream=2)
+    try:
+        tasks = [
+            asyncio.create_task(
+                scheduler.submit(_chunk(0), 16000, "en", stream_id="chatty")
+            )
+        ]
+        # Let the first chunk occupy the only executor thread.
+        await asyncio.sleep(0.05)
+        tasks.extend(
+            asyncio.create_task(
+                scheduler.submit(_chunk(marker), 16000, "en", stream_id="chatty")
+            )
+            for marker in range(1, 5)
+        )
+        quiet = asyncio.create_task(
+            scheduler.submit(_chunk(99), 16000, "en", stream_id="quiet")
+        )
+        await asyncio.sleep(0.05)
+
+        # Two chatty chunks wait in the queue; the rest wait to be queued,
+        # and a full queue on one stream does not hold back another.
+        metrics = scheduler.metrics()
+        assert metrics["maxPendingPerStream"] == 2
+        assert metrics["streams"]["chatty"]["queueDepth"] == 2
+        assert metrics["streams"]["quiet"]["queueDepth"] == 1
+
+        transcriber.gate.set()
+        await asyncio.gather(*tasks, quiet)
+    finally:
+        await scheduler.close()
+        await executor.close()
+
+    assert sorted(transcriber.order) == [0, 1, 2, 3, 4, 99]
+    assert scheduler.metrics()["streams"]["chatty"]["dispatched"] == 5
+
+
+@pytest.mark.asyncio
+async def test_scheduler_close_releases_blocked_submitters():
+    transcriber = _GatedTranscriber()
+    executor, scheduler = await _start(transcriber, max_pending_per_stream=1)
+    try:
+        first = asyncio.create_task(scheduler.submit(_chunk(0), 16000, "en"))
+        await asyncio.sleep(0.05)
+        queued = asyncio.create_task(scheduler.submit(_chunk(1), 16000, "en"))
+        blocked = asyncio.create_task(scheduler.submit(_chunk(2), 16000, "en"))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+    finally:
+        await scheduler.close()
+        transcriber.gate.set()
+        await executor.close()
+
+    for task in (queued, blocked):
+        with pytest.raises(RuntimeError, match="shutting down"):
+            await task
+    await asyncio.gather(first, return_exceptions=True)
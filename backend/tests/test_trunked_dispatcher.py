@@ -0,0 +1,124 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from wavecap_backend.models import TrunkedRadioMetadata
+from wavecap_backend.trunked_dispatcher import TrunkedCallDispatcher
+from wavecap_backend.trunked_radio import TrunkedCallChunk
+
+
+def _call(talkgroup: str, label: str) -> TrunkedCallChunk:
+    # The talkgroup name doubles as a label so the handler can track calls.
+    metadata = TrunkedRadioMetadata(talkgroupId=talkgroup, talkgroupName=label)
+    return TrunkedCallChunk(
+        stream_id="trunked", audio=np.zeros(16, dtype=np.float32), metadata=metadata
+    )
+
+
+class _GatedHandler:
+    """Records call order and blocks each call until released."""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.gates: dict[str, asyncio.Event] = {}
+
+    def release(self, label: str) -> None:
+        self.gates.setdefault(label, asyncio.Event()).set()
+
+    async def __call__(self, chunk: TrunkedCallChunk) -> None:
+        label = chunk.metadata.talkgroupName
+        self.started.append(label)
+        await self.gates.setdefault(label, asyncio.Event()).wait()
+        self.finished.append(label)
+        if label.startswith("fail"):
+            raise RuntimeError("boom")
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_runs_talkgroups_concurrently_in_order():
+    handler = _GatedHandler()
+    dispatcher = TrunkedCallDispatcher(handler, worker_count=2, max_pending=8)
+    dispatcher.start()
+
+    for label in ("a1", "a2", "b1"):
+        await dispatcher.submit(_call(label[0], label))
+    await _settle()
+
+    # One call per talkgroup runs at a time; a2 waits behind a1.
+    assert sorted(handler.started) == ["a1", "b1"]
+
+    handler.release("a2")
+    handler.release("b1")
+    await _settle()
+    assert handler.finished == ["b1"]
+
+    handler.release("a1")
+    assert await dispatcher.drain(timeout=1.0)
+    assert handler.finished == ["b1", "a1", "a2"]
+    assert dispatcher.metrics()["talkgroups"]["a"]["completed"] == 2
+    await dispatcher.close(drain=False)
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_drops_ordinary_calls_when_full():
+    handler = _GatedHandler()
+    dispatcher = TrunkedCallDispatcher(
+        handler, worker_count=1, max_pending=2, priority_talkgroups=["p"]
+    )
+    dispatcher.start()
+
+    assert await dispatcher.submit(_call("a", "a1"))
+    assert await dispatcher.submit(_call("b", "b1"))
+    await _settle()
+    assert not await dispatcher.submit(_call("c", "c1"))
+
+    # A priority call evicts the oldest queued ordinary call instead.
+    assert await dispatcher.submit(_call("p", "p1"))
+    for label in ("a1", "b1", "p1"):
+        handler.release(label)
+    assert await dispatcher.drain(timeout=1.0)
+
+    assert handler.finished == ["a1", "p1"]
+    talkgroups = dispatcher.metrics()["talkgroups"]
+    assert talkgroups["b"]["dropped"] == 1
+    assert talkgroups["c"] == {
+        "submitted": 1,
+        "completed": 0,
+        "failed": 0,
+        "dropped": 1,
+        "deferred": 0,
+    }
+    await dispatcher.close(drain=False)
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_defers_priority_calls_and_counts_failures():
+    handler = _GatedHandler()
+    dispatcher = TrunkedCallDispatcher(
+        handler, worker_count=1, max_pending=1, priority_talkgroups=["p"]
+    )
+    dispatcher.start()
+
+    assert await dispatcher.submit(_call("p", "fail-1"))
+    await _settle()
+    pending = asyncio.create_task(dispatcher.submit(_call("p", "p2")))
+    await _settle()
+    assert not pending.done()
+
+    handler.release("fail-1")
+    handler.release("p2")
+    assert await pending
+    assert await dispatcher.drain(timeout=1.0)
+
+    counters = dispatcher.metrics()["talkgroups"]["p"]
+    assert counters["deferred"] == 1
+    assert counters["failed"] == 1
+    assert counters["completed"] == 1
+    await dispatcher.close(drain=False)
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from wavecap_backend.models import RemoteUpstreamConfig, TrunkedRadioMetadata
+from wavecap_backend.tools.trunked_emitter import serve, synthetic_call
+from wavecap_backend.trunked_radio import (
+    TrunkedCallChunk,
+    TrunkedRadioClient,
+    encode_binary_call,
+    encode_json_call,
+)
+
+
+def _client(url: str = "ws://unused", **kwargs) -> TrunkedRadioClient:
+    return TrunkedRadioClient(
+        RemoteUpstreamConfig(id="sdr", mode="trunked", url=url, **kwargs)
+    )
+
+
+@pytest.mark.asyncio
+async def test_binary_and_json_calls_decode_identically():
+    header, pcm = synthetic_call(1616, seconds=0.25, call_id=7)
+    header["sourceLocation"] = {"latitude": 47.6, "longitude": -122.3}
+
+    client = _client()
+    await client._process_message(encode_json_call(header, pcm))
+    await client._process_message(encode_binary_call(header, pcm))
+    from_json = await client.read(timeout=0.1)
+    from_binary = await client.read(timeout=0.1)
+
+    assert from_binary.audio.dtype == np.float32
+    np.testing.assert_array_equal(from_binary.audio, from_json.audio)
+    assert from_binary.metadata == from_json.metadata
+    assert from_binary.stream_id == "recorder_0_call_7"
+    assert from_binary.metadata.gpsLatitude == pytest.approx(47.6)
+
+
+@pytest.mark.asyncio
+async def test_binary_call_accepts_float_audio_and_filters_talkgroups():
+    samples = np.linspace(-0.5, 0.5, 64, dtype="<f4")
+    client = _client(talkgroupFilter=[1616])
+    await client._process_message(
+        encode_binary_call({"talkgroupId": 1700}, samples.tobytes(), audio_format="f32")
+    )
+    await client._process_message(
+        encode_binary_call({"talkgroupId": 1616}, samples.tobytes(), audio_format="f32")
+    )
+    chunk = await client.read(timeout=0.1)
+    assert chunk.metadata.talkgroupId == "1616"
+    np.testing.assert_array_equal(chunk.audio, samples)
+    assert client.pending_count() == 0
+
+    # Truncated frames are logged and dropped rather than raising.
+    await client._process_message(encode_binary_call({"talkgroupId": 1616}, b"")[:6])
+    assert client.pending_count() == 0
+
+
+def test_dropped_calls_key_int_and_str_talkgroups_together():
+    client = _client()
+    audio = np.zeros(16, dtype=np.float32)
+    for talkgroup in (1616, "1616"):
+        # Metadata built without validation may still carry a numeric ID.
+        metadata = TrunkedRadioMetadata.model_construct(talkgroupId=talkgroup)
+        client._record_drop(
+            TrunkedCallChunk(stream_id="call", audio=audio, metadata=metadata)
+        )
+
+    assert client.dropped_calls() == {"1616": 2}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("legacy", [False, True])
+async def test_client_negotiates_framing_with_emitter(legacy):
+    calls = [synthetic_call(1616, seconds=0.1, call_id=index) for index in range(3)]
+    emitter = await serve(calls, legacy=legacy)
+    client = _client(emitter.url)
+    try:
+        await client.start()
+        received = [await client.read(timeout=2.0) for _ in calls]
+        assert client._ws is not None
+        expected = None if legacy else "wavecap.voice.binary"
+        assert client._ws.subprotocol == expected
+    finally:
+        await client.stop()
+        await emitter.close()
+
+    assert [chunk.stream_id for chunk in received] == [
+        f"recorder_0_call_{index}" for index in range(3)
+    ]
+    expected_audio = np.frombuffer(calls[0][1], dtype="<i2") / 32768.0
+    np.testing.assert_allclose(received[0].audio, expected_audio, rtol=1e-6)
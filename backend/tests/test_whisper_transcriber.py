@@ -237,3 +237,119 @@ async def test_transcriber_skips_unknown_temperature_increment_kw(monkeypatch):
     assert call_kwargs["language"] == config.language
     assert call_kwargs["task"] == "transcribe"
     assert "temperature_increment_on_fallback" not in call_kwargs
+
+
+class _FakeBatchedPipeline:
+    calls = []
+
+    def __init__(self, model):
+        self.model = model
+
+    def transcribe(self, audio, *, clip_timestamps, language, batch_size, **_kwargs):
+        type(self).calls.append(
+            {"samples": audio.shape[0], "language": language, "batch_size": batch_size}
+        )
+        segments = [
+            SimpleNamespace(
+                id=index,
+                text=f" clip {index}",
+                no_speech_prob=0.1,
+                temperature=0.0,
+                avg_logprob=-0.2,
+                compression_ratio=1.0,
+                start=round(clip["start"] + 0.25, 3),
+                end=round(clip["end"], 3),
+                seek=int(clip["start"] * 100),
+            )
+            for index, clip in enumerate(clip_timestamps)
+        ]
+        return iter(segments), SimpleNamespace(language=language)
+
+
+def test_transcribe_batch_blocking_splits_batched_segments(monkeypatch):
+    _FakeBatchedPipeline.calls = []
+    _NoTemperatureIncrementModel.reset()
+    monkeypatch.setattr(module, "WhisperModel", _NoTemperatureIncrementModel)
+    monkeypatch.setattr(module, "BatchedInferencePipeline", _FakeBatchedPipeline)
+    monkeypatch.setattr(
+        _NoTemperatureIncrementModel,
+        "feature_extractor",
+        SimpleNamespace(sampling_rate=16000),
+        raising=False,
+    )
+    monkeypatch.setattr(
+        _NoTemperatureIncrementModel, "frames_per_second", 100, raising=False
+    )
+    transcriber = module.WhisperTranscriber(WhisperConfig(model="batched"))
+    requests = [
+        module.TranscriptionRequest(np.zeros(16000, dtype=np.float32), 16000, "en"),
+        module.TranscriptionRequest(np.zeros(24000, dtype=np.float32), 16000, "en"),
+        module.TranscriptionRequest(np.zeros(16000 * 40, dtype=np.float32), 16000, "en"),
+    ]
+
+    bundles = transcriber.transcribe_batch_blocking(requests)
+
+    assert _FakeBatchedPipeline.calls == [
+        {"samples": 40000, "language": "en", "batch_size": 2}
+    ]
+    # The 40 s chunk exceeds one decoder window and is transcribed on its own.
+    assert len(_NoTemperatureIncrementModel.transcribe_calls) == 1
+    assert [bundle.text for bundle in bundles] == ["clip 0", "clip 1", "hi"]
+    second = bundles[1].segments[0]
+    assert second.start == pytest.approx(0.25)
+    assert second.end == pytest.approx(1.5)
+    assert second.seek == 0
+
+
+def test_transcribe_batch_blocking_honours_degraded_beam_size(monkeypatch):
+    _NoTemperatureIncrementModel.reset()
+    monkeypatch.setattr(module, "WhisperModel", _NoTemperatureIncrementModel)
+    transcriber = module.WhisperTranscriber(
+        WhisperConfig(model="degraded", beamSize=8)
+    )
+    request = module.TranscriptionRequest(
+        np.zeros(16000, dtype=np.float32), 16000, "en", beam_size=1
+    )
+
+    transcriber.transcribe_batch_blocking([request])
+
+    assert [call["beam_size"] for call in _NoTemperatureIncrementModel.transcribe_calls] == [1]
+
+
+def test_transcribe_blocking_honours_degraded_overrides(monkeypatch):
+    _NoTemperatureIncrementModel.reset()
+    monkeypatch.setattr(module, "WhisperModel", _NoTemperatureIncrementModel)
+    transcriber = module.WhisperTranscriber(
+        WhisperConfig(model="degraded", beamSize=8)
+    )
+
+    transcriber.transcribe_blocking(
+        np.zeros(16000, dtype=np.float32), 16000, "en", beam_size=1
+    )
+
+    assert [call["beam_size"] for call in _NoTemperatureIncrementModel.transcribe_calls] == [1]
+
+
+def test_default_batch_passes_only_honoured_overrides():
+    class _BeamOnlyTranscriber(module.AbstractTranscriber):
+        overload_actions = frozenset({module.OverloadAction.REDUCE_BEAM})
+
+        def __init__(self):
+            self.calls = []
+
+        def transcribe_blocking(self, audio, sample_rate, language, **kwargs):
+            self.calls.append(kwargs)
+            return module.TranscriptionResultBundle("", [], language)
+
+    transcriber = _BeamOnlyTranscriber()
+    request = module.TranscriptionRequest(
+        np.zeros(16000, dtype=np.float32),
+        16000,
+        "en",
+        beam_size=1,
+        use_fallback_model=True,
+    )
+
+    transcriber.transcribe_batch_blocking([request])
+
+    assert transcriber.calls == [{"initial_prompt": None, "beam_size": 1}]
@@ -335,11 +335,14 @@ function App() {
   const { keywordAlerts, handleAlertMatches, handleDismissAlert } =
     useKeywordAlerts(streams);
 
+  const hadWsConnectionRef = useRef(false);
+  const shouldRefetchStreamsRef = useRef(false);
   const {
     isConnected: wsConnected,
     error: wsError,
     resetStream: wsResetStream,
     updateStream: wsUpdateStream,
+    subscribe: wsSubscribe,
     reconnect: wsReconnect,
   } = useWebSocket("/ws", {
     token,
@@ -353,8 +356,20 @@ function App() {
           return;
         }
 
-        if (message.type === "streams_update" && message.data) {
-          console.log("📡 Received streams_update:", message.data);
+        if (message.type === "session") {
+          // Only a connection that could not resume has missed events.
+          if (shouldRefetchStreamsRef.current && !message.resumed) {
+            void fetchStreams();
+          }
+          shouldRefetchStreamsRef.current = false;
+          return;
+        }
+
+        if (
+          (message.type === "streams_update" ||
+            message.type === "streams_patch") &&
+          message.data
+        ) {
           updateStreams(message.data as StreamUpdate[]);
           return;
         }
@@ -406,6 +421,7 @@ function App() {
       },
       [
         addTranscription,
+        fetchStreams,
         handleAlertMatches,
         requestLogin,
         showToast,
@@ -415,8 +431,6 @@ function App() {
   });
   const [pendingStreamCommands, setPendingStreamCommands] =
     useState<Record<string, StreamCommandState>>({});
-  const hadWsConnectionRef = useRef(false);
-  const shouldRefetchStreamsRef = useRef(false);
   const setStreamCommandState = useCallback(
     (streamId: string, action: StreamCommandState | null) => {
       setPendingStreamCommands((previous) => {
@@ -529,20 +543,14 @@ function App() {
   useEffect(() => {
     if (!wsConnected) {
       if (hadWsConnectionRef.current) {
-        console.log("🔌 WebSocket disconnected, will refetch streams on reconnect");
+        console.log("🔌 WebSocket disconnected, will resume or refetch streams on reconnect");
         shouldRefetchStreamsRef.current = true;
       }
       return;
     }
 
-    if (shouldRefetchStreamsRef.current) {
-      console.log("🔌 WebSocket reconnected, refetching streams to catch up on missed messages...");
-      shouldRefetchStreamsRef.current = false;
-      void fetchStreams();
-    }
-
     hadWsConnectionRef.current = true;
-  }, [fetchStreams, wsConnected]);
+  }, [wsConnected]);
 
   const reportCommandFailure = useCallback(
     (action: ClientCommandType, message?: string) => {
@@ -1012,6 +1020,19 @@ function App() {
   );
   const combinedMemberList = combinedMemberNames.join(", ");
 
+  // While a combined view is open, only its member streams' transcriptions
+  // are sent; stream state and alert-raising transcriptions still arrive for
+  // every stream. Leaving the view refetches the transcriptions it skipped.
+  const subscribedStreamIds = selectedCombinedView?.streamIds ?? null;
+  const narrowedSubscriptionRef = useRef(false);
+  useEffect(() => {
+    wsSubscribe(subscribedStreamIds);
+    if (narrowedSubscriptionRef.current) {
+      void fetchStreams();
+    }
+    narrowedSubscriptionRef.current = subscribedStreamIds !== null;
+  }, [subscribedStreamIds, wsSubscribe, fetchStreams]);
+
   useEffect(() => {
     if (selectedStream && (selectedStream.source ?? "audio") === "pager") {
       selectPagerExportStream(selectedStream.id);
@@ -1934,6 +1955,7 @@ function App() {
                         streams={selectedCombinedMembers}
                         loading={sidebarLoading}
                         limit={STREAM_TRANSCRIPTION_PREVIEW_LIMIT}
+                        viewId={selectedCombinedView?.id ?? null}
                       />
                     ) : (
                       <StreamTranscriptionPanel
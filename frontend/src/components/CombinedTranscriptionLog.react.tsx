@@ -1,6 +1,6 @@
 import React, { useCallback, useMemo, useState } from "react";
 // icons not required; using shared list wrapper
-import { Stream, TranscriptionResult } from "@types";
+import { Stream, TranscriptionQueryResponse, TranscriptionResult } from "@types";
 import { useUISettings } from "../contexts/UISettingsContext";
 // use auto-scroll via StreamTranscriptList
 // helpers for metadata are encapsulated in TranscriptMessageRow
@@ -21,12 +21,15 @@ import StreamStatusIndicator from "./StreamStatusIndicator.react";
 import { Timestamp } from "./primitives/Timestamp.react";
 import { TimeInterval } from "./primitives/TimeInterval.react";
 import { getStreamAccentColor } from "../utils/streamColors";
+import { getTranscriptionHistoryView } from "../utils/transcriptionView";
 import { PlaybackBar } from "./PlaybackBar.react";
 
 interface CombinedTranscriptionLogProps {
   streams: Stream[];
   loading?: boolean;
   limit?: number;
+  /** Configured combined view id; history then loads as one merged timeline. */
+  viewId?: string | null;
 }
 
 type CombinedItem =
@@ -59,6 +62,7 @@ export const CombinedTranscriptionLog: React.FC<CombinedTranscriptionLogProps> =
   streams,
   loading = false,
   limit = 400,
+  viewId = null,
 }) => {
   const { transcriptCorrectionEnabled, baseLocation, colorCodingEnabled } =
     useUISettings();
@@ -83,6 +87,10 @@ export const CombinedTranscriptionLog: React.FC<CombinedTranscriptionLogProps> =
 
   const [extraByStream, setExtraByStream] = useState<Record<string, TranscriptionResult[]>>({});
   const [hasMoreByStream, setHasMoreByStream] = useState<Record<string, boolean>>({});
+  const [viewHistory, setViewHistory] = useState<{
+    hasMore: boolean;
+    nextCursor: string | null;
+  } | null>(null);
   const [isLoadingHistory, setIsLoadingHistory] = useState(false);
   const [historyError, setHistoryError] = useState<string | null>(null);
 
@@ -178,9 +186,10 @@ export const CombinedTranscriptionLog: React.FC<CombinedTranscriptionLogProps> =
   // number of items available for display
 
   const hasMoreHistory = useMemo(() => {
+    if (viewId && viewHistory) return viewHistory.hasMore;
     if (Object.keys(hasMoreByStream).length === 0) return true;
     return Object.values(hasMoreByStream).some((v) => v !== false);
-  }, [hasMoreByStream]);
+  }, [hasMoreByStream, viewHistory, viewId]);
 
   // summary removed to match radio/pager views
 
@@ -216,15 +225,55 @@ export const CombinedTranscriptionLog: React.FC<CombinedTranscriptionLogProps> =
     return first.timestamp ?? null;
   }, [combinedItems]);
 
+  const historyView = useMemo(
+    () => getTranscriptionHistoryView(streams.map((stream) => stream.source)),
+    [streams],
+  );
+
   const handleLoadEarlier = useCallback(async () => {
     if (!earliestTimestampIso || isLoadingHistory) return;
     setIsLoadingHistory(true);
     setHistoryError(null);
     try {
       const before = new Date(earliestTimestampIso).toISOString();
+      if (viewId) {
+        const params = new URLSearchParams({ limit: String(HISTORY_FETCH_LIMIT), view: historyView });
+        if (viewHistory?.nextCursor) params.set("cursor", viewHistory.nextCursor);
+        else params.set("before", before);
+        const res = await authFetch(
+          `/api/combined-stream-views/${encodeURIComponent(viewId)}/transcriptions?${params.toString()}`,
+        );
+        if (!res.ok) {
+          const text = await res.text();
+          throw new Error(text || `Failed to fetch history for ${viewId}`);
+        }
+        const data = (await res.json()) as TranscriptionQueryResponse;
+        setExtraByStream((prev) => {
+          const next = { ...prev };
+          data.transcriptions.forEach((transcription) => {
+            next[transcription.streamId] = [
+              ...(next[transcription.streamId] ?? []),
+              transcription,
+            ];
+          });
+          Object.keys(next).forEach((id) => {
+            next[id] = dedupeAndSortTranscriptions(next[id]);
+          });
+          return next;
+        });
+        setViewHistory({
+          hasMore: data.hasMoreBefore ?? false,
+          nextCursor: data.nextCursor ?? null,
+        });
+        return;
+      }
       const results = await Promise.all(
         streams.map(async (s) => {
-          const params = new URLSearchParams({ limit: String(HISTORY_FETCH_LIMIT), before });
+          const params = new URLSearchParams({
+            limit: String(HISTORY_FETCH_LIMIT),
+            before,
+            view: getTranscriptionHistoryView([s.source]),
+          });
           const res = await authFetch(`/api/streams/${s.id}/transcriptions?${params.toString()}`);
           if (!res.ok) {
             const text = await res.text();
@@ -254,7 +303,7 @@ export const CombinedTranscriptionLog: React.FC<CombinedTranscriptionLogProps> =
     } finally {
       setIsLoadingHistory(false);
     }
-  }, [authFetch, earliestTimestampIso, streams, isLoadingHistory]);
+  }, [authFetch, earliestTimestampIso, streams, isLoadingHistory, viewId, viewHistory, historyView]);
 
   const orderedForScroll: TranscriptionResult[] = useMemo(() => {
     return combinedItems.map((item) => (item.kind === "audio" ? item.transcription : item.message.fragments[0]));
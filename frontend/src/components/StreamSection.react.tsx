@@ -19,6 +19,7 @@ import { useUISettings } from "../contexts/UISettingsContext";
 import { useStreamTranscriptions } from "../hooks/useStreamTranscriptions";
 import { useStreamSearch } from "../hooks/useStreamSearch";
 import { useStreamFocusWindow } from "../hooks/useStreamFocusWindow";
+import { getTranscriptionHistoryView } from "../utils/transcriptionView";
 import { useLiveAudioSession } from "../contexts/LiveAudioContext";
 import { useStandaloneControls, type StandaloneTool } from "../hooks/useStandaloneControls";
 import { StreamTranscriptList } from "./StreamTranscriptList.react";
@@ -169,7 +170,12 @@ const StreamSection: React.FC<StreamSectionProps> = ({
   const [openPagerMessageIds, setOpenPagerMessageIds] = useState<Record<string, boolean>>({});
   const [openStandaloneTool, setOpenStandaloneTool] = useState<StandaloneTool | null>(null);
 
-  const history = useStreamTranscriptions(stream.id, authFetch, HISTORY_FETCH_LIMIT);
+  const history = useStreamTranscriptions(
+    stream.id,
+    authFetch,
+    HISTORY_FETCH_LIMIT,
+    getTranscriptionHistoryView([stream.source]),
+  );
   const search = useStreamSearch(stream.id, authFetch, MAX_SEARCH_RESULTS);
   const focus = useStreamFocusWindow(stream.id, authFetch, HISTORY_FETCH_LIMIT);
 
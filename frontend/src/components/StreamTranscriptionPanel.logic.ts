@@ -198,6 +198,7 @@ const shouldIsolateTranscription = (
     case "transcription_stopped":
     case "upstream_disconnected":
     case "upstream_reconnected":
+    case "transcription_overload":
       return true;
     default:
       return false;
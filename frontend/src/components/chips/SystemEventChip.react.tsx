@@ -1,6 +1,7 @@
 import React from "react";
 import {
   Activity,
+  Gauge,
   MicOff,
   Pause,
   Play,
@@ -31,6 +32,8 @@ const iconForEvent = (eventType?: TranscriptionEventType) => {
       return WifiOff;
     case "upstream_reconnected":
       return Wifi;
+    case "transcription_overload":
+      return Gauge;
     default:
       return Activity;
   }
@@ -1,10 +1,13 @@
 import { useCallback, useState } from "react";
 import type { TranscriptionQueryResponse, TranscriptionResult } from "@types";
 import { dedupeAndSortTranscriptions } from "../components/StreamTranscriptionPanel.logic";
+import type { TranscriptionHistoryView } from "../utils/transcriptionView";
 
 export interface StreamHistoryState {
   transcriptions: TranscriptionResult[];
   hasMoreBefore: boolean;
+  /** Cursor for the next older page, once one page has been loaded. */
+  nextCursor: string | null;
   loading: boolean;
   error: string | null;
 }
@@ -19,10 +22,12 @@ export const useStreamTranscriptions = (
   streamId: string,
   authFetch: (input: RequestInfo | URL, init?: RequestInit) => Promise<Response>,
   historyFetchLimit: number,
+  view: TranscriptionHistoryView = "summary",
 ): UseStreamTranscriptionsResult => {
   const [state, setState] = useState<StreamHistoryState>({
     transcriptions: [],
     hasMoreBefore: true,
+    nextCursor: null,
     loading: false,
     error: null,
   });
@@ -46,8 +51,10 @@ export const useStreamTranscriptions = (
     async (before?: string | null) => {
       setState((prev) => ({ ...prev, loading: true, error: null }));
       try {
-        const query: Record<string, string> = { limit: String(historyFetchLimit) };
-        if (before) query.before = before;
+        const query: Record<string, string> = { limit: String(historyFetchLimit), view };
+        // Prefer the keyset cursor so rows sharing a timestamp are not skipped.
+        if (state.nextCursor) query.cursor = state.nextCursor;
+        else if (before) query.before = before;
         const data = await fetchTranscriptions(query);
         setState((prev) => {
           const combined = dedupeAndSortTranscriptions([
@@ -58,6 +65,7 @@ export const useStreamTranscriptions = (
           return {
             transcriptions: combined,
             hasMoreBefore: hasMore,
+            nextCursor: data.nextCursor ?? null,
             loading: false,
             error: null,
           };
@@ -70,11 +78,17 @@ export const useStreamTranscriptions = (
         }));
       }
     },
-    [fetchTranscriptions, historyFetchLimit],
+    [fetchTranscriptions, historyFetchLimit, state.nextCursor, view],
   );
 
   const clear = useCallback(() => {
-    setState({ transcriptions: [], hasMoreBefore: true, loading: false, error: null });
+    setState({
+      transcriptions: [],
+      hasMoreBefore: true,
+      nextCursor: null,
+      loading: false,
+      error: null,
+    });
   }, []);
 
   return { state, loadEarlier, clear };
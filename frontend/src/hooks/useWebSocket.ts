@@ -4,6 +4,11 @@ import {
   ClientToServerMessage,
   ServerToClientMessage,
 } from "@types";
+import {
+  buildStreamSubscription,
+  isSameStreamSubscription,
+  type StreamSubscriptionMessage,
+} from "../utils/streamSubscription";
 
 export interface WebSocketCommandResult {
   success: boolean;
@@ -65,6 +70,20 @@ export const useWebSocket = (
   const lastMessageTimeRef = useRef<number>(Date.now());
   const staleCheckIntervalRef = useRef<number>();
   const lastErrorLogRef = useRef<number>(0);
+  // Revision of the last stream snapshot or patch applied. The server merges
+  // patches for slow connections, so revisions may skip but never go back.
+  const streamsRevisionRef = useRef<number | null>(null);
+  // Set while a resync_streams request is waiting for its snapshot.
+  const resyncPendingRef = useRef(false);
+  // Streams this client wants events for, or null for all of them. Topics
+  // belong to a connection, so they are sent again on every reconnect.
+  const subscriptionRef = useRef<StreamSubscriptionMessage>(
+    buildStreamSubscription(null),
+  );
+  // Last event sequence number and server epoch seen, sent on reconnect so
+  // the server can replay just the missed events.
+  const lastSeqRef = useRef<number | null>(null);
+  const epochRef = useRef<string | null>(null);
   // Each WebSocket we create gets a monotonically increasing identifier. When
   // we reconnect (e.g. after the user logs in) the previous socket may close a
   // moment later. We ignore events from those stale sockets so they cannot wipe
@@ -134,7 +153,12 @@ export const useWebSocket = (
     try {
       const connectionId = connectionIdRef.current + 1;
       connectionIdRef.current = connectionId;
-      const ws = new WebSocket(resolveBaseUrl());
+      let socketUrl = resolveBaseUrl();
+      if (lastSeqRef.current !== null && epochRef.current !== null) {
+        const separator = socketUrl.includes("?") ? "&" : "?";
+        socketUrl += `${separator}since=${lastSeqRef.current}&epoch=${encodeURIComponent(epochRef.current)}`;
+      }
+      const ws = new WebSocket(socketUrl);
       const logErrorThrottled = (label: string, details: Record<string, unknown>) => {
         const now = Date.now();
         if (now - lastErrorLogRef.current < ERROR_LOG_THROTTLE_MS) {
@@ -153,6 +177,10 @@ export const useWebSocket = (
         setError(null);
         reconnectAttempts.current = 0;
         idleDisconnectRef.current = false;
+        resyncPendingRef.current = false;
+        if (subscriptionRef.current.streamIds) {
+          ws.send(JSON.stringify(subscriptionRef.current));
+        }
         // Reset reload flag - we no longer do page reloads on reconnect
         // The App component will refetch streams when wsConnected changes
         shouldReloadOnReconnectRef.current = false;
@@ -179,6 +207,42 @@ export const useWebSocket = (
             return;
           }
 
+          if ("seq" in message && typeof message.seq === "number") {
+            lastSeqRef.current = message.seq;
+          }
+
+          if (message.type === "session") {
+            if (message.epoch !== epochRef.current) {
+              epochRef.current = message.epoch;
+              lastSeqRef.current = null;
+            }
+          } else if (message.type === "streams_update") {
+            resyncPendingRef.current = false;
+            if (typeof message.revision === "number") {
+              streamsRevisionRef.current = message.revision;
+            }
+          } else if (message.type === "streams_patch") {
+            const current = streamsRevisionRef.current;
+            if (current === null) {
+              // A resumed connection can deliver patches for a snapshot we
+              // never received; there is nothing to apply them to, so ask
+              // for a fresh one.
+              if (!resyncPendingRef.current) {
+                resyncPendingRef.current = true;
+                try {
+                  ws.send(JSON.stringify({ type: "resync_streams" }));
+                } catch {
+                  resyncPendingRef.current = false;
+                }
+              }
+              return;
+            }
+            if (message.revision <= current) {
+              // Already covered by the snapshot we have.
+              return;
+            }
+            streamsRevisionRef.current = message.revision;
+          }
 
           if (message.type === "ack") {
             const pending = pendingRequestsRef.current.get(message.requestId);
@@ -601,6 +665,19 @@ export const useWebSocket = (
     [sendCommand],
   );
 
+  const subscribe = useCallback((streamIds: readonly string[] | null) => {
+    const subscription = buildStreamSubscription(streamIds);
+    if (isSameStreamSubscription(subscriptionRef.current, subscription)) {
+      return;
+    }
+    subscriptionRef.current = subscription;
+    const ws = socketRef.current;
+    if (ws && ws.readyState === WebSocket.OPEN) {
+      // No requestId: the server replies with a snapshot, not an ack.
+      ws.send(JSON.stringify(subscription));
+    }
+  }, []);
+
   const updateStream = useCallback(
     (
       streamId: string,
@@ -638,6 +715,7 @@ export const useWebSocket = (
     stopTranscription,
     resetStream,
     updateStream,
+    subscribe,
     reconnect,
   };
 };
@@ -38,7 +38,8 @@ export type TranscriptionEventType =
   | "transcription_started"
   | "transcription_stopped"
   | "upstream_disconnected"
-  | "upstream_reconnected";
+  | "upstream_reconnected"
+  | "transcription_overload";
 
 export interface PagerIncidentDetails {
   incidentId?: string | null;
@@ -106,6 +107,10 @@ export interface TranscriptionQueryResponse {
   transcriptions: TranscriptionResult[];
   hasMoreBefore?: boolean;
   hasMoreAfter?: boolean;
+  /** Opaque cursor continuing in the requested order. */
+  nextCursor?: string | null;
+  /** Opaque cursor paging back the other way. */
+  prevCursor?: string | null;
 }
 
 export interface Stream {
@@ -145,6 +150,12 @@ export type ClientToServerMessage =
   | ({ type: "start_transcription"; streamId: string } & ClientMessageBase)
   | ({ type: "stop_transcription"; streamId: string } & ClientMessageBase)
   | ({ type: "reset_stream"; streamId: string } & ClientMessageBase)
+  | ({ type: "resync_streams" } & ClientMessageBase)
+  | ({
+        type: "subscribe";
+        streamIds?: string[] | null;
+        eventTypes?: string[] | null;
+      } & ClientMessageBase)
   | ({
         type: "update_stream";
         streamId: string;
@@ -154,8 +165,15 @@ export type ClientToServerMessage =
       } & ClientMessageBase);
 
 export type ServerToClientMessage =
-  | { type: "transcription"; data: TranscriptionResult }
-  | { type: "streams_update"; data: StreamUpdate[] }
+  | { type: "transcription"; data: TranscriptionResult; seq?: number }
+  | { type: "session"; epoch: string; resumed: boolean }
+  | { type: "streams_update"; data: StreamUpdate[]; revision?: number }
+  | {
+      type: "streams_patch";
+      data: StreamUpdate[];
+      revision: number;
+      seq?: number;
+    }
   | { type: "ping"; timestamp: number }
   | { type: "error"; message: string; requestId?: string }
   | {
@@ -183,6 +201,15 @@ export interface ServerConfig {
   corsOrigin: string;
 }
 
+export interface SpeechGateConfig {
+  lowEnergy?: boolean;
+  minActiveRatio?: number | null;
+  minDurationSeconds?: number;
+  skipEncryptedCalls?: boolean;
+  minCallSeconds?: number;
+  excludedTalkgroups?: string[];
+}
+
 export interface WhisperConfig {
   model?: string;
   cpuFallbackModel?: string;
@@ -200,6 +227,7 @@ export interface WhisperConfig {
   blankAudioMinDurationSeconds?: number;
   blankAudioMinActiveRatio?: number;
   blankAudioMinRms?: number;
+  speechGate?: SpeechGateConfig;
   maxConcurrentProcesses?: number;
   [key: string]: unknown;
 }
@@ -271,6 +299,13 @@ export interface RemoteUpstreamState {
   snr?: number | null;
   rssi?: number | null;
   label?: string | null;
+  standby?: boolean;
+  failovers?: number;
+  lastFailoverMs?: number | null;
+  standbySeconds?: number;
+  pendingCalls?: number;
+  queueLagMs?: number | null;
+  maxQueueLagMs?: number | null;
 }
 
 export interface BaseLocation {
@@ -0,0 +1,59 @@
+import assert from "node:assert/strict";
+import test from "node:test";
+import {
+  buildStreamSubscription,
+  isSameStreamSubscription,
+} from "./streamSubscription";
+
+test("buildStreamSubscription narrows to a combined view's member streams", () => {
+  assert.deepStrictEqual(buildStreamSubscription(["b", "a", "b"]), {
+    type: "subscribe",
+    streamIds: ["a", "b"],
+  });
+});
+
+test("buildStreamSubscription subscribes to every stream without a view", () => {
+  assert.deepStrictEqual(buildStreamSubscription(null), {
+    type: "subscribe",
+    streamIds: null,
+  });
+  assert.deepStrictEqual(buildStreamSubscription(undefined), {
+    type: "subscribe",
+    streamIds: null,
+  });
+});
+
+test("buildStreamSubscription never narrows event types", () => {
+  // Stream state and alert transcriptions must keep flowing for the sidebar
+  // and keyword alerts, so the dashboard leaves eventTypes unset.
+  assert.equal("eventTypes" in buildStreamSubscription(["a"]), false);
+});
+
+test("isSameStreamSubscription ignores member order", () => {
+  assert.ok(
+    isSameStreamSubscription(
+      buildStreamSubscription(["a", "b"]),
+      buildStreamSubscription(["b", "a"]),
+    ),
+  );
+  assert.ok(
+    isSameStreamSubscription(
+      buildStreamSubscription(null),
+      buildStreamSubscription(undefined),
+    ),
+  );
+  assert.equal(
+    isSameStreamSubscription(
+      buildStreamSubscription(null),
+      buildStreamSubscription([]),
+    ),
+    false,
+  );
+  assert.equal(
+    isSameStreamSubscription(
+      buildStreamSubscription(["a"]),
+      buildStreamSubscription(["a", "c"]),
+    ),
+    false,
+  );
+});
@@ -0,0 +1,34 @@
+import type { ClientToServerMessage } from "@types";
+
+export type StreamSubscriptionMessage = Extract<
+  ClientToServerMessage,
+  { type: "subscribe" }
+>;
+
+/**
+ * Build the subscribe command the dashboard sends for a set of streams.
+ *
+ * `null` (or no streams chosen) subscribes to every stream. The server only
+ * narrows per-stream events by these IDs: stream state and transcriptions
+ * that raised a keyword alert still arrive for every stream.
+ */
+export const buildStreamSubscription = (
+  streamIds: readonly string[] | null | undefined,
+): StreamSubscriptionMessage => ({
+  type: "subscribe",
+  streamIds: streamIds ? Array.from(new Set(streamIds)).sort() : null,
+});
+
+export const isSameStreamSubscription = (
+  a: StreamSubscriptionMessage,
+  b: StreamSubscriptionMessage,
+): boolean => {
+  if (a.streamIds === null || a.streamIds === undefined) {
+    return b.streamIds === null || b.streamIds === undefined;
+  }
+  if (!b.streamIds || a.streamIds.length !== b.streamIds.length) {
+    return false;
+  }
+  const other = b.streamIds;
+  return a.streamIds.every((id, index) => id === other[index]);
+};
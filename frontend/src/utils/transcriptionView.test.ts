@@ -0,0 +1,13 @@
+import assert from "node:assert/strict";
+import test from "node:test";
+import { getTranscriptionHistoryView } from "./transcriptionView";
+
+test("getTranscriptionHistoryView uses the summary view for audio history", () => {
+  assert.equal(getTranscriptionHistoryView(["audio"]), "summary");
+  assert.equal(getTranscriptionHistoryView(["audio", "remote", undefined]), "summary");
+});
+
+test("getTranscriptionHistoryView keeps full rows when a pager stream is included", () => {
+  assert.equal(getTranscriptionHistoryView(["pager"]), "full");
+  assert.equal(getTranscriptionHistoryView(["audio", "pager"]), "full");
+});
@@ -0,0 +1,15 @@
+import type { StreamSource } from "@types";
+
+export type TranscriptionHistoryView = "summary" | "full";
+
+/**
+ * Pick the `view` to request when paging transcript history.
+ *
+ * The summary view keeps everything the dashboard renders except Whisper
+ * segments and pager incidents. Pager threads group messages by incident, so
+ * any history that includes a pager stream asks for full rows.
+ */
+export const getTranscriptionHistoryView = (
+  sources: ReadonlyArray<StreamSource | undefined>,
+): TranscriptionHistoryView =>
+  sources.some((source) => source === "pager") ? "full" : "summary";